@@ -0,0 +1,43 @@
+"""Create metrics_snapshot table
+
+Revision ID: a131c791c17e
+Revises: fda77b9f39d3
+Create Date: 2025-03-03 10:12:31.480129
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a131c791c17e"
+down_revision: Union[str, None] = "fda77b9f39d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Single-row table holding the most recently computed metrics
+    op.create_table(
+        "metrics_snapshot",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("source_count", sa.Integer(), nullable=False),
+        sa.Column("agency_count", sa.Integer(), nullable=False),
+        sa.Column("state_count", sa.Integer(), nullable=False),
+        sa.Column("county_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "computed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.CheckConstraint("id = 1", name="metrics_snapshot_single_row"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("metrics_snapshot")
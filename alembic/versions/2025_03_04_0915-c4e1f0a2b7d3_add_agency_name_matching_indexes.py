@@ -0,0 +1,41 @@
+"""Add agency name matching indexes
+
+Revision ID: c4e1f0a2b7d3
+Revises: a131c791c17e
+Create Date: 2025-03-04 09:15:12.304118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e1f0a2b7d3"
+down_revision: Union[str, None] = "a131c791c17e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Supports nearest-neighbor ordering (<->) and similarity filtering (%) on agency names
+    op.execute(
+        """
+        CREATE INDEX agencies_name_trgm_idx
+        ON agencies USING gist (name gist_trgm_ops)
+        """
+    )
+    # Supports exact, case-insensitive agency name lookups
+    op.execute(
+        """
+        CREATE INDEX agencies_normalized_name_idx
+        ON agencies (lower(name))
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS agencies_normalized_name_idx")
+    op.execute("DROP INDEX IF EXISTS agencies_name_trgm_idx")
@@ -0,0 +1,117 @@
+"""Add archive queue columns
+
+Revision ID: 722236bc2b1b
+Revises: c4e1f0a2b7d3
+Create Date: 2025-03-05 10:30:41.518203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "722236bc2b1b"
+down_revision: Union[str, None] = "c4e1f0a2b7d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "data_sources_archive_info",
+        sa.Column("next_due_at", sa.TIMESTAMP(), nullable=True),
+    )
+    op.add_column(
+        "data_sources_archive_info",
+        sa.Column("lease_expires_at", sa.TIMESTAMP(), nullable=True),
+    )
+
+    # Maps free-text update frequencies to intervals.
+    # Unrecognized frequencies fall back to monthly.
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION public.archive_update_interval(update_frequency text)
+    RETURNS interval
+    LANGUAGE sql
+    IMMUTABLE
+    AS $BODY$
+        SELECT CASE
+            WHEN update_frequency IS NULL THEN NULL
+            WHEN lower(update_frequency) LIKE '%daily%' THEN interval '1 day'
+            WHEN lower(update_frequency) LIKE 'bi%weekly%' THEN interval '14 days'
+            WHEN lower(update_frequency) LIKE '%weekly%' THEN interval '7 days'
+            WHEN lower(update_frequency) LIKE 'bi%monthly%' THEN interval '2 months'
+            WHEN lower(update_frequency) LIKE '%monthly%' THEN interval '1 month'
+            WHEN lower(update_frequency) LIKE '%quarterly%' THEN interval '3 months'
+            WHEN lower(update_frequency) LIKE '%semi%annual%'
+                OR lower(update_frequency) LIKE 'bi%annual%' THEN interval '6 months'
+            WHEN lower(update_frequency) LIKE '%annual%'
+                OR lower(update_frequency) LIKE '%yearly%' THEN interval '1 year'
+            ELSE interval '1 month'
+        END
+    $BODY$;
+    """
+    )
+
+    # Sources never archived are due immediately, ahead of everything else;
+    # sources archived once without an update frequency are never due again.
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION public.set_archive_next_due_at()
+    RETURNS trigger
+    LANGUAGE 'plpgsql'
+    AS $BODY$
+    BEGIN
+        IF NEW.last_cached IS NULL THEN
+            NEW.next_due_at := '-infinity'::timestamp;
+        ELSE
+            NEW.next_due_at := NEW.last_cached + archive_update_interval(NEW.update_frequency);
+        END IF;
+        IF TG_OP = 'UPDATE' AND NEW.last_cached IS DISTINCT FROM OLD.last_cached THEN
+            NEW.lease_expires_at := NULL;
+        END IF;
+        RETURN NEW;
+    END
+    $BODY$;
+    """
+    )
+    op.execute(
+        """
+    CREATE OR REPLACE TRIGGER set_archive_next_due_at
+    BEFORE INSERT OR UPDATE OF last_cached, update_frequency
+    ON public.data_sources_archive_info
+    FOR EACH ROW
+    EXECUTE FUNCTION public.set_archive_next_due_at();
+    """
+    )
+
+    op.execute(
+        """
+    UPDATE data_sources_archive_info
+    SET next_due_at = CASE
+        WHEN last_cached IS NULL THEN '-infinity'::timestamp
+        ELSE last_cached + archive_update_interval(update_frequency)
+    END
+    """
+    )
+    op.execute(
+        """
+    CREATE INDEX data_sources_archive_info_next_due_at_idx
+    ON data_sources_archive_info (next_due_at)
+    WHERE next_due_at IS NOT NULL
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS data_sources_archive_info_next_due_at_idx")
+    op.execute(
+        "DROP TRIGGER IF EXISTS set_archive_next_due_at ON data_sources_archive_info"
+    )
+    op.execute("DROP FUNCTION IF EXISTS set_archive_next_due_at()")
+    op.execute("DROP FUNCTION IF EXISTS archive_update_interval(text)")
+    op.drop_column("data_sources_archive_info", "lease_expires_at")
+    op.drop_column("data_sources_archive_info", "next_due_at")
@@ -0,0 +1,45 @@
+"""Add normalized source url column
+
+Revision ID: 5a64aeaaa0a1
+Revises: 722236bc2b1b
+Create Date: 2025-03-06 14:15:08.730519
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5a64aeaaa0a1"
+down_revision: Union[str, None] = "722236bc2b1b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Mirrors `normalize_url` in the unique url checker:
+    # strips the scheme, a leading "www.", and trailing slashes
+    op.execute(
+        r"""
+        ALTER TABLE data_sources
+        ADD COLUMN source_url_normalized text
+        GENERATED ALWAYS AS (
+            rtrim(regexp_replace(source_url, '^(https?://)?(www\.)?', ''), '/')
+        ) STORED
+        """
+    )
+    # Not unique, as existing data sources (such as rejected submissions) may share a url
+    op.execute(
+        """
+        CREATE INDEX data_sources_source_url_normalized_idx
+        ON data_sources (source_url_normalized)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS data_sources_source_url_normalized_idx")
+    op.drop_column("data_sources", "source_url_normalized")
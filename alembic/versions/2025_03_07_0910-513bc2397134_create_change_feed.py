@@ -0,0 +1,132 @@
+"""Create change_feed table and associated logic
+
+Revision ID: 513bc2397134
+Revises: 5a64aeaaa0a1
+Create Date: 2025-03-07 09:10:27.419805
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = "513bc2397134"
+down_revision: Union[str, None] = "5a64aeaaa0a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ChangeFeedOperationTypeEnum = sa.Enum(
+    "INSERT", "UPDATE", "DELETE", name="change_feed_operation_type"
+)
+
+CHANGE_FEED_TABLES = [
+    "agencies",
+    "counties",
+    "data_requests",
+    "data_sources",
+    "link_agencies_data_sources",
+    "link_agencies_locations",
+    "link_data_sources_data_requests",
+    "link_locations_data_requests",
+    "localities",
+    "locations",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "change_feed",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        # The id of the writing transaction. Changes are only read once every
+        # transaction with a lower id has finished, so that cursors never skip
+        # changes committed out of order.
+        sa.Column(
+            "transaction_id",
+            sa.BigInteger(),
+            server_default=sa.text("(pg_current_xact_id()::text::bigint)"),
+            nullable=False,
+        ),
+        sa.Column("table_name", sa.String(), nullable=False),
+        sa.Column("operation_type", ChangeFeedOperationTypeEnum, nullable=False),
+        # Null for tables without an `id` column
+        sa.Column("affected_id", sa.Integer(), nullable=True),
+        sa.Column("row_data", JSONB, nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("change_feed_cursor_idx", "change_feed", ["transaction_id", "id"])
+    op.create_index(
+        "change_feed_table_cursor_idx",
+        "change_feed",
+        ["table_name", "transaction_id", "id"],
+    )
+
+    # Records the full row after inserts and updates, and the full row before deletes
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION record_change_feed()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            row_data JSONB;
+        BEGIN
+            IF (TG_OP = 'DELETE') THEN
+                row_data = to_jsonb(OLD);
+            ELSE
+                row_data = to_jsonb(NEW);
+                -- Skip updates which do not change the row
+                IF (TG_OP = 'UPDATE' AND row_data = to_jsonb(OLD)) THEN
+                    RETURN NULL;
+                END IF;
+            END IF;
+
+            INSERT INTO change_feed (table_name, operation_type, affected_id, row_data)
+            VALUES (
+                TG_TABLE_NAME,
+                TG_OP::change_feed_operation_type,
+                (row_data ->> 'id')::integer,
+                row_data
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+    )
+
+    for table_name in CHANGE_FEED_TABLES:
+        op.execute(
+            f"""
+        CREATE TRIGGER record_{table_name}_change_feed
+        AFTER INSERT OR UPDATE OR DELETE ON {table_name}
+        FOR EACH ROW EXECUTE FUNCTION record_change_feed();
+        """
+        )
+
+    op.execute(
+        """
+    INSERT INTO permissions
+    (permission_name, description) VALUES
+    ('change_feed_read', 'Enables reading the change feed');
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+    DELETE FROM permissions WHERE permission_name = 'change_feed_read';
+    """
+    )
+    for table_name in CHANGE_FEED_TABLES:
+        op.execute(
+            f"DROP TRIGGER IF EXISTS record_{table_name}_change_feed ON {table_name}"
+        )
+    op.execute("DROP FUNCTION IF EXISTS record_change_feed()")
+    op.drop_index("change_feed_table_cursor_idx", table_name="change_feed")
+    op.drop_index("change_feed_cursor_idx", table_name="change_feed")
+    op.drop_table("change_feed")
+    ChangeFeedOperationTypeEnum.drop(op.get_bind())
@@ -0,0 +1,166 @@
+"""Log table changes per statement
+
+Revision ID: 40a63128a177
+Revises: 513bc2397134
+Create Date: 2025-03-08 11:20:44.902176
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "40a63128a177"
+down_revision: Union[str, None] = "513bc2397134"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHANGE_LOG_TABLES = [
+    "agencies",
+    "counties",
+    "data_sources",
+    "link_agencies_locations",
+    "localities",
+    "locations",
+]
+
+
+def upgrade() -> None:
+    for table_name in CHANGE_LOG_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS log_{table_name}_changes ON {table_name}")
+    op.execute("DROP FUNCTION IF EXISTS log_table_changes()")
+    op.execute("DROP FUNCTION IF EXISTS jsonb_diff_val(JSONB, JSONB)")
+
+    # Logs the changed columns of every updated row in a single set-based insert.
+    # Rows whose columns are all unchanged produce no diff, and are not logged.
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION log_table_updates()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO change_log (operation_type, table_name, affected_id, old_data, new_data)
+            SELECT 'UPDATE', TG_TABLE_NAME, old_row.id, diff.old_data, diff.new_data
+            FROM old_rows old_row
+            INNER JOIN new_rows new_row ON new_row.id = old_row.id
+            CROSS JOIN LATERAL (
+                SELECT
+                    jsonb_object_agg(old_value.key, old_value.value) AS old_data,
+                    jsonb_object_agg(new_value.key, new_value.value) AS new_data
+                FROM jsonb_each(to_jsonb(old_row)) old_value
+                INNER JOIN jsonb_each(to_jsonb(new_row)) new_value
+                    ON new_value.key = old_value.key
+                WHERE old_value.value IS DISTINCT FROM new_value.value
+            ) diff
+            WHERE diff.old_data IS NOT NULL;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+    )
+    # Logs the entire row of every deleted row, since all of its data is lost
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION log_table_deletes()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO change_log (operation_type, table_name, affected_id, old_data)
+            SELECT 'DELETE', TG_TABLE_NAME, old_row.id, to_jsonb(old_row)
+            FROM old_rows old_row;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+    )
+
+    for table_name in CHANGE_LOG_TABLES:
+        op.execute(
+            f"""
+        CREATE TRIGGER log_{table_name}_updates
+        AFTER UPDATE ON {table_name}
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION log_table_updates();
+        """
+        )
+        op.execute(
+            f"""
+        CREATE TRIGGER log_{table_name}_deletes
+        AFTER DELETE ON {table_name}
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION log_table_deletes();
+        """
+        )
+
+
+def downgrade() -> None:
+    for table_name in CHANGE_LOG_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS log_{table_name}_updates ON {table_name}")
+        op.execute(f"DROP TRIGGER IF EXISTS log_{table_name}_deletes ON {table_name}")
+    op.execute("DROP FUNCTION IF EXISTS log_table_updates()")
+    op.execute("DROP FUNCTION IF EXISTS log_table_deletes()")
+
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION jsonb_diff_val(val1 JSONB,val2 JSONB)
+        RETURNS JSONB AS $$
+        DECLARE
+          result JSONB;
+          v RECORD;
+        BEGIN
+           result = val1;
+           FOR v IN SELECT * FROM jsonb_each(val2) LOOP
+             IF result @> jsonb_build_object(v.key,v.value)
+                THEN result = result - v.key;
+             ELSIF result ? v.key THEN CONTINUE;
+             ELSE
+                result = result || jsonb_build_object(v.key,'null');
+             END IF;
+           END LOOP;
+           RETURN result;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+    )
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION log_table_changes()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            old_values JSONB;
+            new_values JSONB;
+            old_to_new JSONB;
+            new_to_old JSONB;
+        BEGIN
+            -- Identify the changed columns
+            old_values = row_to_json(OLD)::jsonb;
+
+            -- Handle DELETE operations (store entire OLD row since all data is lost)
+            IF (TG_OP = 'DELETE') THEN
+                INSERT INTO change_log (operation_type, table_name, affected_id, old_data)
+                VALUES ('DELETE', TG_TABLE_NAME, OLD.id, old_values);
+                RETURN OLD;
+
+            -- Handle UPDATE operations (only log the changed columns)
+            ELSIF (TG_OP = 'UPDATE') THEN
+                new_values = row_to_json(NEW)::jsonb;
+                new_to_old = jsonb_diff_val(old_values, new_values);
+                old_to_new = jsonb_diff_val(new_values, old_values);
+
+                INSERT INTO change_log (operation_type, table_name, affected_id, old_data, new_data)
+                VALUES ('UPDATE', TG_TABLE_NAME, OLD.id, new_to_old, old_to_new);
+                RETURN NEW;
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+    )
+    for table_name in CHANGE_LOG_TABLES:
+        op.execute(
+            f"""
+        CREATE TRIGGER log_{table_name}_changes
+        BEFORE UPDATE OR DELETE ON {table_name}
+        FOR EACH ROW EXECUTE FUNCTION log_table_changes();
+        """
+        )
@@ -0,0 +1,201 @@
+"""Partition log tables by month
+
+Revision ID: a7412e05628f
+Revises: 40a63128a177
+Create Date: 2025-03-09 09:15:12.538914
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7412e05628f"
+down_revision: Union[str, None] = "40a63128a177"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table name: whether the `id` column is an identity column (rather than serial)
+PARTITIONED_TABLES = {
+    "change_log": False,
+    "table_count_log": False,
+    "change_feed": True,
+}
+
+PARTITIONED_TABLE_INDEXES = {
+    "change_log": {
+        "change_log_table_name_created_at_idx": "(table_name, created_at DESC)",
+    },
+    "table_count_log": {
+        "table_count_log_table_name_created_at_idx": "(table_name, created_at DESC)",
+    },
+    "change_feed": {
+        "change_feed_cursor_idx": "(transaction_id, id)",
+        "change_feed_table_cursor_idx": "(table_name, transaction_id, id)",
+    },
+}
+
+UNPARTITIONED_TABLE_INDEXES = {
+    "change_log": {},
+    "table_count_log": {},
+    "change_feed": {
+        "change_feed_cursor_idx": "(transaction_id, id)",
+        "change_feed_table_cursor_idx": "(table_name, transaction_id, id)",
+    },
+}
+
+# Partitions are created this many months ahead of the current month,
+# after which the `maintain_log_partitions` scheduled task creates them
+PARTITION_MONTHS_AHEAD = 2
+
+
+def upgrade() -> None:
+    # Creates the partition of the given table for the month containing the given date,
+    # named `<table>_p<YYYY>_<MM>`
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION create_monthly_partition(parent_table TEXT, partition_month DATE)
+        RETURNS TEXT AS $$
+        DECLARE
+            month_start DATE := date_trunc('month', partition_month)::date;
+            partition_name TEXT := parent_table || '_p' || to_char(month_start, 'YYYY_MM');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                parent_table,
+                month_start,
+                (month_start + interval '1 month')::date
+            );
+            RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+    )
+    # Drops the monthly partitions of the given table which precede the retention period,
+    # returning the names of the dropped partitions
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION drop_expired_partitions(parent_table TEXT, retention_months INTEGER)
+        RETURNS SETOF TEXT AS $$
+        DECLARE
+            cutoff DATE := (date_trunc('month', now()) - make_interval(months => retention_months))::date;
+            expired_partition RECORD;
+        BEGIN
+            FOR expired_partition IN
+                SELECT child.relname
+                FROM pg_inherits
+                INNER JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                INNER JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = parent_table
+                AND child.relname ~ ('^' || parent_table || '_p[0-9]{4}_[0-9]{2}$')
+                AND to_date(right(child.relname, 7), 'YYYY_MM') < cutoff
+                ORDER BY child.relname
+            LOOP
+                EXECUTE format('DROP TABLE %I', expired_partition.relname);
+                RETURN NEXT expired_partition.relname;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+    )
+
+    for table_name, has_identity in PARTITIONED_TABLES.items():
+        partition_table(
+            table_name=table_name,
+            has_identity=has_identity,
+            indexes=PARTITIONED_TABLE_INDEXES[table_name],
+        )
+
+
+def partition_table(table_name: str, has_identity: bool, indexes: dict[str, str]):
+    """
+    Replaces the table with a copy partitioned by month of `created_at`,
+    with partitions for every month from its earliest row onwards,
+    and a default partition for rows outside of those months.
+    """
+    old_table_name = f"{table_name}_unpartitioned"
+    op.execute(f"ALTER TABLE {table_name} RENAME TO {old_table_name}")
+    op.execute(f"ALTER INDEX {table_name}_pkey RENAME TO {old_table_name}_pkey")
+    for index_name in UNPARTITIONED_TABLE_INDEXES[table_name]:
+        op.execute(f"DROP INDEX {index_name}")
+
+    # The partition key must be part of the primary key
+    op.execute(
+        f"""
+    CREATE TABLE {table_name} (
+        LIKE {old_table_name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING IDENTITY,
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at)
+    """
+    )
+    op.execute(
+        f"""
+    SELECT create_monthly_partition('{table_name}', partition_month::date)
+    FROM generate_series(
+        date_trunc('month', COALESCE((SELECT MIN(created_at) FROM {old_table_name}), now())),
+        date_trunc('month', now()) + interval '{PARTITION_MONTHS_AHEAD} months',
+        interval '1 month'
+    ) partition_month
+    """
+    )
+    op.execute(f"CREATE TABLE {table_name}_default PARTITION OF {table_name} DEFAULT")
+
+    op.execute(f"INSERT INTO {table_name} SELECT * FROM {old_table_name}")
+    set_id_sequence(table_name=table_name, has_identity=has_identity)
+    op.execute(f"DROP TABLE {old_table_name}")
+
+    for index_name, index_columns in indexes.items():
+        op.execute(f"CREATE INDEX {index_name} ON {table_name} {index_columns}")
+
+
+def set_id_sequence(table_name: str, has_identity: bool):
+    """
+    Continues the ids of a table copied from another table.
+    """
+    if has_identity:
+        # Copying the identity created a new sequence, which must follow the copied ids
+        op.execute(
+            f"""
+        SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), MAX(id))
+        FROM {table_name}
+        """
+        )
+    else:
+        # The copied default uses the existing sequence, which must outlive the original table
+        op.execute(f"ALTER SEQUENCE {table_name}_id_seq OWNED BY {table_name}.id")
+
+
+def downgrade() -> None:
+    for table_name, has_identity in PARTITIONED_TABLES.items():
+        unpartition_table(table_name=table_name, has_identity=has_identity)
+
+    op.execute("DROP FUNCTION IF EXISTS drop_expired_partitions(TEXT, INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS create_monthly_partition(TEXT, DATE)")
+
+
+def unpartition_table(table_name: str, has_identity: bool):
+    old_table_name = f"{table_name}_partitioned"
+    op.execute(f"ALTER TABLE {table_name} RENAME TO {old_table_name}")
+    op.execute(f"ALTER INDEX {table_name}_pkey RENAME TO {old_table_name}_pkey")
+    for index_name in PARTITIONED_TABLE_INDEXES[table_name]:
+        op.execute(f"DROP INDEX {index_name}")
+
+    op.execute(
+        f"""
+    CREATE TABLE {table_name} (
+        LIKE {old_table_name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING IDENTITY,
+        PRIMARY KEY (id)
+    )
+    """
+    )
+    op.execute(f"INSERT INTO {table_name} SELECT * FROM {old_table_name}")
+    set_id_sequence(table_name=table_name, has_identity=has_identity)
+    # Drops all partitions
+    op.execute(f"DROP TABLE {old_table_name}")
+
+    for index_name, index_columns in UNPARTITIONED_TABLE_INDEXES[table_name].items():
+        op.execute(f"CREATE INDEX {index_name} ON {table_name} {index_columns}")
@@ -0,0 +1,209 @@
+"""Keep only distinct recent searches, capped per user
+
+Revision ID: 55cb30cca70b
+Revises: a7412e05628f
+Create Date: 2025-03-10 10:05:48.221637
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "55cb30cca70b"
+down_revision: Union[str, None] = "a7412e05628f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RECENT_SEARCHES_PER_USER = 50
+
+
+def upgrade() -> None:
+    op.add_column(
+        "recent_searches",
+        sa.Column(
+            "last_searched_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    # Identifies the location and record categories and types searched.
+    # Must match `DatabaseClient.get_recent_search_key`
+    op.add_column("recent_searches", sa.Column("search_key", sa.Text(), nullable=True))
+    op.execute("UPDATE recent_searches SET last_searched_at = created_at")
+    op.execute(
+        """
+    UPDATE recent_searches rs
+    SET search_key = rs.location_id || ':' || COALESCE((
+        SELECT string_agg(DISTINCT rc.name COLLATE "C", ',' ORDER BY rc.name COLLATE "C")
+        FROM link_recent_search_record_categories link
+        INNER JOIN record_categories rc ON rc.id = link.record_category_id
+        WHERE link.recent_search_id = rs.id
+    ), '') || ':' || COALESCE((
+        SELECT string_agg(DISTINCT rt.name COLLATE "C", ',' ORDER BY rt.name COLLATE "C")
+        FROM link_recent_search_record_types link
+        INNER JOIN record_types rt ON rt.id = link.record_type_id
+        WHERE link.recent_search_id = rs.id
+    ), '')
+    """
+    )
+    # Keep only the latest of each user's identical searches
+    op.execute(
+        """
+    DELETE FROM recent_searches rs
+    USING (
+        SELECT
+            id,
+            row_number() OVER (
+                PARTITION BY user_id, search_key
+                ORDER BY last_searched_at DESC, id DESC
+            ) AS search_rank
+        FROM recent_searches
+    ) ranked
+    WHERE rs.id = ranked.id AND ranked.search_rank > 1
+    """
+    )
+    op.create_index(
+        "recent_searches_user_id_search_key_idx",
+        "recent_searches",
+        ["user_id", "search_key"],
+        unique=True,
+    )
+    op.execute(
+        """
+    CREATE INDEX recent_searches_user_id_last_searched_at_idx
+    ON recent_searches (user_id, last_searched_at DESC)
+    """
+    )
+
+    # Trim after inserting, so the user's searches are read once, via the index above.
+    # Repeated searches update the existing row, and so are not trimmed.
+    op.execute(
+        "DROP TRIGGER IF EXISTS check_recent_searches_row_limit ON recent_searches"
+    )
+    op.execute(
+        f"""
+    CREATE OR REPLACE FUNCTION public.maintain_recent_searches_row_limit()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            DELETE FROM recent_searches
+            WHERE id IN (
+                SELECT id FROM recent_searches
+                WHERE user_id = NEW.user_id
+                ORDER BY last_searched_at DESC, id DESC
+                OFFSET {RECENT_SEARCHES_PER_USER}
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+    COMMENT ON FUNCTION public.maintain_recent_searches_row_limit()
+    IS 'Removes the least recent searches for a user_id beyond the most recent {RECENT_SEARCHES_PER_USER}';
+    """
+    )
+    op.execute(
+        """
+    CREATE TRIGGER check_recent_searches_row_limit
+    AFTER INSERT ON public.recent_searches
+    FOR EACH ROW EXECUTE FUNCTION public.maintain_recent_searches_row_limit();
+
+    COMMENT ON TRIGGER check_recent_searches_row_limit ON public.recent_searches
+    IS 'Executes `maintain_recent_searches_row_limit` after every insert';
+    """
+    )
+
+    op.execute(
+        """
+    CREATE OR REPLACE VIEW public.recent_searches_expanded AS
+    SELECT rs.id,
+        rs.user_id,
+        rs.location_id,
+        le.county_name,
+        le.locality_name,
+        le.type AS location_type,
+        array_agg(rc.name) AS record_categories,
+        le.state_name,
+        rs.last_searched_at
+    FROM recent_searches rs
+        JOIN locations_expanded le ON rs.location_id = le.id
+        JOIN link_recent_search_record_categories link ON link.recent_search_id = rs.id
+        JOIN record_categories rc ON link.record_category_id = rc.id
+    GROUP BY le.county_name, le.locality_name, le.type, le.state_name, rs.id;
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW IF EXISTS public.recent_searches_expanded")
+    op.execute(
+        """
+    CREATE VIEW public.recent_searches_expanded AS
+    SELECT rs.id,
+        rs.user_id,
+        rs.location_id,
+        le.county_name,
+        le.locality_name,
+        le.type AS location_type,
+        array_agg(rc.name) AS record_categories,
+        le.state_name
+    FROM recent_searches rs
+        JOIN locations_expanded le ON rs.location_id = le.id
+        JOIN link_recent_search_record_categories link ON link.recent_search_id = rs.id
+        JOIN record_categories rc ON link.record_category_id = rc.id
+    GROUP BY le.county_name, le.locality_name, le.type, le.state_name, rs.id;
+
+    COMMENT ON VIEW public.recent_searches_expanded
+    IS 'Expanded view of recent searches, including location and record category information';
+    """
+    )
+
+    op.execute(
+        "DROP TRIGGER IF EXISTS check_recent_searches_row_limit ON recent_searches"
+    )
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION public.maintain_recent_searches_row_limit()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            -- Check if there are more than 50 rows with the same user_id
+            IF (SELECT COUNT(*) FROM RECENT_SEARCHES WHERE user_id = NEW.user_id) >= 50 THEN
+                -- Delete the oldest row for that b_id
+                DELETE FROM RECENT_SEARCHES
+                WHERE id = (
+                    SELECT id FROM RECENT_SEARCHES
+                    WHERE user_id = NEW.user_id
+                    ORDER BY created_at ASC
+                    LIMIT 1
+                );
+            END IF;
+
+            -- Now the new row can be inserted as normal
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+
+    COMMENT ON FUNCTION public.maintain_recent_searches_row_limit()
+    IS 'Removes least recent search for a user_id if there are 50 or more rows with the same user_id';
+    """
+    )
+    op.execute(
+        """
+    CREATE TRIGGER check_recent_searches_row_limit
+    BEFORE INSERT ON public.recent_searches
+    FOR EACH ROW EXECUTE FUNCTION public.maintain_recent_searches_row_limit();
+
+    COMMENT ON TRIGGER check_recent_searches_row_limit ON public.recent_searches
+    IS 'Executes `maintain_recent_searches_row_limit` prior to every insert';
+    """
+    )
+
+    op.execute("DROP INDEX IF EXISTS recent_searches_user_id_last_searched_at_idx")
+    op.drop_index(
+        "recent_searches_user_id_search_key_idx", table_name="recent_searches"
+    )
+    op.drop_column("recent_searches", "search_key")
+    op.drop_column("recent_searches", "last_searched_at")
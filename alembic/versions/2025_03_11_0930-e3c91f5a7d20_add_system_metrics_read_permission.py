@@ -0,0 +1,36 @@
+"""Add system_metrics_read permission
+
+Revision ID: e3c91f5a7d20
+Revises: 55cb30cca70b
+Create Date: 2025-03-11 09:30:14.602113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3c91f5a7d20"
+down_revision: Union[str, None] = "55cb30cca70b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+    INSERT INTO permissions
+    (permission_name, description) VALUES
+    ('system_metrics_read', 'Enables reading request and system metrics');
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+    DELETE FROM permissions WHERE permission_name = 'system_metrics_read';
+    """
+    )
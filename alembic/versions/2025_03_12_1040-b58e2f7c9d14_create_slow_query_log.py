@@ -0,0 +1,64 @@
+"""Create slow_query_log
+
+Revision ID: b58e2f7c9d14
+Revises: e3c91f5a7d20
+Create Date: 2025-03-12 10:40:37.218406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b58e2f7c9d14"
+down_revision: Union[str, None] = "e3c91f5a7d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions are created this many months ahead of the current month,
+# after which the `maintain_log_partitions` scheduled task creates them
+PARTITION_MONTHS_AHEAD = 2
+
+
+def upgrade() -> None:
+    # Plans of slow queries, partitioned by month like the other log tables,
+    # so that old plans are dropped with their partitions
+    op.execute(
+        """
+    CREATE TABLE slow_query_log (
+        id BIGINT GENERATED ALWAYS AS IDENTITY,
+        fingerprint TEXT NOT NULL,
+        duration_ms DOUBLE PRECISION NOT NULL,
+        row_count BIGINT NOT NULL,
+        query TEXT NOT NULL,
+        plan JSONB NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at)
+    """
+    )
+    op.execute(
+        f"""
+    SELECT create_monthly_partition('slow_query_log', partition_month::date)
+    FROM generate_series(
+        date_trunc('month', now()),
+        date_trunc('month', now()) + interval '{PARTITION_MONTHS_AHEAD} months',
+        interval '1 month'
+    ) partition_month
+    """
+    )
+    op.execute(
+        "CREATE TABLE slow_query_log_default PARTITION OF slow_query_log DEFAULT"
+    )
+    op.execute(
+        """
+    CREATE INDEX slow_query_log_fingerprint_created_at_idx
+    ON slow_query_log (fingerprint, created_at DESC)
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS slow_query_log")
@@ -0,0 +1,87 @@
+"""Exclude trigger-maintained columns from change log diffs
+
+Revision ID: c4d7a1e90b36
+Revises: b58e2f7c9d14
+Create Date: 2025-03-12 11:30:52.184730
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d7a1e90b36"
+down_revision: Union[str, None] = "b58e2f7c9d14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns set by BEFORE UPDATE triggers, by table.
+# The row-level change log trigger ran before these, and so never logged them;
+# the statement-level trigger runs after them, and so must exclude them.
+MAINTAINED_COLUMNS = {
+    "agencies": ["airtable_agency_last_modified"],
+    "data_sources": [
+        "updated_at",
+        "approval_status_updated_at",
+        "broken_source_url_as_of",
+    ],
+}
+
+
+def create_log_table_updates_function(excluded_columns_condition: str):
+    op.execute(
+        f"""
+    CREATE OR REPLACE FUNCTION log_table_updates()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO change_log (operation_type, table_name, affected_id, old_data, new_data)
+            SELECT 'UPDATE', TG_TABLE_NAME, old_row.id, diff.old_data, diff.new_data
+            FROM old_rows old_row
+            INNER JOIN new_rows new_row ON new_row.id = old_row.id
+            CROSS JOIN LATERAL (
+                SELECT
+                    jsonb_object_agg(old_value.key, old_value.value) AS old_data,
+                    jsonb_object_agg(new_value.key, new_value.value) AS new_data
+                FROM jsonb_each(to_jsonb(old_row)) old_value
+                INNER JOIN jsonb_each(to_jsonb(new_row)) new_value
+                    ON new_value.key = old_value.key
+                WHERE old_value.value IS DISTINCT FROM new_value.value
+                {excluded_columns_condition}
+            ) diff
+            WHERE diff.old_data IS NOT NULL;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+    )
+
+
+def create_update_trigger(table_name: str, excluded_columns: list[str]):
+    arguments = ", ".join(f"'{column}'" for column in excluded_columns)
+    op.execute(f"DROP TRIGGER IF EXISTS log_{table_name}_updates ON {table_name}")
+    op.execute(
+        f"""
+    CREATE TRIGGER log_{table_name}_updates
+    AFTER UPDATE ON {table_name}
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION log_table_updates({arguments});
+    """
+    )
+
+
+def upgrade() -> None:
+    # The columns to exclude are given as the trigger's arguments.
+    # Rows in which only excluded columns changed produce no diff, and are not logged.
+    create_log_table_updates_function(
+        excluded_columns_condition="AND old_value.key <> ALL (COALESCE(TG_ARGV, '{}'::TEXT[]))"
+    )
+    for table_name, excluded_columns in MAINTAINED_COLUMNS.items():
+        create_update_trigger(table_name=table_name, excluded_columns=excluded_columns)
+
+
+def downgrade() -> None:
+    for table_name in MAINTAINED_COLUMNS:
+        create_update_trigger(table_name=table_name, excluded_columns=[])
+    create_log_table_updates_function(excluded_columns_condition="")
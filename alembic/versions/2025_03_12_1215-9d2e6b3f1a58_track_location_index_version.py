@@ -0,0 +1,63 @@
+"""Track the version of locations for in-memory location indexes
+
+Revision ID: 9d2e6b3f1a58
+Revises: c4d7a1e90b36
+Create Date: 2025-03-12 12:15:08.541902
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d2e6b3f1a58"
+down_revision: Union[str, None] = "c4d7a1e90b36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables from which `locations_expanded` and `dependent_locations` are derived
+LOCATION_TABLES = ["us_states", "counties", "localities", "locations"]
+
+
+def upgrade() -> None:
+    # A single row, incremented in the same transaction as any change to locations,
+    # so that each app process can tell whether its location index is out of date
+    op.execute(
+        """
+    CREATE TABLE location_index_version (
+        id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+        version BIGINT NOT NULL DEFAULT 0
+    )
+    """
+    )
+    op.execute("INSERT INTO location_index_version DEFAULT VALUES")
+    op.execute(
+        """
+    CREATE OR REPLACE FUNCTION increment_location_index_version()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE location_index_version SET version = version + 1;
+            RETURN NULL;
+        END;
+    $$ LANGUAGE plpgsql;
+    """
+    )
+    for table_name in LOCATION_TABLES:
+        op.execute(
+            f"""
+        CREATE TRIGGER increment_location_index_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table_name}
+        FOR EACH STATEMENT EXECUTE FUNCTION increment_location_index_version();
+        """
+        )
+
+
+def downgrade() -> None:
+    for table_name in LOCATION_TABLES:
+        op.execute(
+            f"DROP TRIGGER IF EXISTS increment_location_index_version ON {table_name}"
+        )
+    op.execute("DROP FUNCTION IF EXISTS increment_location_index_version")
+    op.execute("DROP TABLE IF EXISTS location_index_version")
@@ -1,16 +1,23 @@
 import os
-from datetime import timedelta, date, datetime
+from datetime import timedelta
 
 from flask import Flask
-from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
 from middleware.SchedulerManager import SchedulerManager
+from middleware.json_providers import get_json_provider
+from middleware.process_metrics import process_metrics_publisher
+from middleware.request_profiling import init_request_profiling
 from middleware.scheduled_tasks.check_database_health import check_database_health
+from middleware.scheduled_tasks.maintain_log_partitions import maintain_log_partitions
+from middleware.scheduled_tasks.refresh_metrics_snapshot import (
+    refresh_metrics_snapshot,
+)
 from middleware.util import get_env_variable
 from resources.Admin import namespace_admin
 from resources.Batch import namespace_bulk
 from resources.Callback import namespace_auth
+from resources.Changes import namespace_changes
 from resources.Contact import namespace_contact
 from resources.DataRequests import namespace_data_requests
 from resources.GithubDataRequests import namespace_github
@@ -31,8 +38,7 @@ from resources.TypeaheadSuggestions import (
 )
 from flask_restx import Api
 
-from config import config, oauth, limiter, jwt
-from middleware.initialize_psycopg_connection import initialize_psycopg_connection
+from config import oauth, limiter, jwt
 from resources.Agencies import namespace_agencies
 from resources.ApiKeyResource import namespace_api_key
 from resources.Archives import namespace_archives
@@ -78,6 +84,7 @@ NAMESPACES = [
     namespace_admin,
     namespace_contact,
     namespace_metadata,
+    namespace_changes,
 ]
 
 MY_PREFIX = "/api"
@@ -112,19 +119,12 @@ def get_flask_app_cookie_encryption_key() -> str:
     return get_env_variable("FLASK_APP_COOKIE_ENCRYPTION_KEY")
 
 
-class UpdatedJSONProvider(DefaultJSONProvider):
-    def default(self, o):
-        if isinstance(o, date) or isinstance(o, datetime):
-            return o.isoformat()
-        return super().default(o)
-
-
 def create_app() -> Flask:
-    psycopg2_connection = initialize_psycopg_connection()
-    config.connection = psycopg2_connection
     api = get_api_with_namespaces()
     app = Flask(__name__)
-    app.json = UpdatedJSONProvider(app)
+    app.json = get_json_provider(app)
+    init_request_profiling(app)
+    process_metrics_publisher.start()
 
     # JWT settings
     app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY")
@@ -148,6 +148,18 @@ def create_app() -> Flask:
     scheduler.add_job(
         "database_health_check", check_database_health, minutes=60, delay_minutes=3
     )
+    scheduler.add_job(
+        "metrics_snapshot_refresh",
+        refresh_metrics_snapshot,
+        minutes=60,
+        delay_minutes=1,
+    )
+    scheduler.add_job(
+        "log_partition_maintenance",
+        maintain_log_partitions,
+        minutes=24 * 60,
+        delay_minutes=5,
+    )
     scheduler.start()
 
     # Store scheduler in the app context to manage it later
@@ -9,13 +9,6 @@ from flask_jwt_extended import JWTManager
 
 from middleware.util import get_env_variable
 
-
-class Config:
-    connection = None
-
-
-config = Config()
-
 secret_key = get_env_variable("FLASK_APP_COOKIE_ENCRYPTION_KEY")
 cache_secret_key = f"_state_github_{secret_key}"
 
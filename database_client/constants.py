@@ -1,3 +1,5 @@
+from middleware.enums import Relations
+
 DATA_SOURCES_APPROVED_COLUMNS = [
     "name",
     "submitted_name",
@@ -58,4 +60,60 @@ METADATA_METHOD_NAMES = [
     "count_subquery",
 ]
 
+# Agency columns returned by GET /agencies when no columns are requested
+AGENCIES_PROJECTION_COLUMNS = [
+    "id",
+    "name",
+    "homepage_url",
+    "lat",
+    "lng",
+    "defunct_year",
+    "agency_type",
+    "multi_agency",
+    "no_web_presence",
+    "approval_status",
+    "rejection_reason",
+    "last_approval_editor",
+    "submitter_contact",
+    "jurisdiction_type",
+    "airtable_agency_last_modified",
+    "agency_created",
+]
+
 PAGE_SIZE = 100
+
+# Default number of data sources claimed per archive queue poll,
+# and how long claimed data sources are withheld from other archivers
+ARCHIVE_QUEUE_DEFAULT_LIMIT = 100
+ARCHIVE_QUEUE_DEFAULT_LEASE_SECONDS = 15 * 60
+
+# Tables whose inserts, updates, and deletes are recorded in the change feed
+CHANGE_FEED_TABLES = [
+    Relations.AGENCIES,
+    Relations.COUNTIES,
+    Relations.DATA_REQUESTS,
+    Relations.DATA_SOURCES,
+    Relations.LINK_AGENCIES_DATA_SOURCES,
+    Relations.LINK_AGENCIES_LOCATIONS,
+    Relations.LINK_DATA_SOURCES_DATA_REQUESTS,
+    Relations.LINK_LOCATIONS_DATA_REQUESTS,
+    Relations.LOCALITIES,
+    Relations.LOCATIONS,
+]
+# Default and maximum number of linked rows returned per page
+LINKED_ROWS_DEFAULT_LIMIT = 100
+LINKED_ROWS_MAX_LIMIT = 1000
+# Default and maximum number of changes returned per change feed read
+CHANGE_FEED_DEFAULT_LIMIT = 500
+CHANGE_FEED_MAX_LIMIT = 5000
+
+# Log tables partitioned by month of `created_at`,
+# mapped to the number of months of rows retained before their partitions are dropped
+LOG_TABLE_RETENTION_MONTHS = {
+    Relations.CHANGE_LOG: 12,
+    Relations.TABLE_COUNT_LOG: 24,
+    Relations.CHANGE_FEED: 3,
+    Relations.SLOW_QUERY_LOG: 3,
+}
+# Number of months ahead of the current month for which log table partitions are created
+LOG_TABLE_PARTITION_MONTHS_AHEAD = 2
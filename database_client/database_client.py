@@ -1,4 +1,5 @@
 import json
+import threading
 from collections import namedtuple
 from datetime import datetime, timezone
 from enum import Enum
@@ -11,12 +12,31 @@ import sqlalchemy.exc
 from dateutil.relativedelta import relativedelta
 from psycopg import sql, Cursor
 from psycopg.rows import dict_row, tuple_row
-from sqlalchemy import select, MetaData, delete, update, insert, Select, func, desc, asc
+from sqlalchemy import (
+    select,
+    MetaData,
+    delete,
+    update,
+    insert,
+    Select,
+    func,
+    asc,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import aliased, defaultload, load_only, selectinload, joinedload
+from sqlalchemy.orm import Session as SQLAlchemySession
 
 from database_client.DTOs import UserInfoNonSensitive, UsersWithPermissions
-from database_client.constants import METADATA_METHOD_NAMES, PAGE_SIZE
+from database_client.constants import (
+    METADATA_METHOD_NAMES,
+    PAGE_SIZE,
+    ARCHIVE_QUEUE_DEFAULT_LIMIT,
+    ARCHIVE_QUEUE_DEFAULT_LEASE_SECONDS,
+    CHANGE_FEED_DEFAULT_LIMIT,
+)
 from database_client.db_client_dataclasses import (
+    ChangeFeedCursor,
     OrderByParameters,
     WhereMapping,
 )
@@ -29,6 +49,7 @@ from database_client.enums import (
     EntityType,
     EventType,
     LocationType,
+    SortOrder,
 )
 from middleware.argument_checking_logic import check_for_mutually_exclusive_arguments
 from middleware.custom_dataclasses import EventInfo, EventBatch
@@ -37,7 +58,6 @@ from middleware.exceptions import (
     DuplicateUserError,
 )
 from database_client.models import (
-    convert_to_column_reference,
     ExternalAccount,
     SQL_ALCHEMY_TABLE_REFERENCE,
     User,
@@ -56,6 +76,13 @@ from database_client.models import (
     LinkAgencyLocation,
     DataSourceExpanded,
     DataSource,
+    DependentLocation,
+)
+from database_client.location_index import (
+    LOCATION_INDEX,
+    LOCATION_INDEX_COLUMNS,
+    LocationIndex,
+    LocationIndexUnsupportedQuery,
 )
 from middleware.enums import (
     PermissionsEnum,
@@ -74,6 +101,7 @@ from middleware.schema_and_dto_logic.primary_resource_dtos.agencies_dtos import
     AgenciesPostDTO,
 )
 from middleware.schema_and_dto_logic.primary_resource_dtos.match_dtos import (
+    AgencyMatchRequestDTO,
     AgencyMatchResponseInnerDTO,
     AgencyMatchResponseLocationDTO,
 )
@@ -96,9 +124,32 @@ DATA_SOURCES_MAP_COLUMN = [
 class DatabaseClient:
 
     def __init__(self):
-        self.connection: PgConnection = initialize_psycopg_connection()
         self.session_maker = initialize_sqlalchemy_session()
-        self.cursor: Optional[Cursor] = None
+        # Cursors and sessions are held per thread, so that a client may be shared between threads
+        self._thread_state = threading.local()
+
+    @property
+    def connection(self) -> PgConnection:
+        """
+        The calling thread's connection, which is reopened if it was closed
+        """
+        return initialize_psycopg_connection()
+
+    @property
+    def cursor(self) -> Optional[Cursor]:
+        return getattr(self._thread_state, "cursor", None)
+
+    @cursor.setter
+    def cursor(self, cursor: Optional[Cursor]):
+        self._thread_state.cursor = cursor
+
+    @property
+    def session(self) -> Optional[SQLAlchemySession]:
+        return getattr(self._thread_state, "session", None)
+
+    @session.setter
+    def session(self, session: Optional[SQLAlchemySession]):
+        self._thread_state.session = session
 
     def cursor_manager(row_factory=dict_row):
         """Decorator method for managing a cursor object.
@@ -110,20 +161,18 @@ class DatabaseClient:
         def decorator(method):
             @wraps(method)
             def wrapper(self, *args, **kwargs):
-                # Open a new cursor
-                # If connection is closed, reopen
-                if self.connection.closed != 0:
-                    self.connection = initialize_psycopg_connection()
-                self.cursor = self.connection.cursor(row_factory=row_factory)
+                # Open a new cursor on the thread's connection
+                connection = self.connection
+                self.cursor = connection.cursor(row_factory=row_factory)
                 try:
                     # Execute the method
                     result = method(self, *args, **kwargs)
                     # Commit the transaction if no exception occurs
-                    self.connection.commit()
+                    connection.commit()
                     return result
                 except Exception as e:
                     # Rollback in case of an error
-                    self.connection.rollback()
+                    connection.rollback()
                     raise e
                 finally:
                     # Close the cursor
@@ -346,32 +395,8 @@ class DatabaseClient:
 
         :return: A list of MapInfo namedtuples, each containing details of a data source.
         """
-        sql_query = """
-            SELECT
-                DATA_SOURCES.id AS DATA_SOURCE_ID,
-                LE.ID as LOCATION_ID,
-                DATA_SOURCES.NAME,
-                AGENCIES.ID AS AGENCY_ID,
-                AGENCIES.NAME AS AGENCY_NAME,
-                LE.STATE_ISO,
-                LE.LOCALITY_NAME AS MUNICIPALITY,
-                LE.COUNTY_NAME,
-                RT.NAME RECORD_TYPE,
-                AGENCIES.LAT,
-                AGENCIES.LNG
-            FROM
-                LINK_AGENCIES_DATA_SOURCES AS AGENCY_SOURCE_LINK
-                INNER JOIN DATA_SOURCES ON AGENCY_SOURCE_LINK.DATA_SOURCE_ID = DATA_SOURCES.ID
-                INNER JOIN AGENCIES ON AGENCY_SOURCE_LINK.AGENCY_ID = AGENCIES.ID
-                INNER JOIN LINK_AGENCIES_LOCATIONS LAL ON AGENCIES.ID = LAL.AGENCY_ID
-                LEFT JOIN LOCATIONS_EXPANDED LE ON LAL.LOCATION_ID = LE.ID
-                INNER JOIN RECORD_TYPES RT ON RT.ID = DATA_SOURCES.RECORD_TYPE_ID
-            WHERE
-                DATA_SOURCES.APPROVAL_STATUS = 'approved'
-                AND LAT is not null
-				AND LNG is not null
-        """
-        self.cursor.execute(sql_query)
+        query = DynamicQueryConstructor.build_data_sources_for_map_query()
+        self.cursor.execute(query)
         results = self.cursor.fetchall()
 
         return [self.MapInfo(*result) for result in results]
@@ -398,35 +423,82 @@ class DatabaseClient:
     )
 
     @cursor_manager()
-    def get_data_sources_to_archive(self) -> list[ArchiveInfo]:
+    def get_data_sources_to_archive(
+        self,
+        limit: int = ARCHIVE_QUEUE_DEFAULT_LIMIT,
+        lease_seconds: int = ARCHIVE_QUEUE_DEFAULT_LEASE_SECONDS,
+    ) -> list[ArchiveInfo]:
         """
-        Pulls data sources to be archived by the automatic archives script.
+        Claims the data sources which are due to be archived by the automatic archives script.
 
-        A data source is selected for archival if:
+        A data source is due for archival if:
         The data source has been approved
-        AND (the data source has not been archived previously OR the data source is updated regularly)
+        AND its `next_due_at` has passed
+            (it has never been archived, or its update frequency has elapsed since it was last cached)
+        AND it is not leased to another archiver
         AND the source url is not broken
         AND the source url is not null.
 
-        :return: A list of ArchiveInfo namedtuples, each containing archive details of a data source.
+        Claimed data sources are leased for `lease_seconds`,
+        so that concurrent archivers receive disjoint work.
+        The lease is released once `last_cached` is updated.
+
+        :param limit: The maximum number of data sources to claim.
+        :param lease_seconds: How long claimed data sources are withheld from other archivers.
+        :return: A list of ArchiveInfo namedtuples, most overdue first.
         """
         sql_query = """
+        WITH due AS (
+            SELECT
+                ai.data_source_id
+            FROM
+                data_sources_archive_info ai
+            INNER JOIN
+                data_sources ds
+            ON
+                ds.id = ai.data_source_id
+            WHERE
+                ai.next_due_at <= timezone('utc', now())
+                AND (ai.lease_expires_at IS NULL OR ai.lease_expires_at < timezone('utc', now()))
+                AND ds.approval_status = 'approved'
+                AND ds.broken_source_url_as_of IS NULL
+                AND ds.url_status <> 'broken'
+                AND ds.source_url IS NOT NULL
+            ORDER BY
+                ai.next_due_at
+            LIMIT %(limit)s
+            FOR UPDATE OF ai SKIP LOCKED
+        ), claimed AS (
+            UPDATE
+                data_sources_archive_info ai
+            SET
+                lease_expires_at = timezone('utc', now()) + make_interval(secs => %(lease_seconds)s)
+            FROM
+                due
+            WHERE
+                ai.data_source_id = due.data_source_id
+            RETURNING
+                ai.data_source_id,
+                ai.update_frequency,
+                ai.last_cached,
+                ai.next_due_at
+        )
         SELECT
-            data_sources.id,
-            source_url,
-            update_frequency,
-            last_cached,
-            broken_source_url_as_of
+            ds.id,
+            ds.source_url,
+            claimed.update_frequency,
+            claimed.last_cached,
+            ds.broken_source_url_as_of
         FROM
-            data_sources
+            claimed
         INNER JOIN
-            data_sources_archive_info
+            data_sources ds
         ON
-            data_sources.id = data_sources_archive_info.data_source_id
-        WHERE 
-            approval_status = 'approved' AND (last_cached IS NULL OR update_frequency IS NOT NULL) AND broken_source_url_as_of IS NULL AND url_status <> 'broken' AND source_url IS NOT NULL
+            ds.id = claimed.data_source_id
+        ORDER BY
+            claimed.next_due_at, ds.id
         """
-        self.cursor.execute(sql_query)
+        self.cursor.execute(sql_query, {"limit": limit, "lease_seconds": lease_seconds})
         data_sources = self.cursor.fetchall()
 
         results = [
@@ -471,6 +543,64 @@ class DatabaseClient:
             id_column_name="data_source_id",
         )
 
+    ArchiveUpdate = namedtuple(
+        "ArchiveUpdate", ["id", "last_cached", "broken_source_url_as_of"]
+    )
+
+    @cursor_manager()
+    def update_archives_batch(self, updates: list[ArchiveUpdate]) -> list[int]:
+        """
+        Applies archive updates for many data sources in a single statement and transaction.
+
+        Sets last_cached for each data source, and for those with a broken_source_url_as_of,
+        marks the source url as broken as of that date.
+        If a data source is updated more than once, the last update takes precedence.
+
+        :param updates: ArchiveUpdate namedtuples
+        :return: The ids of the data sources which were updated.
+        """
+        updates = list({update.id: update for update in updates}.values())
+        if len(updates) == 0:
+            return []
+
+        values = sql.SQL(", ").join(
+            sql.SQL("(%s::integer, %s::timestamp, %s::date)") for _ in updates
+        )
+        query = sql.SQL(
+            """
+            WITH updates (data_source_id, last_cached, broken_source_url_as_of) AS (
+                VALUES {values}
+            ),
+            broken_sources AS (
+                UPDATE data_sources ds
+                SET
+                    url_status = 'broken',
+                    broken_source_url_as_of = u.broken_source_url_as_of
+                FROM updates u
+                WHERE ds.id = u.data_source_id
+                    AND u.broken_source_url_as_of IS NOT NULL
+            )
+            UPDATE data_sources_archive_info ai
+            SET last_cached = u.last_cached
+            FROM updates u
+            WHERE ai.data_source_id = u.data_source_id
+            RETURNING ai.data_source_id
+        """
+        ).format(values=values)
+        self.cursor.execute(
+            query,
+            [
+                value
+                for update in updates
+                for value in (
+                    update.id,
+                    update.last_cached,
+                    update.broken_source_url_as_of,
+                )
+            ],
+        )
+        return [row["data_source_id"] for row in self.cursor.fetchall()]
+
     DataSourceMatches = namedtuple("DataSourceMatches", ["converted", "ids"])
 
     UserInfo = namedtuple("UserInfo", ["id", "password_digest", "api_key", "email"])
@@ -592,6 +722,36 @@ class DatabaseClient:
         self.cursor.execute(query)
         return self.cursor.fetchall()
 
+    @cursor_manager()
+    def search_with_location_and_record_type_grouped(
+        self,
+        location_id: int,
+        record_categories: Optional[list[RecordCategories]] = None,
+        record_types: Optional[list[RecordTypes]] = None,
+        per_jurisdiction_limit: Optional[int] = None,
+        per_jurisdiction_offset: int = 0,
+    ) -> List[dict]:
+        """
+        Searches for data sources in the database, grouped by jurisdiction.
+
+        :param per_jurisdiction_limit: The maximum number of results to return for each jurisdiction.
+            If None, all results are returned.
+        :param per_jurisdiction_offset: The number of results to skip for each jurisdiction.
+        :return: A list of dictionaries, one for each jurisdiction with results,
+            containing the jurisdiction, the total count of its results, and the results themselves.
+        """
+        check_for_mutually_exclusive_arguments(record_categories, record_types)
+
+        query = DynamicQueryConstructor.create_grouped_search_query(
+            location_id=location_id,
+            record_categories=record_categories,
+            record_types=record_types,
+            per_jurisdiction_limit=per_jurisdiction_limit,
+            per_jurisdiction_offset=per_jurisdiction_offset,
+        )
+        self.cursor.execute(query)
+        return self.cursor.fetchall()
+
     @cursor_manager()
     def search_federal_records(
         self, record_categories: Optional[list[RecordCategories]] = None, page: int = 1
@@ -631,6 +791,50 @@ class DatabaseClient:
         count = self.session.query(func.count(table.id)).scalar()
         return count
 
+    TableCountEstimate = namedtuple(
+        "TableCountEstimate",
+        ["table_name", "estimated_count", "rows_inserted", "rows_deleted"],
+    )
+
+    @cursor_manager()
+    def get_table_count_estimates(
+        self, table_names: list[str]
+    ) -> dict[str, TableCountEstimate]:
+        """
+        Retrieves statistics-based row count estimates for the given tables in a single query.
+
+        Uses the live tuple count from pg_stat_user_tables,
+        falling back to pg_class.reltuples if no statistics have been collected.
+        Unlike get_table_count, this does not scan the tables.
+
+        :param table_names: The names of the tables to estimate.
+        :return: A dictionary mapping table names to TableCountEstimate namedtuples.
+        """
+        query = """
+            SELECT
+                c.relname AS table_name,
+                COALESCE(s.n_live_tup, GREATEST(c.reltuples, 0))::bigint AS estimated_count,
+                COALESCE(s.n_tup_ins, 0) AS rows_inserted,
+                COALESCE(s.n_tup_del, 0) AS rows_deleted
+            FROM pg_class c
+            INNER JOIN pg_namespace n ON n.oid = c.relnamespace
+            LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+            WHERE n.nspname = 'public'
+            AND c.relkind = 'r'
+            AND c.relname = ANY(%s)
+        """
+        self.cursor.execute(query, (table_names,))
+        results = self.cursor.fetchall()
+        return {
+            row["table_name"]: self.TableCountEstimate(
+                table_name=row["table_name"],
+                estimated_count=row["estimated_count"],
+                rows_inserted=row["rows_inserted"],
+                rows_deleted=row["rows_deleted"],
+            )
+            for row in results
+        }
+
     @session_manager
     def log_table_counts(self, tcrs: list[TableCountReference]):
         # Add entry to TableCountLog
@@ -640,20 +844,20 @@ class DatabaseClient:
 
     @session_manager
     def get_most_recent_logged_table_counts(self) -> TableCountReferenceManager:
-        # Get the most recent table count for all distinct tables
-        subquery = select(
-            TableCountLog.table_name,
-            TableCountLog.count,
-            func.row_number()
-            .over(
-                partition_by=TableCountLog.table_name,
-                order_by=desc(TableCountLog.created_at),
+        # Get the most recent table count for all distinct tables,
+        # using the (table_name, created_at DESC) index rather than numbering every row
+        latest = (
+            select(
+                TableCountLog.table_name,
+                func.max(TableCountLog.created_at).label("created_at"),
             )
-            .label("row_num"),
-        ).subquery()
-
-        stmt = select(subquery.c.table_name, subquery.c.count).where(
-            subquery.c.row_num == 1
+            .group_by(TableCountLog.table_name)
+            .subquery()
+        )
+        stmt = select(TableCountLog.table_name, TableCountLog.count).join(
+            latest,
+            (TableCountLog.table_name == latest.c.table_name)
+            & (TableCountLog.created_at == latest.c.created_at),
         )
 
         results = self.session.execute(stmt).all()
@@ -783,6 +987,7 @@ class DatabaseClient:
         column_value_mappings = self.update_dictionary_enum_values(
             column_value_mappings
         )
+        self._invalidate_location_index_if_location_table(table_name)
         table = SQL_ALCHEMY_TABLE_REFERENCE[table_name]
         statement = insert(table.__table__).values(**column_value_mappings)
 
@@ -921,12 +1126,9 @@ class DatabaseClient:
             where_mappings
         )
         offset = self.get_offset(page)
-        column_references = convert_to_column_reference(
-            columns=columns, relation=relation_name
-        )
         query = DynamicQueryConstructor.create_selection_query(
             relation_name,
-            column_references,
+            columns,
             where_mappings,
             limit,
             offset,
@@ -934,10 +1136,11 @@ class DatabaseClient:
             subquery_parameters,
             alias_mappings,
         )
-        if apply_uniqueness_constraints:
-            raw_results = self.session.execute(query()).mappings().unique().all()
+        result = self.session.execute(query.statement, query.parameters)
+        if self._requires_uniqueness(apply_uniqueness_constraints, subquery_parameters):
+            raw_results = result.mappings().unique().all()
         else:
-            raw_results = self.session.execute(query()).mappings().all()
+            raw_results = result.mappings().all()
         results = self._process_results(
             build_metadata=build_metadata,
             raw_results=raw_results,
@@ -947,6 +1150,22 @@ class DatabaseClient:
 
         return results
 
+    @staticmethod
+    def _requires_uniqueness(
+        apply_uniqueness_constraints: bool,
+        subquery_parameters: Optional[list[SubqueryParameters]],
+    ) -> bool:
+        """
+        Determines whether results must be de-duplicated after execution.
+        Subqueries which are not loaded via a join return one row per parent,
+        and so do not need to be de-duplicated.
+        """
+        if not apply_uniqueness_constraints:
+            return False
+        if not subquery_parameters:
+            return True
+        return any(sp.requires_uniqueness() for sp in subquery_parameters)
+
     def _process_results(
         self,
         build_metadata: bool,
@@ -1023,7 +1242,12 @@ class DatabaseClient:
         page: Optional[int] = 1,
         limit: Optional[int] = PAGE_SIZE,
         requested_columns: Optional[list[str]] = None,
+        projection: bool = False,
     ):
+        """
+        :param projection: If True, linked data sources and locations are built
+            as json in the database rather than loaded as ORM instances.
+        """
 
         order_by_clause = DynamicQueryConstructor.get_sql_alchemy_order_by_clause(
             order_by=order_by,
@@ -1031,6 +1255,20 @@ class DatabaseClient:
             default=asc(Agency.id),
         )
 
+        if projection:
+            query = DynamicQueryConstructor.create_agencies_projection_query(
+                requested_columns=requested_columns,
+                order_by_clause=order_by_clause,
+                limit=limit,
+                offset=self.get_offset(page),
+            )
+            return [
+                ResultFormatter.agency_projection_to_get_agencies_output(
+                    row, requested_columns=requested_columns
+                )
+                for row in self.session.execute(query).mappings().all()
+            ]
+
         load_options = DynamicQueryConstructor.agencies_get_load_options(
             requested_columns=requested_columns
         )
@@ -1083,7 +1321,12 @@ class DatabaseClient:
         order_by: Optional[OrderByParameters] = None,
         page: Optional[int] = 1,
         limit: Optional[int] = PAGE_SIZE,
+        projection: bool = False,
     ):
+        """
+        :param projection: If True, linked agencies, their locations, and data requests
+            are built as json in the database rather than loaded as ORM instances.
+        """
 
         order_by_clause = DynamicQueryConstructor.get_sql_alchemy_order_by_clause(
             order_by=order_by,
@@ -1091,6 +1334,19 @@ class DatabaseClient:
             default=asc(DataSourceExpanded.id),
         )
 
+        if projection:
+            query = DynamicQueryConstructor.create_data_sources_projection_query(
+                data_sources_columns=data_sources_columns,
+                data_requests_columns=data_requests_columns,
+                order_by_clause=order_by_clause,
+                limit=limit,
+                offset=self.get_offset(page),
+            )
+            return [
+                ResultFormatter.data_source_projection_to_get_data_sources_output(row)
+                for row in self.session.execute(query).mappings().all()
+            ]
+
         load_options = DynamicQueryConstructor.data_sources_get_load_options(
             data_requests_columns=data_requests_columns,
             data_sources_columns=data_sources_columns,
@@ -1223,6 +1479,24 @@ class DatabaseClient:
 
     def get_location_id(
         self, where_mappings: Union[list[WhereMapping], dict]
+    ) -> Optional[int]:
+        where_mappings = self._create_where_mappings_instance_if_dictionary(
+            where_mappings
+        )
+        try:
+            location_id = self.get_location_index().get_location_id(where_mappings)
+        except LocationIndexUnsupportedQuery:
+            return self._get_location_id_from_database(where_mappings)
+        if location_id is not None:
+            return location_id
+        # The location may have been added since the index was loaded
+        location_id = self._get_location_id_from_database(where_mappings)
+        if location_id is not None:
+            LOCATION_INDEX.invalidate()
+        return location_id
+
+    def _get_location_id_from_database(
+        self, where_mappings: list[WhereMapping]
     ) -> Optional[int]:
         result = self._select_single_entry_from_relation(
             relation_name=Relations.LOCATIONS_EXPANDED.value,
@@ -1233,6 +1507,56 @@ class DatabaseClient:
             return None
         return result["id"]
 
+    def get_location_index(self) -> LocationIndex:
+        """
+        Get the in-memory location index, loading it if it is not loaded or out of date.
+        Locations may have been changed by another process,
+        so the index is checked against the location index version in the database.
+        """
+        # Read before the locations, so a change committed in between causes a later reload
+        version = self._get_location_index_version()
+        if LOCATION_INDEX.is_outdated(version):
+            LOCATION_INDEX.load(version=version, **self._get_location_index_data())
+        return LOCATION_INDEX
+
+    @cursor_manager()
+    def _get_location_index_version(self) -> int:
+        query = sql.SQL("SELECT version FROM {table}").format(
+            table=sql.Identifier(Relations.LOCATION_INDEX_VERSION.value)
+        )
+        self.cursor.execute(query)
+        return self.cursor.fetchone()["version"]
+
+    @session_manager
+    def _get_location_index_data(self) -> dict:
+        locations = self.session.execute(
+            select(
+                *[
+                    getattr(LocationExpanded, column)
+                    for column in LOCATION_INDEX_COLUMNS
+                ]
+            )
+        ).mappings()
+        dependent_locations = self.session.execute(
+            select(
+                DependentLocation.parent_location_id,
+                DependentLocation.dependent_location_id,
+            )
+        )
+        return {
+            "locations": [dict(location) for location in locations],
+            "dependent_locations": [tuple(row) for row in dependent_locations],
+        }
+
+    @staticmethod
+    def _invalidate_location_index_if_location_table(table_name: str):
+        if table_name in (
+            Relations.US_STATES.value,
+            Relations.COUNTIES.value,
+            Relations.LOCALITIES.value,
+        ):
+            LOCATION_INDEX.invalidate()
+
     def get_related_data_sources(self, data_request_id: int) -> List[dict]:
         """
         Get data sources related to the request id
@@ -1284,6 +1608,7 @@ class DatabaseClient:
         """
         Deletes an entry from a table in the database
         """
+        self._invalidate_location_index_if_location_table(table_name)
         table = SQL_ALCHEMY_TABLE_REFERENCE[table_name]
         column = getattr(table, id_column_name)
         query = delete(table).where(column == id_column_value)
@@ -1344,11 +1669,22 @@ class DatabaseClient:
         """
         )
 
-    @cursor_manager()
     def check_for_url_duplicates(self, url: str) -> list[dict]:
-        query = DynamicQueryConstructor.get_distinct_source_urls_query(url)
+        return self.check_for_url_duplicates_batch([url])[url]
+
+    @cursor_manager()
+    def check_for_url_duplicates_batch(self, urls: list[str]) -> dict[str, list[dict]]:
+        """
+        Check many normalized urls for duplicates in a single query
+        :param urls: Urls, normalized as by `normalize_url`
+        :return: A dictionary mapping each url to its duplicates, if any
+        """
+        query = DynamicQueryConstructor.get_url_duplicates_query(list(set(urls)))
         self.cursor.execute(query)
-        return self.cursor.fetchall()
+        duplicates = {url: [] for url in urls}
+        for row in self.cursor.fetchall():
+            duplicates[row.pop("base_url")].append(row)
+        return duplicates
 
     def get_columns_for_relation(self, relation: Relations) -> list[dict]:
         """
@@ -1404,6 +1740,7 @@ class DatabaseClient:
                 where_mappings=WhereMapping.from_dict(column_value_mappings),
             )[0][column_to_return]
 
+    @session_manager
     def get_linked_rows(
         self,
         link_table: Relations,
@@ -1416,23 +1753,51 @@ class DatabaseClient:
         alias_mappings: Optional[dict[str, str]] = None,
         build_metadata=False,
         subquery_parameters: Optional[list[SubqueryParameters]] = [],
+        limit: Optional[int] = None,
+        after: Optional[Any] = None,
     ):
-        # Get ids via linked table
-        link_results = self._select_from_relation(
-            relation_name=link_table.value,
-            columns=[right_link_column],
-            where_mappings={left_link_column: left_id},
-        )
-        link_ids = [result[right_link_column] for result in link_results]
-        linked_results = self._select_from_relation(
-            relation_name=linked_relation.value,
+        """
+        Retrieves rows from the linked relation which are linked to the left id via the link table,
+        in a single query joining the link table to the linked relation.
+
+        Results are ordered by the linked relation's linking column.
+
+        :param limit: The maximum number of rows to return. If None, all linked rows are returned.
+        :param after: If provided, only rows whose linking column value is greater than this are returned,
+            allowing keyset continuation from the last row of a prior call.
+        :return: If build_metadata, the results with metadata and `next_after`,
+            the value to pass as `after` to retrieve the following rows, or None if there are none.
+        """
+        query = DynamicQueryConstructor.create_linked_rows_query(
+            link_table=link_table.value,
+            left_id=left_id,
+            left_link_column=left_link_column,
+            right_link_column=right_link_column,
+            linked_relation=linked_relation.value,
+            linked_relation_linking_column=linked_relation_linking_column,
             columns=columns_to_retrieve,
             alias_mappings=alias_mappings,
-            where_mappings={linked_relation_linking_column: link_ids},
+            subquery_parameters=subquery_parameters,
+            # Request one extra row to determine if more rows follow
+            limit=None if limit is None else limit + 1,
+            after=after,
+        )
+        raw_results = self.session.execute(query).mappings().unique().all()
+        has_more = limit is not None and len(raw_results) > limit
+        results = self._process_results(
             build_metadata=build_metadata,
+            raw_results=raw_results[:limit],
+            relation_name=linked_relation.value,
             subquery_parameters=subquery_parameters,
         )
-        return linked_results
+        if build_metadata:
+            linking_key = (alias_mappings or {}).get(
+                linked_relation_linking_column, linked_relation_linking_column
+            )
+            results["next_after"] = (
+                results["data"][-1][linking_key] if has_more else None
+            )
+        return results
 
     def _build_column_references(
         self, LinkedRelation, alias_mappings, columns_to_retrieve
@@ -1612,16 +1977,36 @@ class DatabaseClient:
     ):
         if isinstance(record_categories, RecordCategories):
             record_categories = [record_categories]
+        if isinstance(record_types, RecordTypes):
+            record_types = [record_types]
 
         with self.session.begin():
-            # Insert into recent_search table and get recent_search_id
+            # Insert into recent_search table and get recent_search_id,
+            # or if the user has made the same search before, mark it as the most recent
             query = (
-                insert(RecentSearch)
-                .values({"user_id": user_id, "location_id": location_id})
-                .returning(RecentSearch.id)
+                pg_insert(RecentSearch)
+                .values(
+                    {
+                        "user_id": user_id,
+                        "location_id": location_id,
+                        "search_key": self.get_recent_search_key(
+                            location_id=location_id,
+                            record_categories=record_categories,
+                            record_types=record_types,
+                        ),
+                    }
+                )
+                .on_conflict_do_update(
+                    index_elements=[RecentSearch.user_id, RecentSearch.search_key],
+                    set_={"last_searched_at": func.now()},
+                )
+                # `xmax` is only zero for newly inserted rows
+                .returning(RecentSearch.id, literal_column("xmax = 0"))
             )
-            result = self.session.execute(query)
-            recent_search_id = result.fetchone()[0]
+            recent_search_id, is_new_search = self.session.execute(query).one()
+            if not is_new_search:
+                # The existing search is already linked to its record categories and types
+                return
 
             if record_categories is not None:
                 self.insert_record_category_search_records(
@@ -1630,6 +2015,24 @@ class DatabaseClient:
             if record_types is not None:
                 self.insert_record_type_search_records(recent_search_id, record_types)
 
+    @staticmethod
+    def get_recent_search_key(
+        location_id: int,
+        record_categories: Optional[list[RecordCategories]] = None,
+        record_types: Optional[list[RecordTypes]] = None,
+    ) -> str:
+        """
+        Identifies a search by its location and its set of record categories and types,
+        in the form `<location_id>:<record categories>:<record types>`
+        """
+        return ":".join(
+            [
+                str(location_id),
+                ",".join(sorted({rc.value for rc in record_categories or []})),
+                ",".join(sorted({rt.value for rt in record_types or []})),
+            ]
+        )
+
     def insert_record_type_search_records(self, recent_search_id, record_types):
         # For all record types, insert into link table
         for record_type in record_types:
@@ -1668,6 +2071,9 @@ class DatabaseClient:
                 "record_categories",
             ],
             where_mappings={"user_id": user_id},
+            order_by=OrderByParameters(
+                sort_by="last_searched_at", sort_order=SortOrder.DESCENDING
+            ),
             build_metadata=True,
         )
 
@@ -1716,9 +2122,101 @@ class DatabaseClient:
                 "created_at",
             ],
             where_mappings={"table_name": table.value},
+            order_by=OrderByParameters(sort_by="id"),
             apply_uniqueness_constraints=False,
         )
 
+    @cursor_manager()
+    def create_monthly_partitions(self, table: Relations, months_ahead: int) -> None:
+        """
+        Creates any missing monthly partitions of a partitioned log table,
+        from the current month through the given number of months ahead
+        :param table: The partitioned log table
+        :param months_ahead: The number of months following the current month
+        """
+        query = sql.SQL(
+            """
+            SELECT create_monthly_partition(
+                {table_name},
+                (date_trunc('month', now()) + make_interval(months => month_offset))::date
+            )
+            FROM generate_series(0, {months_ahead}) month_offset
+            """
+        ).format(
+            table_name=sql.Literal(table.value),
+            months_ahead=sql.Literal(months_ahead),
+        )
+        self.cursor.execute(query)
+
+    @cursor_manager()
+    def drop_expired_partitions(
+        self, table: Relations, retention_months: int
+    ) -> list[str]:
+        """
+        Drops the monthly partitions of a partitioned log table
+        which precede the retention period
+        :param table: The partitioned log table
+        :param retention_months: The number of months, preceding the current month, to retain
+        :return: The names of the dropped partitions
+        """
+        query = sql.SQL(
+            "SELECT drop_expired_partitions({table_name}, {retention_months}) AS partition_name"
+        ).format(
+            table_name=sql.Literal(table.value),
+            retention_months=sql.Literal(retention_months),
+        )
+        self.cursor.execute(query)
+        return [result["partition_name"] for result in self.cursor.fetchall()]
+
+    @cursor_manager()
+    def get_changes(
+        self,
+        since: Optional[ChangeFeedCursor] = None,
+        tables: Optional[list[Relations]] = None,
+        limit: int = CHANGE_FEED_DEFAULT_LIMIT,
+    ) -> list[dict]:
+        """
+        Get changes from the change feed, in cursor order
+        :param since: If provided, only changes following this cursor are returned
+        :param tables: If provided, only changes to these tables are returned
+        :param limit: The maximum number of changes to return
+        :return: Change feed rows, each with its `cursor`
+        """
+        query = DynamicQueryConstructor.get_change_feed_query(
+            since=since,
+            table_names=None if tables is None else [table.value for table in tables],
+            limit=limit,
+        )
+        self.cursor.execute(query)
+        results = self.cursor.fetchall()
+        for result in results:
+            result["cursor"] = ChangeFeedCursor(
+                transaction_id=result.pop("transaction_id"), id=result.pop("id")
+            )
+        return results
+
+    @cursor_manager()
+    def is_change_feed_cursor_retained(self, cursor: ChangeFeedCursor) -> bool:
+        """
+        Check whether the changes following the cursor are all still retained.
+        The change a cursor follows is only removed when its partition expires,
+        along with every change preceding it, so if no change at or before the cursor
+        remains, changes following it may have been removed as well.
+        """
+        query = sql.SQL(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM change_feed
+                WHERE (transaction_id, id) <= ({transaction_id}, {id})
+            ) AS retained
+            """
+        ).format(
+            transaction_id=sql.Literal(cursor.transaction_id),
+            id=sql.Literal(cursor.id),
+        )
+        self.cursor.execute(query)
+        return self.cursor.fetchone()["retained"]
+
     @session_manager
     def get_users(self, page: int) -> List[UsersWithPermissions]:
         raw_results = self.session.execute(
@@ -1829,15 +2327,19 @@ class DatabaseClient:
         self,
         name: str,
         location_id: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
     ) -> List[AgencyMatchResponseInnerDTO]:
         """
         Retrieve agencies similar to the query
         Optionally filtering based on the location id
+
+        An agency whose name matches the query exactly (ignoring case) is returned alone.
+        Otherwise, the ten agencies with the nearest names are returned,
+        ordered by trigram distance so they can be read from the trigram index.
+        :param similarity_threshold: If provided, only agencies with a similarity
+            to the query of at least this value (between 0 and 1) are returned.
         """
-        query = Select(
-            Agency,
-            func.similarity(Agency.name, name),
-        ).options(
+        load_options = [
             load_only(Agency.id, Agency.name, Agency.agency_type),
             selectinload(Agency.locations).load_only(
                 LocationExpanded.state_name,
@@ -1845,15 +2347,12 @@ class DatabaseClient:
                 LocationExpanded.locality_name,
                 LocationExpanded.type,
             ),
-        )
-        if location_id is not None:
-            query = query.where(
-                Agency.locations.any(LocationExpanded.id == location_id)
-            )
-        query = query.order_by(func.similarity(Agency.name, name).desc()).limit(10)
-        execute_results = self.session.execute(query).all()
-        if len(execute_results) == 0:
-            return []
+        ]
+
+        def filter_by_location(query: Select) -> Select:
+            if location_id is None:
+                return query
+            return query.where(Agency.locations.any(LocationExpanded.id == location_id))
 
         def result_to_dto(agency: Agency, similarity: float):
             locations = []
@@ -1874,6 +2373,33 @@ class DatabaseClient:
                 locations=locations,
             )
 
+        exact_match_query = filter_by_location(
+            select(Agency)
+            .options(*load_options)
+            .where(func.lower(Agency.name) == func.lower(name))
+            .order_by(Agency.id)
+            .limit(1)
+        )
+        exact_match = self.session.execute(exact_match_query).scalars().first()
+        if exact_match is not None:
+            return [result_to_dto(exact_match, 1)]
+
+        query = filter_by_location(
+            select(Agency, func.similarity(Agency.name, name)).options(*load_options)
+        )
+        if similarity_threshold is not None:
+            # The % operator compares against this setting, for the current transaction only
+            self.session.execute(
+                select(
+                    func.set_config(
+                        "pg_trgm.similarity_threshold", str(similarity_threshold), True
+                    )
+                )
+            )
+            query = query.where(Agency.name.op("%")(name))
+        query = query.order_by(Agency.name.op("<->")(name)).limit(10)
+        execute_results = self.session.execute(query).all()
+
         dto_results = []
         for result, similarity in execute_results:
             if similarity == 1:
@@ -1885,52 +2411,204 @@ class DatabaseClient:
 
         return dto_results
 
-    def get_metrics(self):
-        result = self.execute_raw_sql(
-            """
-            SELECT
-                COUNT(*),
-                'source_count' "Count Type"
-            FROM
-                DATA_SOURCES
-            UNION
-            SELECT
-                COUNT(DISTINCT (AGENCY_ID)),
-                'agency_count' "Count Type"
-            FROM
-                link_agencies_data_sources
-            UNION
+    @cursor_manager()
+    def get_similar_agencies_batch(
+        self, entries: list[AgencyMatchRequestDTO]
+    ) -> list[list[AgencyMatchResponseInnerDTO]]:
+        """
+        Retrieve agencies similar to each of the entries, in a single query.
+        Locations are resolved for all entries at once,
+        and each entry is matched against the trigram index through a lateral join.
+
+        Follows the same rules as get_similar_agencies: an entry whose location
+        cannot be resolved has no matches, and an exact match is returned alone.
+        :return: The matching agencies for each entry, in the same order as the entries.
+        """
+        entries_json = json.dumps(
+            [
+                {
+                    "row_id": row_id,
+                    "name": entry.name,
+                    "state": entry.state,
+                    "county": entry.county,
+                    "locality": entry.locality,
+                    "has_location_data": entry.has_location_data(),
+                }
+                for row_id, entry in enumerate(entries)
+            ]
+        )
+        query = """
+            WITH entries AS (
+                SELECT *
+                FROM jsonb_to_recordset(%s::jsonb) AS e(
+                    row_id int,
+                    name text,
+                    state text,
+                    county text,
+                    locality text,
+                    has_location_data boolean
+                )
+            ),
+            resolved_entries AS (
+                SELECT e.*, l.id AS location_id
+                FROM entries e
+                LEFT JOIN LATERAL (
+                    SELECT le.id
+                    FROM locations_expanded le
+                    WHERE le.state_name IS NOT DISTINCT FROM e.state
+                        AND le.county_name IS NOT DISTINCT FROM e.county
+                        AND le.locality_name IS NOT DISTINCT FROM e.locality
+                    LIMIT 1
+                ) l ON TRUE
+            )
             SELECT
-                COUNT(DISTINCT L.ID),
-                'state_count' "Count Type"
-            FROM
-                LINK_AGENCIES_DATA_SOURCES LINK
-                INNER JOIN AGENCIES A ON A.ID = LINK.AGENCY_ID
-                LEFT JOIN LINK_AGENCIES_LOCATIONS LAL on A.ID = LAL.AGENCY_ID
-                JOIN DEPENDENT_LOCATIONS DL ON LAL.LOCATION_ID = DL.DEPENDENT_LOCATION_ID
-                JOIN LOCATIONS L ON L.ID = LAL.LOCATION_ID
-                OR L.ID = DL.PARENT_LOCATION_ID
-            WHERE
-                L.TYPE = 'State'
-            UNION
+                r.row_id,
+                m.id,
+                m.name,
+                m.agency_type,
+                m.similarity,
+                (
+                    SELECT COALESCE(
+                        json_agg(
+                            json_build_object(
+                                'state', le.state_name,
+                                'county', le.county_name,
+                                'locality', le.locality_name,
+                                'location_type', le.type
+                            )
+                        ),
+                        '[]'::json
+                    )
+                    FROM link_agencies_locations lal
+                    INNER JOIN locations_expanded le ON le.id = lal.location_id
+                    WHERE lal.agency_id = m.id
+                ) AS locations
+            FROM resolved_entries r
+            INNER JOIN LATERAL (
+                SELECT
+                    a.id,
+                    a.name,
+                    a.agency_type,
+                    similarity(a.name, r.name) AS similarity,
+                    a.name <-> r.name AS distance
+                FROM agencies a
+                WHERE r.location_id IS NULL
+                    OR EXISTS (
+                        SELECT 1
+                        FROM link_agencies_locations lal
+                        WHERE lal.agency_id = a.id
+                            AND lal.location_id = r.location_id
+                    )
+                ORDER BY a.name <-> r.name
+                LIMIT 10
+            ) m ON r.location_id IS NOT NULL OR NOT r.has_location_data
+            ORDER BY r.row_id, m.distance, m.id
+        """
+        self.cursor.execute(query, (entries_json,))
+
+        results: list[list[AgencyMatchResponseInnerDTO]] = [[] for _ in entries]
+        for row in self.cursor.fetchall():
+            matches = results[row["row_id"]]
+            # Matches are ordered by distance, so an exact match comes first and is returned alone
+            if len(matches) > 0 and matches[0].similarity == 1:
+                continue
+            dto = AgencyMatchResponseInnerDTO(
+                id=row["id"],
+                name=row["name"],
+                agency_type=AgencyType(row["agency_type"]),
+                similarity=row["similarity"],
+                locations=[
+                    AgencyMatchResponseLocationDTO(
+                        state=location["state"],
+                        county=location["county"],
+                        locality=location["locality"],
+                        location_type=LocationType(location["location_type"]),
+                    )
+                    for location in row["locations"]
+                ],
+            )
+            matches.append(dto)
+
+        return results
+
+    METRICS_SNAPSHOT_ID = 1
+
+    @cursor_manager()
+    def refresh_metrics_snapshot(self) -> dict:
+        """
+        Recomputes the application metrics and stores them in the metrics snapshot.
+
+        State and county counts are computed in a single pass
+        over the set of locations covered by agencies with data sources,
+        where an agency covers its own locations and their parent locations.
+
+        :return: The refreshed metrics snapshot.
+        """
+        query = """
+            WITH linked_agencies AS (
+                SELECT DISTINCT agency_id
+                FROM link_agencies_data_sources
+            ),
+            agency_locations AS (
+                SELECT lal.location_id
+                FROM linked_agencies la
+                INNER JOIN link_agencies_locations lal ON lal.agency_id = la.agency_id
+            ),
+            coverage AS (
+                SELECT location_id FROM agency_locations
+                UNION
+                SELECT dl.parent_location_id
+                FROM agency_locations al
+                INNER JOIN dependent_locations dl ON dl.dependent_location_id = al.location_id
+            ),
+            location_counts AS (
+                SELECT
+                    COUNT(*) FILTER (WHERE l.type = 'State') AS state_count,
+                    COUNT(*) FILTER (WHERE l.type = 'County') AS county_count
+                FROM coverage c
+                INNER JOIN locations l ON l.id = c.location_id
+            )
+            INSERT INTO metrics_snapshot (
+                id, source_count, agency_count, state_count, county_count, computed_at
+            )
             SELECT
-                COUNT(DISTINCT L.ID),
-                'county_count' "Count Type"
-            FROM
-                LINK_AGENCIES_DATA_SOURCES LINK
-                INNER JOIN AGENCIES A ON A.ID = LINK.AGENCY_ID
-                LEFT JOIN LINK_AGENCIES_LOCATIONS LAL on A.ID = LAL.AGENCY_ID
-                JOIN DEPENDENT_LOCATIONS DL ON LAL.LOCATION_ID = DL.DEPENDENT_LOCATION_ID
-                JOIN LOCATIONS L ON L.ID = LAL.LOCATION_ID
-                OR L.ID = DL.PARENT_LOCATION_ID
-            WHERE
-                L.TYPE = 'County'
-	"""
+                %(id)s,
+                (SELECT COUNT(*) FROM data_sources),
+                (SELECT COUNT(*) FROM linked_agencies),
+                lc.state_count,
+                lc.county_count,
+                now()
+            FROM location_counts lc
+            ON CONFLICT (id) DO UPDATE SET
+                source_count = EXCLUDED.source_count,
+                agency_count = EXCLUDED.agency_count,
+                state_count = EXCLUDED.state_count,
+                county_count = EXCLUDED.county_count,
+                computed_at = EXCLUDED.computed_at
+            RETURNING source_count, agency_count, state_count, county_count, computed_at
+        """
+        self.cursor.execute(query, {"id": self.METRICS_SNAPSHOT_ID})
+        return self.cursor.fetchone()
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the most recent metrics snapshot,
+        computing it first if no snapshot exists.
+        """
+        result = self._select_single_entry_from_relation(
+            relation_name=Relations.METRICS_SNAPSHOT.value,
+            columns=[
+                "source_count",
+                "agency_count",
+                "state_count",
+                "county_count",
+                "computed_at",
+            ],
+            where_mappings={"id": self.METRICS_SNAPSHOT_ID},
         )
-        d = {}
-        for row in result:
-            d[row["Count Type"]] = row["count"]
-        return d
+        if result is None:
+            return self.refresh_metrics_snapshot()
+        return result
 
     @session_manager
     def get_record_types_and_categories(self):
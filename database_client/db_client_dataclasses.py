@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
 from pydantic import BaseModel
+from sqlalchemy import bindparam
 from sqlalchemy.sql.expression import UnaryExpression
 from sqlalchemy.schema import Column
 from sqlalchemy.sql.expression import asc, desc, BinaryExpression
@@ -81,6 +82,33 @@ class WhereMapping:
         relation_reference = SQL_ALCHEMY_TABLE_REFERENCE[relation]
         return getattr(relation_reference, self.column).in_(self.value)
 
+    @property
+    def shape(self) -> tuple:
+        """
+        The parts of the mapping which determine the structure of its where clause,
+        independent of the value being compared against.
+        """
+        return self.column, self.eq, isinstance(self.value, list), self.value is None
+
+    def build_where_clause_template(
+        self, relation: str, parameter_name: str
+    ) -> BinaryExpression:
+        """Creates a SQLAlchemy BinaryExpression with the value replaced by a bound parameter,
+        so that the expression can be reused for any value of the same shape.
+
+        :param relation:
+        :param parameter_name: The name of the bound parameter to compare against.
+        :return: BinaryExpression. Example: Agency.municipality == :where_0
+        """
+        column = getattr(SQL_ALCHEMY_TABLE_REFERENCE[relation], self.column)
+        if isinstance(self.value, list):
+            return column.in_(bindparam(parameter_name, expanding=True))
+        if self.value is None:
+            return column.is_(None) if self.eq else column.is_not(None)
+        if self.eq:
+            return column == bindparam(parameter_name)
+        return column != bindparam(parameter_name)
+
     @staticmethod
     def from_dict(d: dict) -> list["WhereMapping"]:
         results = []
@@ -89,3 +117,29 @@ class WhereMapping:
                 value = value.value
             results.append(WhereMapping(column=key, value=value))
         return results
+
+
+@dataclass(frozen=True, order=True)
+class ChangeFeedCursor:
+    """
+    A position in the change feed, following the change with the given
+    transaction id and id. Changes are ordered by transaction id, then id.
+
+    Serialized as "<transaction_id>-<id>".
+    """
+
+    transaction_id: int
+    id: int
+
+    def __str__(self):
+        return f"{self.transaction_id}-{self.id}"
+
+    @staticmethod
+    def from_string(s: str) -> "ChangeFeedCursor":
+        """
+        :raises ValueError: If the string is not a valid cursor.
+        """
+        transaction_id, separator, id_ = s.partition("-")
+        if separator == "" or not transaction_id.isdigit() or not id_.isdigit():
+            raise ValueError(f"Invalid change feed cursor: {s}")
+        return ChangeFeedCursor(transaction_id=int(transaction_id), id=int(id_))
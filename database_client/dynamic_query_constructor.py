@@ -1,19 +1,22 @@
 import uuid
 from collections import namedtuple
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Any, Optional
 
 from psycopg import sql
-from sqlalchemy import select
+from sqlalchemy import select, Select, bindparam, Integer, func, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import load_only, InstrumentedAttribute, aliased, selectinload
-from sqlalchemy.schema import Column
+from sqlalchemy.sql.expression import ColumnElement, FromClause, ScalarSelect
 from sqlalchemy.sql.util import join_condition
 
 from database_client.constants import (
     DATA_SOURCES_APPROVED_COLUMNS,
     ARCHIVE_INFO_APPROVED_COLUMNS,
+    AGENCIES_PROJECTION_COLUMNS,
 )
 from database_client.db_client_dataclasses import (
+    ChangeFeedCursor,
     OrderByParameters,
     WhereMapping,
 )
@@ -25,12 +28,46 @@ from database_client.models import (
     DataSourceExpanded,
     DataRequest,
     DataRequestExpanded,
+    LinkAgencyDataSource,
+    LinkAgencyLocation,
+    LinkDataSourceDataRequest,
+    LocationExpanded,
 )
 from middleware.enums import RecordTypes, Relations
+from middleware.query_observability import fingerprint_query
 from utilities.enums import RecordCategories
 
 TableColumn = namedtuple("TableColumn", ["table", "column"])
 TableColumnAlias = namedtuple("TableColumnAlias", ["table", "column", "alias"])
+SelectionQueryShape = namedtuple(
+    "SelectionQueryShape",
+    [
+        "relation",
+        "columns",
+        "where_mappings",
+        "has_limit",
+        "has_offset",
+        "order_by",
+        "subquery_parameters",
+        "alias_mappings",
+    ],
+)
+SelectionQuery = namedtuple("SelectionQuery", ["statement", "parameters"])
+
+# Selection queries come from a small, fixed set of endpoints,
+# so the cache is only cleared as a safeguard against unbounded growth
+SELECTION_QUERY_CACHE_SIZE = 256
+_SELECTION_QUERY_CACHE: dict[SelectionQueryShape, Select] = {}
+
+# Agency jurisdiction types grouped under the locality jurisdiction in search results
+LOCALITY_JURISDICTION_TYPES = [
+    "local",
+    "school",
+    "military",
+    "tribal",
+    "transit",
+    "port",
+]
 
 
 class DynamicQueryConstructor:
@@ -116,6 +153,174 @@ class DynamicQueryConstructor:
 
         return load_options
 
+    @staticmethod
+    def build_json_object(pairs: dict[str, ColumnElement]) -> ColumnElement:
+        """
+        Builds a json_build_object call from a mapping of keys to column expressions
+        :param pairs: Keys are column names, and so are safe to render as literals
+        :return: Example: json_build_object('id', agencies.id, 'name', agencies.name)
+        """
+        arguments = []
+        for key, value in pairs.items():
+            arguments.extend([literal_column(f"'{key}'"), value])
+        return func.json_build_object(*arguments)
+
+    @staticmethod
+    def build_json_array_subquery(
+        json_object: ColumnElement,
+        order_by: ColumnElement,
+        select_from: FromClause,
+        where: ColumnElement,
+    ) -> ScalarSelect:
+        """
+        Builds a correlated subquery aggregating the given json objects into a json array,
+        which is empty rather than null if no rows match
+        """
+        return (
+            select(
+                func.coalesce(
+                    func.json_agg(aggregate_order_by(json_object, order_by)),
+                    literal_column("'[]'::json"),
+                )
+            )
+            .select_from(select_from)
+            .where(where)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def build_agency_locations_json_array() -> ScalarSelect:
+        """
+        Builds a json array of location info for each location linked to an Agency,
+        in the format of ResultFormatter.location_to_location_info
+        """
+        return DynamicQueryConstructor.build_json_array_subquery(
+            json_object=DynamicQueryConstructor.build_json_object(
+                {
+                    "type": LocationExpanded.type,
+                    "location_id": LocationExpanded.id,
+                    "state_iso": LocationExpanded.state_iso,
+                    "state_name": LocationExpanded.state_name,
+                    "county_name": LocationExpanded.county_name,
+                    "county_fips": LocationExpanded.county_fips,
+                    "locality_name": LocationExpanded.locality_name,
+                    "display_name": LocationExpanded.display_name,
+                }
+            ),
+            order_by=LocationExpanded.id,
+            select_from=LinkAgencyLocation.__table__.join(
+                LocationExpanded,
+                LinkAgencyLocation.location_id == LocationExpanded.id,
+            ),
+            where=LinkAgencyLocation.agency_id == Agency.id,
+        )
+
+    @staticmethod
+    @fingerprint_query
+    def create_agencies_projection_query(
+        requested_columns: Optional[list[str]],
+        order_by_clause: ColumnElement,
+        limit: int,
+        offset: int,
+    ) -> Select:
+        """
+        Creates a query for GET /agencies which builds linked data sources and locations
+        as json in the database, rather than loading ORM instances
+        """
+        if requested_columns is not None:
+            columns = convert_to_column_reference(
+                columns=requested_columns, relation=Relations.AGENCIES.value
+            )
+        else:
+            columns = [
+                getattr(Agency, column) for column in AGENCIES_PROJECTION_COLUMNS
+            ] + [Agency.name.label("submitted_name")]
+
+        data_sources = DynamicQueryConstructor.build_json_array_subquery(
+            json_object=DynamicQueryConstructor.build_json_object(
+                {"id": DataSourceExpanded.id, "name": DataSourceExpanded.name}
+            ),
+            order_by=DataSourceExpanded.id,
+            select_from=LinkAgencyDataSource.__table__.join(
+                DataSourceExpanded,
+                LinkAgencyDataSource.data_source_id == DataSourceExpanded.id,
+            ),
+            where=LinkAgencyDataSource.agency_id == Agency.id,
+        )
+        locations = DynamicQueryConstructor.build_agency_locations_json_array()
+
+        return (
+            select(
+                *columns,
+                data_sources.label("data_sources"),
+                locations.label("locations"),
+            )
+            .order_by(order_by_clause)
+            .limit(limit)
+            .offset(offset)
+        )
+
+    @staticmethod
+    @fingerprint_query
+    def create_data_sources_projection_query(
+        data_sources_columns: list[str],
+        data_requests_columns: list[str],
+        order_by_clause: ColumnElement,
+        limit: int,
+        offset: int,
+    ) -> Select:
+        """
+        Creates a query for GET /data-sources which builds linked agencies,
+        their locations, and linked data requests as json in the database,
+        rather than loading ORM instances
+        """
+        data_requests = DynamicQueryConstructor.build_json_array_subquery(
+            json_object=DynamicQueryConstructor.build_json_object(
+                {
+                    column: getattr(DataRequestExpanded, column)
+                    for column in data_requests_columns
+                }
+            ),
+            order_by=DataRequestExpanded.id,
+            select_from=LinkDataSourceDataRequest.__table__.join(
+                DataRequestExpanded,
+                LinkDataSourceDataRequest.request_id == DataRequestExpanded.id,
+            ),
+            where=LinkDataSourceDataRequest.data_source_id == DataSourceExpanded.id,
+        )
+        agencies = DynamicQueryConstructor.build_json_array_subquery(
+            json_object=DynamicQueryConstructor.build_json_object(
+                {
+                    "id": Agency.id,
+                    "name": Agency.name,
+                    "submitted_name": Agency.name,
+                    "jurisdiction_type": Agency.jurisdiction_type,
+                    "agency_type": Agency.agency_type,
+                    "homepage_url": Agency.homepage_url,
+                    "locations": DynamicQueryConstructor.build_agency_locations_json_array(),
+                }
+            ),
+            order_by=Agency.id,
+            select_from=LinkAgencyDataSource.__table__.join(
+                Agency, LinkAgencyDataSource.agency_id == Agency.id
+            ),
+            where=LinkAgencyDataSource.data_source_id == DataSourceExpanded.id,
+        )
+
+        return (
+            select(
+                *[
+                    getattr(DataSourceExpanded, column)
+                    for column in data_sources_columns
+                ],
+                data_requests.label("data_requests"),
+                agencies.label("agencies"),
+            )
+            .order_by(order_by_clause)
+            .limit(limit)
+            .offset(offset)
+        )
+
     @staticmethod
     def get_sql_alchemy_order_by_clause(
         order_by: OrderByParameters, relation: str, default
@@ -163,6 +368,37 @@ class DynamicQueryConstructor:
         ).format(fields=fields)
         return sql_query
 
+    @staticmethod
+    @fingerprint_query
+    def build_data_sources_for_map_query() -> sql.SQL:
+        return sql.SQL(
+            """
+            SELECT
+                DATA_SOURCES.id AS DATA_SOURCE_ID,
+                LE.ID as LOCATION_ID,
+                DATA_SOURCES.NAME,
+                AGENCIES.ID AS AGENCY_ID,
+                AGENCIES.NAME AS AGENCY_NAME,
+                LE.STATE_ISO,
+                LE.LOCALITY_NAME AS MUNICIPALITY,
+                LE.COUNTY_NAME,
+                RT.NAME RECORD_TYPE,
+                AGENCIES.LAT,
+                AGENCIES.LNG
+            FROM
+                LINK_AGENCIES_DATA_SOURCES AS AGENCY_SOURCE_LINK
+                INNER JOIN DATA_SOURCES ON AGENCY_SOURCE_LINK.DATA_SOURCE_ID = DATA_SOURCES.ID
+                INNER JOIN AGENCIES ON AGENCY_SOURCE_LINK.AGENCY_ID = AGENCIES.ID
+                INNER JOIN LINK_AGENCIES_LOCATIONS LAL ON AGENCIES.ID = LAL.AGENCY_ID
+                LEFT JOIN LOCATIONS_EXPANDED LE ON LAL.LOCATION_ID = LE.ID
+                INNER JOIN RECORD_TYPES RT ON RT.ID = DATA_SOURCES.RECORD_TYPE_ID
+            WHERE
+                DATA_SOURCES.APPROVAL_STATUS = 'approved'
+                AND LAT is not null
+                AND LNG is not null
+        """
+        )
+
     @staticmethod
     def zip_needs_identification_data_source_results(
         results: list[tuple],
@@ -178,6 +414,7 @@ class DynamicQueryConstructor:
         ]
 
     @staticmethod
+    @fingerprint_query
     def generate_fuzzy_match_typeahead_locations_query(
         search_term: str,
     ) -> sql.Composed:
@@ -198,6 +435,7 @@ class DynamicQueryConstructor:
         return query
 
     @staticmethod
+    @fingerprint_query
     def generate_like_typeahead_locations_query(search_term: str) -> sql.Composed:
         query = sql.SQL(
             """
@@ -247,6 +485,7 @@ class DynamicQueryConstructor:
         return query
 
     @staticmethod
+    @fingerprint_query
     def generate_new_typeahead_agencies_query(search_term: str):
         query = sql.SQL(
             """
@@ -302,6 +541,7 @@ class DynamicQueryConstructor:
         return query
 
     @staticmethod
+    @fingerprint_query
     def create_federal_search_query(
         record_categories: Optional[list[RecordCategories]] = None,
         page: int = 1,
@@ -370,6 +610,7 @@ class DynamicQueryConstructor:
         return query
 
     @staticmethod
+    @fingerprint_query
     def create_search_query(
         location_id: int,
         record_categories: Optional[list[RecordCategories]] = None,
@@ -458,6 +699,72 @@ class DynamicQueryConstructor:
 
         return query
 
+    @staticmethod
+    @fingerprint_query
+    def create_grouped_search_query(
+        location_id: int,
+        record_categories: Optional[list[RecordCategories]] = None,
+        record_types: Optional[list[RecordTypes]] = None,
+        per_jurisdiction_limit: Optional[int] = None,
+        per_jurisdiction_offset: int = 0,
+    ) -> sql.Composed:
+        """
+        Wraps the search query to group its results by simplified jurisdiction
+        (federal, state, county, or locality).
+        Returns one row per jurisdiction with results, containing the jurisdiction,
+        the total count of its results, and the requested page of its results as json.
+        """
+        search_query = DynamicQueryConstructor.create_search_query(
+            location_id=location_id,
+            record_categories=record_categories,
+            record_types=record_types,
+        )
+        return sql.SQL(
+            """
+            WITH results AS (
+                {search_query}
+            ),
+            numbered_results AS (
+                SELECT
+                    grouped_results.*,
+                    row_number() OVER (
+                        PARTITION BY grouped_results.jurisdiction
+                        ORDER BY grouped_results.id, grouped_results.agency_name
+                    ) AS jurisdiction_row
+                FROM (
+                    SELECT
+                        results.*,
+                        CASE
+                            WHEN results.jurisdiction_type::text = ANY({locality_jurisdiction_types})
+                            THEN 'locality'
+                            ELSE results.jurisdiction_type::text
+                        END AS jurisdiction
+                    FROM results
+                ) grouped_results
+            )
+            SELECT
+                jurisdiction,
+                count(*) AS count,
+                COALESCE(
+                    json_agg(
+                        to_jsonb(numbered_results) - 'jurisdiction' - 'jurisdiction_row'
+                        ORDER BY jurisdiction_row
+                    ) FILTER (
+                        WHERE jurisdiction_row > {offset}
+                        AND ({limit}::integer IS NULL OR jurisdiction_row <= {offset} + {limit}::integer)
+                    ),
+                    '[]'::json
+                ) AS results
+            FROM numbered_results
+            GROUP BY jurisdiction
+            """
+        ).format(
+            search_query=search_query,
+            locality_jurisdiction_types=sql.Literal(LOCALITY_JURISDICTION_TYPES),
+            offset=sql.Literal(per_jurisdiction_offset),
+            limit=sql.Literal(per_jurisdiction_limit),
+        )
+
     @staticmethod
     def create_update_query(
         table_name: str,
@@ -549,63 +856,191 @@ class DynamicQueryConstructor:
     @staticmethod
     def create_selection_query(
         relation: str,
-        columns: list[Column],
+        columns: list[str],
         where_mappings: Optional[list[WhereMapping] | dict] = [True],
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         order_by: Optional[OrderByParameters] = None,
         subquery_parameters: Optional[list[SubqueryParameters]] = [],
         alias_mappings: Optional[dict[str, str]] = None,
-    ) -> Callable:
+    ) -> SelectionQuery:
         """
         Creates a SELECT query for a relation (table or view)
-        that selects the given columns with the given where mappings
-        :param columns: List of database column references. Example: [User.name, User.email]
+        that selects the given columns with the given where mappings.
+
+        Statements are cached by the shape of the query,
+        with where values, limit and offset supplied as bound parameters,
+        so that repeated queries of the same shape reuse the same statement.
+        :param columns: List of column names. Example: ["name", "email"]
         :param where_mappings: List of WhereMapping objects for conditional selection.
         :param limit:
         :param offset:
         :param order_by:
         :param subquery_parameters: List of SubqueryParameters objects for executing subqueries.
-        :return:
+        :return: The statement, and the parameters to execute it with.
         """
         if len(columns) == 0:
             raise ValueError("No columns provided")
         if type(where_mappings) == dict:
-            where_mappings = [
-                WhereMapping(
-                    column=list(where_mappings.keys())[0],
-                    value=list(where_mappings.values())[0],
-                )
-            ]
-        if where_mappings != [True]:
-            where_mappings = [
-                mapping.build_where_clause(relation) for mapping in where_mappings
-            ]
-        if order_by is not None:
-            order_by = order_by.build_order_by_clause(relation)
+            where_mappings = WhereMapping.from_dict(where_mappings)
+        if where_mappings == [True]:
+            where_mappings = []
+        subquery_parameters = subquery_parameters or []
+
+        shape = SelectionQueryShape(
+            relation=relation,
+            columns=tuple(columns),
+            where_mappings=tuple(mapping.shape for mapping in where_mappings),
+            has_limit=limit is not None,
+            has_offset=offset is not None,
+            order_by=(
+                None if order_by is None else (order_by.sort_by, order_by.sort_order)
+            ),
+            subquery_parameters=tuple(
+                parameter.shape for parameter in subquery_parameters
+            ),
+            alias_mappings=(
+                None
+                if alias_mappings is None
+                else tuple(sorted(alias_mappings.items()))
+            ),
+        )
+        statement = _SELECTION_QUERY_CACHE.get(shape)
+        if statement is None:
+            statement = DynamicQueryConstructor._build_selection_query_template(
+                relation=relation,
+                columns=columns,
+                where_mappings=where_mappings,
+                has_limit=shape.has_limit,
+                has_offset=shape.has_offset,
+                order_by=order_by,
+                subquery_parameters=subquery_parameters,
+                alias_mappings=alias_mappings,
+            )
+            if len(_SELECTION_QUERY_CACHE) >= SELECTION_QUERY_CACHE_SIZE:
+                _SELECTION_QUERY_CACHE.clear()
+            _SELECTION_QUERY_CACHE[shape] = statement
+
+        parameters = {
+            f"where_{index}": mapping.value
+            for index, mapping in enumerate(where_mappings)
+            if mapping.value is not None
+        }
+        if limit is not None:
+            parameters["limit"] = limit
+        if offset is not None:
+            parameters["offset"] = offset
+        return SelectionQuery(statement=statement, parameters=parameters)
+
+    @staticmethod
+    def _build_selection_query_template(
+        relation: str,
+        columns: list[str],
+        where_mappings: list[WhereMapping],
+        has_limit: bool,
+        has_offset: bool,
+        order_by: Optional[OrderByParameters],
+        subquery_parameters: list[SubqueryParameters],
+        alias_mappings: Optional[dict[str, str]],
+    ) -> Select:
+        column_references = convert_to_column_reference(
+            columns=columns, relation=relation
+        )
+        where_clauses = [
+            mapping.build_where_clause_template(relation, f"where_{index}")
+            for index, mapping in enumerate(where_mappings)
+        ]
         load_options = []
         if subquery_parameters:
             for parameter in subquery_parameters:
                 load_options.append(parameter.build_subquery_load_option(relation))
-            load_options.append(load_only(*columns))
+            load_options.append(load_only(*column_references))
             primary_relation_columns = [SQL_ALCHEMY_TABLE_REFERENCE[relation]]
         else:
-            primary_relation_columns = columns
+            primary_relation_columns = column_references
 
         if alias_mappings is not None:
             primary_relation_columns = DynamicQueryConstructor.apply_alias_mappings(
-                columns, alias_mappings
+                column_references, alias_mappings
             )
 
-        base_query = (
-            lambda: select(*primary_relation_columns)
+        statement = (
+            select(*primary_relation_columns)
             .options(*load_options)
-            .where(*where_mappings)
-            .order_by(order_by)
-            .limit(limit)
-            .offset(offset)
+            .where(*where_clauses)
         )
-        return base_query
+        if order_by is not None:
+            statement = statement.order_by(order_by.build_order_by_clause(relation))
+        if has_limit:
+            statement = statement.limit(bindparam("limit", type_=Integer))
+        if has_offset:
+            statement = statement.offset(bindparam("offset", type_=Integer))
+        return statement
+
+    @staticmethod
+    @fingerprint_query
+    def create_linked_rows_query(
+        link_table: str,
+        left_id: Any,
+        left_link_column: str,
+        right_link_column: str,
+        linked_relation: str,
+        linked_relation_linking_column: str,
+        columns: list[str],
+        alias_mappings: Optional[dict[str, str]] = None,
+        subquery_parameters: Optional[list[SubqueryParameters]] = [],
+        limit: Optional[int] = None,
+        after: Optional[Any] = None,
+    ) -> Select:
+        """
+        Creates a SELECT query for rows in a linked relation
+        that are linked to the given left id via a link table.
+        :param link_table: The link table. Example: link_user_followed_location
+        :param left_id: The id to match in the link table's left link column
+        :param left_link_column: Example: user_id
+        :param right_link_column: Example: location_id
+        :param linked_relation: The relation to retrieve rows from. Example: locations_expanded
+        :param linked_relation_linking_column: The column in the linked relation joined to the right link column.
+        :param columns: Columns to retrieve from the linked relation
+        :param alias_mappings: Aliases for the retrieved columns
+        :param subquery_parameters: List of SubqueryParameters objects for executing subqueries.
+        :param limit:
+        :param after: Keyset value; only rows whose linking column is greater than this are selected
+        :return:
+        """
+        link_table_reference = SQL_ALCHEMY_TABLE_REFERENCE[link_table]
+        linked_relation_reference = SQL_ALCHEMY_TABLE_REFERENCE[linked_relation]
+        linking_column = getattr(
+            linked_relation_reference, linked_relation_linking_column
+        )
+        column_references = convert_to_column_reference(
+            columns=columns, relation=linked_relation
+        )
+
+        if subquery_parameters:
+            load_options = [
+                parameter.build_subquery_load_option(linked_relation)
+                for parameter in subquery_parameters
+            ]
+            load_options.append(load_only(*column_references))
+            query = select(linked_relation_reference).options(*load_options)
+        elif alias_mappings is not None:
+            query = select(
+                *DynamicQueryConstructor.apply_alias_mappings(
+                    column_references, alias_mappings
+                )
+            )
+        else:
+            query = select(*column_references)
+
+        query = query.join(
+            link_table_reference,
+            getattr(link_table_reference, right_link_column) == linking_column,
+        ).where(getattr(link_table_reference, left_link_column) == left_id)
+        if after is not None:
+            query = query.where(linking_column > after)
+
+        return query.order_by(linking_column).limit(limit)
 
     @staticmethod
     def build_where_subclauses_from_mappings(
@@ -706,17 +1141,70 @@ class DynamicQueryConstructor:
         )
 
     @staticmethod
-    def get_distinct_source_urls_query(url: str) -> sql.Composed:
+    @fingerprint_query
+    def get_url_duplicates_query(urls: list[str]) -> sql.Composed:
+        """
+        Get data sources whose normalized source url matches any of the given normalized urls
+        """
         query = sql.SQL(
             """
-            SELECT 
-                original_url,
+            SELECT DISTINCT
+                source_url_normalized AS base_url,
+                source_url AS original_url,
                 rejection_note,
                 approval_status
-            FROM distinct_source_urls
-            WHERE base_url = {url}
+            FROM data_sources
+            WHERE source_url_normalized = ANY({urls}::text[])
+            """
+        ).format(urls=sql.Literal(urls))
+        return query
+
+    @staticmethod
+    @fingerprint_query
+    def get_change_feed_query(
+        since: Optional[ChangeFeedCursor],
+        table_names: Optional[list[str]],
+        limit: int,
+    ) -> sql.Composed:
+        """
+        Get changes following the cursor, in cursor order.
+        Changes are excluded until every transaction with a lower transaction id has finished,
+        so that no change can later appear before a cursor that has already been returned.
+        """
+        conditions = [
+            sql.SQL(
+                "transaction_id < pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+            )
+        ]
+        if since is not None:
+            conditions.append(
+                sql.SQL("(transaction_id, id) > ({transaction_id}, {id})").format(
+                    transaction_id=sql.Literal(since.transaction_id),
+                    id=sql.Literal(since.id),
+                )
+            )
+        if table_names is not None:
+            conditions.append(
+                sql.SQL("table_name = ANY({table_names}::text[])").format(
+                    table_names=sql.Literal(table_names)
+                )
+            )
+        query = sql.SQL(
+            """
+            SELECT
+                id,
+                transaction_id,
+                table_name,
+                operation_type,
+                affected_id,
+                row_data,
+                created_at
+            FROM change_feed
+            WHERE {conditions}
+            ORDER BY transaction_id, id
+            LIMIT {limit}
             """
-        ).format(url=sql.Literal(url))
+        ).format(conditions=sql.SQL(" AND ").join(conditions), limit=sql.Literal(limit))
         return query
 
     @staticmethod
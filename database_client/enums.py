@@ -29,6 +29,30 @@ class ExternalAccountTypeEnum(Enum):
     GITHUB = "github"
 
 
+class SubqueryLoadStrategy(Enum):
+    """
+    Designates the SQLAlchemy loading strategy used to load a subquery's related rows
+    """
+
+    # Loads related rows in the same query via a join, repeating the parent row once per child
+    JOINED = "joined"
+    # Loads related rows in a second query, using an IN clause over the parent primary keys
+    SELECTIN = "selectin"
+    # Loads related rows in a second query, re-running the parent query as a subquery
+    SUBQUERY = "subquery"
+
+    @staticmethod
+    def from_expected_fan_out(expected_fan_out: int) -> "SubqueryLoadStrategy":
+        """
+        Selects a loading strategy based on the expected number of related rows per parent row.
+        A join is cheapest when each parent has at most one related row;
+        otherwise a separate query avoids transferring each parent row once per child.
+        """
+        if expected_fan_out <= 1:
+            return SubqueryLoadStrategy.JOINED
+        return SubqueryLoadStrategy.SELECTIN
+
+
 class SortOrder(Enum):
     """
     Designates the order in which sorted results should be returned
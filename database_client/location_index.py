@@ -0,0 +1,158 @@
+"""
+An in-memory index of locations, used to resolve location names to ids
+and to walk parent/dependent location relationships without querying the database.
+
+The index is loaded lazily from `locations_expanded` and `dependent_locations`,
+and is reloaded on next use once the database's location index version differs from the loaded one.
+The version is incremented whenever states, counties, localities, or locations change in any process.
+The index is also invalidated when this process changes locations, and after a fixed time-to-live.
+"""
+
+import time
+from collections import defaultdict
+from enum import Enum
+from threading import Lock
+from typing import Any, Iterable, Optional
+
+from database_client.db_client_dataclasses import WhereMapping
+
+LOCATION_INDEX_COLUMNS = [
+    "id",
+    "type",
+    "state_name",
+    "state_iso",
+    "county_name",
+    "county_fips",
+    "locality_name",
+    "state_id",
+    "county_id",
+    "locality_id",
+]
+LOCATION_INDEX_TTL_SECONDS = 60 * 60
+
+
+class LocationIndexUnsupportedQuery(Exception):
+    """
+    Raised when a lookup cannot be answered by the index,
+    and must instead be made against the database.
+    """
+
+    pass
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+class LocationIndex:
+
+    def __init__(self, ttl_seconds: float = LOCATION_INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self._loaded_at: Optional[float] = None
+        self._version: Optional[int] = None
+        self._locations: dict[int, dict] = {}
+        # Maps column name -> column value -> ids of locations with that value
+        self._column_indexes: dict[str, dict[Any, set[int]]] = {}
+        self._parents: dict[int, set[int]] = {}
+        self._dependents: dict[int, set[int]] = {}
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > self.ttl_seconds
+        )
+
+    def is_outdated(self, version: int) -> bool:
+        """
+        :param version: The current location index version in the database
+        """
+        return self.is_stale or self._version != version
+
+    def invalidate(self):
+        self._loaded_at = None
+
+    def load(
+        self,
+        locations: Iterable[dict],
+        dependent_locations: Iterable[tuple[int, int]],
+        version: Optional[int] = None,
+    ):
+        """
+        Replaces the contents of the index.
+        :param locations: Rows from `locations_expanded`, containing LOCATION_INDEX_COLUMNS
+        :param dependent_locations: (parent_location_id, dependent_location_id) pairs
+        :param version: The location index version, read before the locations were loaded
+        """
+        new_locations = {}
+        column_indexes = {column: defaultdict(set) for column in LOCATION_INDEX_COLUMNS}
+        for location in locations:
+            location = {
+                column: _normalize(location[column])
+                for column in LOCATION_INDEX_COLUMNS
+            }
+            new_locations[location["id"]] = location
+            for column, value in location.items():
+                column_indexes[column][value].add(location["id"])
+
+        parents = defaultdict(set)
+        dependents = defaultdict(set)
+        for parent_location_id, dependent_location_id in dependent_locations:
+            parents[dependent_location_id].add(parent_location_id)
+            dependents[parent_location_id].add(dependent_location_id)
+
+        # Swap in the new structures together so readers never see a partial index
+        with self._lock:
+            self._locations = new_locations
+            self._column_indexes = column_indexes
+            self._parents = parents
+            self._dependents = dependents
+            self._version = version
+            self._loaded_at = time.monotonic()
+
+    def get_location(self, location_id: int) -> Optional[dict]:
+        return self._locations.get(location_id)
+
+    def get_location_id(self, where_mappings: list[WhereMapping]) -> Optional[int]:
+        """
+        Mirrors selecting a single id from `locations_expanded` with the given where mappings.
+        Columns not included in the mappings are unconstrained.
+        :raises LocationIndexUnsupportedQuery: If the mappings cannot be evaluated by the index.
+        :raises RuntimeError: If more than one location matches.
+        """
+        column_indexes = self._column_indexes
+        candidate_sets = []
+        for where_mapping in where_mappings:
+            if (
+                not isinstance(where_mapping, WhereMapping)
+                or where_mapping.eq is not True
+                or isinstance(where_mapping.value, list)
+                or where_mapping.column not in column_indexes
+            ):
+                raise LocationIndexUnsupportedQuery(where_mapping)
+            candidate_sets.append(
+                column_indexes[where_mapping.column].get(
+                    _normalize(where_mapping.value), set()
+                )
+            )
+        if len(candidate_sets) == 0:
+            raise LocationIndexUnsupportedQuery(where_mappings)
+
+        matches = set.intersection(*sorted(candidate_sets, key=len))
+        if len(matches) == 0:
+            return None
+        if len(matches) > 1:
+            raise RuntimeError(f"Expected 1 result but found {len(matches)}")
+        return next(iter(matches))
+
+    def get_parent_location_ids(self, location_id: int) -> set[int]:
+        return set(self._parents.get(location_id, ()))
+
+    def get_dependent_location_ids(self, location_id: int) -> set[int]:
+        return set(self._dependents.get(location_id, ()))
+
+
+LOCATION_INDEX = LocationIndex()
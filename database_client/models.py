@@ -6,6 +6,7 @@ from typing_extensions import Annotated
 
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     text as text_func,
     Text,
@@ -91,6 +92,7 @@ RequestStatusLiteral = Literal[
 ]
 
 OperationTypeLiteral = Literal["UPDATE", "DELETE"]
+ChangeFeedOperationTypeLiteral = Literal["INSERT", "UPDATE", "DELETE"]
 
 JurisdictionTypeLiteral = Literal[
     "federal", "state", "county", "local", "port", "tribal", "transit", "school"
@@ -595,6 +597,8 @@ class DataSourceArchiveInfo(Base):
     update_frequency: Mapped[Optional[str]]
     last_cached: Mapped[Optional[timestamp]]
     next_cached: Mapped[Optional[timestamp]]
+    next_due_at: Mapped[Optional[timestamp]]
+    lease_expires_at: Mapped[Optional[timestamp]]
 
 
 class LinkDataSourceDataRequest(Base):
@@ -793,6 +797,10 @@ class RecentSearch(Base):
     created_at: Mapped[timestamp] = mapped_column(
         server_default=func.current_timestamp()
     )
+    last_searched_at: Mapped[timestamp] = mapped_column(
+        server_default=func.current_timestamp()
+    )
+    search_key: Mapped[Optional[str]]
 
 
 class LinkRecentSearchRecordCategories(Base):
@@ -832,6 +840,7 @@ class RecentSearchExpanded(Base, CountMetadata):
     locality_name: Mapped[str]
     location_type: Mapped[LocationTypeLiteral]
     record_categories = mapped_column(ARRAY(String, as_tuple=True))
+    last_searched_at: Mapped[timestamp]
 
 
 class ChangeLog(Base):
@@ -848,6 +857,43 @@ class ChangeLog(Base):
     )
 
 
+class ChangeFeed(Base):
+    __tablename__ = Relations.CHANGE_FEED.value
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    transaction_id: Mapped[int] = mapped_column(BigInteger)
+    table_name: Mapped[str]
+    operation_type: Mapped[ChangeFeedOperationTypeLiteral]
+    affected_id: Mapped[Optional[int]]
+    row_data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[timestamp] = mapped_column(
+        server_default=func.current_timestamp()
+    )
+
+
+class MetricsSnapshot(Base):
+    __tablename__ = Relations.METRICS_SNAPSHOT.value
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    source_count: Mapped[int]
+    agency_count: Mapped[int]
+    state_count: Mapped[int]
+    county_count: Mapped[int]
+    computed_at: Mapped[timestamp_tz]
+
+
+class SlowQueryLog(Base):
+    __tablename__ = Relations.SLOW_QUERY_LOG.value
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    fingerprint: Mapped[str]
+    duration_ms: Mapped[float]
+    row_count: Mapped[int]
+    query: Mapped[str]
+    plan: Mapped[list] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[timestamp_tz]
+
+
 SQL_ALCHEMY_TABLE_REFERENCE = {
     "agencies": Agency,
     "agencies_expanded": AgencyExpanded,
@@ -882,6 +928,9 @@ SQL_ALCHEMY_TABLE_REFERENCE = {
     Relations.RECORD_TYPES.value: RecordType,
     Relations.PENDING_USERS.value: PendingUser,
     Relations.CHANGE_LOG.value: ChangeLog,
+    Relations.CHANGE_FEED.value: ChangeFeed,
+    Relations.METRICS_SNAPSHOT.value: MetricsSnapshot,
+    Relations.SLOW_QUERY_LOG.value: SlowQueryLog,
 }
 
 
@@ -200,6 +200,40 @@ class ResultFormatter:
 
         return data_source_dict
 
+    @staticmethod
+    def add_first_location_info(agency_dict: dict[str, Any]) -> None:
+        """
+        Adds the location info of the first of an agency's locations to the agency
+        """
+        locations = agency_dict["locations"]
+        first_location = locations[0] if len(locations) > 0 else {}
+        for key in [
+            "state_iso",
+            "state_name",
+            "county_name",
+            "county_fips",
+            "locality_name",
+        ]:
+            agency_dict[key] = first_location.get(key)
+
+    @staticmethod
+    def agency_projection_to_get_agencies_output(
+        row: RowMapping, requested_columns: Optional[list[str]] = None
+    ) -> dict[str, Any]:
+        agency_dict = dict(row)
+        if requested_columns is None:
+            ResultFormatter.add_first_location_info(agency_dict)
+        return agency_dict
+
+    @staticmethod
+    def data_source_projection_to_get_data_sources_output(
+        row: RowMapping,
+    ) -> dict[str, Any]:
+        data_source_dict = dict(row)
+        for agency_dict in data_source_dict["agencies"]:
+            ResultFormatter.add_first_location_info(agency_dict)
+        return data_source_dict
+
     @staticmethod
     def location_to_location_info(location: LocationExpanded) -> dict[str, Any]:
         return {
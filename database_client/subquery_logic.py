@@ -3,12 +3,19 @@ from functools import partialmethod
 from typing import Optional
 
 from pydantic import BaseModel
-from sqlalchemy.orm import defaultload, joinedload
+from sqlalchemy.orm import defaultload, joinedload, selectinload, subqueryload
 from sqlalchemy.sql.base import ExecutableOption
 
+from database_client.enums import SubqueryLoadStrategy
 from database_client.models import convert_to_column_reference
 from middleware.enums import Relations
 
+LOAD_STRATEGY_FUNCTIONS = {
+    SubqueryLoadStrategy.JOINED: joinedload,
+    SubqueryLoadStrategy.SELECTIN: selectinload,
+    SubqueryLoadStrategy.SUBQUERY: subqueryload,
+}
+
 
 class SubqueryParameters(BaseModel):
     """
@@ -19,15 +26,40 @@ class SubqueryParameters(BaseModel):
     linking_column: str
     columns: Optional[list[str]] = None
     alias_mappings: Optional[dict[str, str]] = None
+    load_strategy: SubqueryLoadStrategy = SubqueryLoadStrategy.JOINED
 
     def set_columns(self, columns: list[str]) -> None:
         self.columns = columns
 
+    def requires_uniqueness(self) -> bool:
+        """
+        Joined loads repeat the parent row once per related row,
+        and so must be de-duplicated after execution.
+        """
+        return self.load_strategy == SubqueryLoadStrategy.JOINED
+
+    @property
+    def shape(self) -> tuple:
+        """
+        The parts of the parameters which determine the structure of the subquery.
+        """
+        return (
+            self.relation_name,
+            self.linking_column,
+            None if self.columns is None else tuple(self.columns),
+            (
+                None
+                if self.alias_mappings is None
+                else tuple(sorted(self.alias_mappings.items()))
+            ),
+            self.load_strategy,
+        )
+
     def build_subquery_load_option(self, primary_relation: str) -> ExecutableOption:
         """Creates a SQLAlchemy ExecutableOption for subquerying.
 
         :param primary_relation:
-        :return: ExecutableOption. Example: defaultload(DataSource.agencies).load_only(Agency.name)
+        :return: ExecutableOption. Example: selectinload(DataSource.agencies).load_only(Agency.name)
         """
         column_references = convert_to_column_reference(
             columns=self.columns, relation=self.relation_name
@@ -35,8 +67,9 @@ class SubqueryParameters(BaseModel):
         linking_column_reference = convert_to_column_reference(
             columns=[self.linking_column], relation=primary_relation
         )
+        load_function = LOAD_STRATEGY_FUNCTIONS[self.load_strategy]
 
-        return joinedload(*linking_column_reference).load_only(*column_references)
+        return load_function(*linking_column_reference).load_only(*column_references)
 
 
 class SubqueryParameterManager:
@@ -50,13 +83,23 @@ class SubqueryParameterManager:
         linking_column: str,
         columns: list[str] = None,
         alias_mappings: Optional[dict[str, str]] = None,
+        expected_fan_out: Optional[int] = None,
     ) -> SubqueryParameters:
-        return SubqueryParameters(
+        """
+        :param expected_fan_out: The expected number of related rows per parent row,
+            used to select the load strategy. If None, related rows are joined.
+        """
+        subquery_parameters = SubqueryParameters(
             relation_name=relation.value,
             linking_column=linking_column,
             columns=columns,
             alias_mappings=alias_mappings,
         )
+        if expected_fan_out is not None:
+            subquery_parameters.load_strategy = (
+                SubqueryLoadStrategy.from_expected_fan_out(expected_fan_out)
+            )
+        return subquery_parameters
 
     agencies = partialmethod(
         get_subquery_params,
@@ -84,14 +127,17 @@ class SubqueryParameterManager:
 
     @staticmethod
     def data_sources():
+        # Data requests may be linked to many data sources
         return SubqueryParameterManager.get_subquery_params(
             relation=Relations.DATA_SOURCES_EXPANDED,
             linking_column="data_sources",
             columns=["id", "name"],
+            expected_fan_out=10,
         )
 
     @staticmethod
     def locations():
+        # Data requests are typically linked to a single location
         return SubqueryParameterManager.get_subquery_params(
             relation=Relations.LOCATIONS_EXPANDED,
             linking_column="locations",
@@ -105,4 +151,5 @@ class SubqueryParameterManager:
                 "display_name",
             ],
             alias_mappings={"id": "location_id"},
+            expected_fan_out=1,
         )
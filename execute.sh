@@ -1,3 +1,3 @@
 #!/bin/sh
 
-gunicorn --worker-tmp-dir /dev/shm --bind 0.0.0.0:8080 'app:create_app()'
\ No newline at end of file
+gunicorn --config gunicorn_config.py 'app:create_app()'
@@ -1,2 +1,19 @@
+import os
+
+from middleware.prometheus_metrics import get_process_metrics_directory
+
 bind = "0.0.0.0:8080"
-workers = 2
+
+# Each worker process serves requests from a pool of threads,
+# so a request waiting on the database or a third party does not block the worker.
+# Database connections are pooled per process, with one connection per thread.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.getenv("GUNICORN_WORKERS", 2))
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+worker_tmp_dir = "/dev/shm"
+
+
+def on_starting(server):
+    # Worker processes share their metrics through files, which are not carried over from previous runs
+    get_process_metrics_directory().clear()
@@ -0,0 +1,51 @@
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    mean_ms: float
+    median_ms: float
+    min_ms: float
+
+    def __str__(self):
+        return (
+            f"{self.name}: mean {self.mean_ms:.2f} ms, "
+            f"median {self.median_ms:.2f} ms, "
+            f"min {self.min_ms:.2f} ms ({self.iterations} iterations)"
+        )
+
+
+def run_benchmark(
+    name: str, func: Callable, iterations: int = 20, warmup: int = 2
+) -> BenchmarkResult:
+    """
+    Times repeated calls of the given function, after a number of warmup calls
+    :param name: The name under which to report the result
+    :param func: A function taking no arguments
+    :param iterations: The number of timed calls
+    :param warmup: The number of untimed calls made beforehand
+    :return:
+    """
+    for _ in range(warmup):
+        func()
+
+    timings_ms = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings_ms.append((time.perf_counter() - start) * 1000)
+
+    result = BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        mean_ms=statistics.mean(timings_ms),
+        median_ms=statistics.median(timings_ms),
+        min_ms=min(timings_ms),
+    )
+    print(result)
+    return result
@@ -0,0 +1,96 @@
+"""
+Compares validating bulk data source csv rows with `Schema.load`, `SchemaUnflattener`,
+and `setup_dto_class` against the compiled `FlatRowLoader`.
+
+Does not require a database; run with `pytest -s` to see timings.
+"""
+
+from manual_tests.benchmarks.benchmark_helpers import run_benchmark
+from middleware.schema_and_dto_logic.dynamic_logic.compiled_flat_row_loader import (
+    get_flat_row_loader,
+)
+from middleware.schema_and_dto_logic.dynamic_logic.dynamic_csv_to_schema_conversion_logic import (
+    SchemaUnflattener,
+)
+from middleware.schema_and_dto_logic.dynamic_logic.dynamic_schema_request_content_population import (
+    setup_dto_class,
+)
+from middleware.schema_and_dto_logic.primary_resource_dtos.data_sources_dtos import (
+    DataSourcesPostDTO,
+)
+from middleware.schema_and_dto_logic.primary_resource_schemas.bulk_schemas import (
+    DataSourcesPostBatchRequestSchema,
+)
+
+ROW_COUNT = 50_000
+
+
+def create_raw_row(index: int) -> dict:
+    # As read from a csv, after empty strings are replaced with None
+    # and comma-separated values are split into lists
+    return {
+        "name": f"Data Source {index}",
+        "description": "A data source used for benchmarking",
+        "source_url": f"https://example.com/data-source/{index}",
+        "agency_supplied": "true",
+        "supplying_entity": None,
+        "agency_originated": "false",
+        "agency_aggregation": "county",
+        "coverage_start": "2020-01-01",
+        "coverage_end": None,
+        "detail_level": "Individual record",
+        "access_types": ["Webpage", "API"],
+        "data_portal_type": None,
+        "record_formats": ["CSV", "PDF"],
+        "update_method": "Insert",
+        "tags": None,
+        "readme_url": None,
+        "originating_entity": None,
+        "retention_schedule": "1-10 years",
+        "scraper_url": None,
+        "submission_notes": None,
+        "submitter_contact_info": None,
+        "agency_described_not_in_database": None,
+        "data_portal_type_other": None,
+        "access_notes": None,
+        "record_type_name": "Arrest Records",
+        "linked_agency_ids": ["1", "2"],
+    }
+
+
+def test_benchmark_bulk_row_validation():
+    schema = DataSourcesPostBatchRequestSchema(exclude=["file"])
+    raw_rows = [create_raw_row(index) for index in range(ROW_COUNT)]
+
+    unflattener = SchemaUnflattener(flat_schema_class=type(schema))
+
+    def load_generically():
+        return [
+            setup_dto_class(
+                data=unflattener.unflatten(flat_data=schema.load(raw_row)),
+                dto_class=DataSourcesPostDTO,
+                nested_dto_info_list=unflattener.nested_dto_info_list,
+            )
+            for raw_row in raw_rows
+        ]
+
+    row_loader = get_flat_row_loader(schema=schema, inner_dto_class=DataSourcesPostDTO)
+
+    def load_compiled():
+        return [row_loader.load_dto(raw_row) for raw_row in raw_rows]
+
+    generic = run_benchmark(
+        name=f"Schema.load ({ROW_COUNT} rows)",
+        func=load_generically,
+        iterations=3,
+        warmup=1,
+    )
+    compiled = run_benchmark(
+        name=f"FlatRowLoader ({ROW_COUNT} rows)",
+        func=load_compiled,
+        iterations=3,
+        warmup=1,
+    )
+    print(f"Speedup: {generic.median_ms / compiled.median_ms:.2f}x")
+
+    assert load_compiled() == load_generically()
@@ -0,0 +1,151 @@
+"""
+Compares the per-row `log_table_changes()` trigger which `change_log` previously used
+against the statement-level `log_table_updates()` trigger, for bulk agency updates.
+
+Both triggers are run against the same agencies within a single transaction,
+which is rolled back afterwards.
+
+Requires a live, migrated database; run with `pytest -s` to see timings.
+"""
+
+import psycopg
+from psycopg.rows import dict_row
+
+from manual_tests.benchmarks.benchmark_helpers import run_benchmark
+from middleware.util import get_env_variable
+
+NUM_AGENCIES = 5000
+
+# The triggers as they were prior to statement-level logging,
+# created as temporary functions so that they are dropped with the session
+LEGACY_FUNCTIONS = """
+CREATE FUNCTION pg_temp.jsonb_diff_val_legacy(val1 JSONB, val2 JSONB)
+    RETURNS JSONB AS $$
+    DECLARE
+      result JSONB;
+      v RECORD;
+    BEGIN
+       result = val1;
+       FOR v IN SELECT * FROM jsonb_each(val2) LOOP
+         IF result @> jsonb_build_object(v.key,v.value)
+            THEN result = result - v.key;
+         ELSIF result ? v.key THEN CONTINUE;
+         ELSE
+            result = result || jsonb_build_object(v.key,'null');
+         END IF;
+       END LOOP;
+       RETURN result;
+    END;
+    $$ LANGUAGE plpgsql;
+
+CREATE FUNCTION pg_temp.log_table_changes_legacy()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        old_values JSONB;
+        new_values JSONB;
+    BEGIN
+        old_values = row_to_json(OLD)::jsonb;
+        new_values = row_to_json(NEW)::jsonb;
+        INSERT INTO change_log (operation_type, table_name, affected_id, old_data, new_data)
+        VALUES (
+            'UPDATE',
+            TG_TABLE_NAME,
+            OLD.id,
+            pg_temp.jsonb_diff_val_legacy(old_values, new_values),
+            pg_temp.jsonb_diff_val_legacy(new_values, old_values)
+        );
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+
+CREATE TRIGGER log_agencies_changes_legacy
+BEFORE UPDATE ON agencies
+FOR EACH ROW EXECUTE FUNCTION pg_temp.log_table_changes_legacy();
+"""
+
+UPDATE_QUERIES = {
+    "changed": "UPDATE agencies SET homepage_url = 'https://example.com/' || id WHERE id = ANY(%s)",
+    "unchanged": "UPDATE agencies SET name = name WHERE id = ANY(%s)",
+}
+
+
+def create_benchmark_agencies(cursor: psycopg.Cursor) -> list[int]:
+    cursor.execute(
+        """
+        INSERT INTO agencies (name, jurisdiction_type, agency_type, approval_status)
+        SELECT 'Benchmark Agency ' || i, 'local', 'law enforcement', 'approved'
+        FROM generate_series(1, %s) i
+        RETURNING id
+        """,
+        (NUM_AGENCIES,),
+    )
+    return [row["id"] for row in cursor.fetchall()]
+
+
+def set_triggers_enabled(cursor: psycopg.Cursor, legacy: bool):
+    enabled, disabled = ("ENABLE", "DISABLE") if legacy else ("DISABLE", "ENABLE")
+    cursor.execute(
+        f"ALTER TABLE agencies {enabled} TRIGGER log_agencies_changes_legacy"
+    )
+    cursor.execute(f"ALTER TABLE agencies {disabled} TRIGGER log_agencies_updates")
+
+
+def get_logged_updates(cursor: psycopg.Cursor, agency_ids: list[int]) -> list[dict]:
+    cursor.execute(
+        """
+        SELECT affected_id, old_data, new_data FROM change_log
+        WHERE table_name = 'agencies' AND operation_type = 'UPDATE'
+        AND affected_id = ANY(%s)
+        ORDER BY affected_id
+        """,
+        (agency_ids,),
+    )
+    return cursor.fetchall()
+
+
+def test_benchmark_change_log_triggers():
+    connection = psycopg.connect(get_env_variable("DO_DATABASE_URL"))
+    cursor = connection.cursor(row_factory=dict_row)
+    try:
+        agency_ids = create_benchmark_agencies(cursor)
+        # Isolate the cost of the change log triggers
+        cursor.execute(
+            "ALTER TABLE agencies DISABLE TRIGGER record_agencies_change_feed"
+        )
+        cursor.execute(LEGACY_FUNCTIONS)
+
+        def run_update(query: str) -> list[dict]:
+            cursor.execute("SAVEPOINT benchmark")
+            cursor.execute(query, (agency_ids,))
+            logged_updates = get_logged_updates(cursor, agency_ids)
+            cursor.execute("ROLLBACK TO SAVEPOINT benchmark")
+            return logged_updates
+
+        for update_name, query in UPDATE_QUERIES.items():
+            results = {}
+            logged_updates = {}
+            for legacy in (True, False):
+                set_triggers_enabled(cursor, legacy=legacy)
+                trigger_name = "row-level" if legacy else "statement-level"
+                logged_updates[legacy] = run_update(query)
+                results[legacy] = run_benchmark(
+                    name=f"{update_name} update of {NUM_AGENCIES} agencies ({trigger_name})",
+                    func=lambda: run_update(query),
+                    iterations=10,
+                )
+            print(
+                f"{update_name}: speedup "
+                f"{results[True].median_ms / results[False].median_ms:.1f}x"
+            )
+
+            if update_name == "changed":
+                # Both triggers must log the same diffs
+                assert logged_updates[True] == logged_updates[False]
+                assert len(logged_updates[False]) == NUM_AGENCIES
+            else:
+                # No-op updates are no longer logged
+                assert len(logged_updates[True]) == NUM_AGENCIES
+                assert logged_updates[False] == []
+    finally:
+        connection.rollback()
+        connection.close()
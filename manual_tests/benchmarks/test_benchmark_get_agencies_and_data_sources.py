@@ -0,0 +1,86 @@
+"""
+Compares loading ORM instances against building nested json in the database
+for 100-row pages of GET /agencies and GET /data-sources.
+
+Requires a live database populated via TestDataCreatorDBClient; run with `pytest -s` to see timings.
+"""
+
+from manual_tests.benchmarks.benchmark_helpers import run_benchmark
+from tests.helper_scripts.helper_classes.TestDataCreatorDBClient import (
+    TestDataCreatorDBClient,
+)
+
+PAGE_SIZE = 100
+AGENCIES_PER_DATA_SOURCE = 3
+DATA_REQUESTS_PER_DATA_SOURCE = 2
+
+AGENCIES_COLUMNS = ["id", "name", "homepage_url", "agency_type"]
+DATA_SOURCES_COLUMNS = ["id", "name", "description", "source_url", "created_at"]
+DATA_REQUESTS_COLUMNS = ["id", "title", "date_created"]
+
+
+def create_benchmark_data(tdc: TestDataCreatorDBClient):
+    location_id = tdc.locality()
+    agency_ids = [
+        tdc.agency(location_id=location_id).id for _ in range(AGENCIES_PER_DATA_SOURCE)
+    ]
+    user_id = tdc.user().id
+    data_request_ids = [
+        tdc.data_request(user_id=user_id).id
+        for _ in range(DATA_REQUESTS_PER_DATA_SOURCE)
+    ]
+    for _ in range(PAGE_SIZE):
+        data_source_id = tdc.data_source().id
+        for agency_id in agency_ids:
+            tdc.link_data_source_to_agency(
+                data_source_id=data_source_id, agency_id=agency_id
+            )
+        for data_request_id in data_request_ids:
+            tdc.link_data_request_to_data_source(
+                data_request_id=data_request_id, data_source_id=data_source_id
+            )
+
+
+def test_benchmark_get_agencies_and_data_sources_projection():
+    tdc = TestDataCreatorDBClient()
+    create_benchmark_data(tdc)
+
+    def get_agencies(projection: bool):
+        return tdc.db_client.get_agencies(
+            limit=PAGE_SIZE,
+            requested_columns=AGENCIES_COLUMNS,
+            projection=projection,
+        )
+
+    def get_data_sources(projection: bool):
+        return tdc.db_client.get_data_sources(
+            data_sources_columns=DATA_SOURCES_COLUMNS,
+            data_requests_columns=DATA_REQUESTS_COLUMNS,
+            limit=PAGE_SIZE,
+            projection=projection,
+        )
+
+    for projection in [False, True]:
+        mode = "projection" if projection else "ORM"
+        run_benchmark(
+            name=f"get_agencies ({mode})",
+            func=lambda: get_agencies(projection),
+        )
+        run_benchmark(
+            name=f"get_data_sources ({mode})",
+            func=lambda: get_data_sources(projection),
+        )
+
+    # Both modes must return the same rows and linked entities
+    def summarize(results: list[dict], linked_key: str) -> dict:
+        return {
+            result["id"]: sorted(linked["id"] for linked in result[linked_key])
+            for result in results
+        }
+
+    assert summarize(get_agencies(True), "data_sources") == summarize(
+        get_agencies(False), "data_sources"
+    )
+    assert summarize(get_data_sources(True), "agencies") == summarize(
+        get_data_sources(False), "agencies"
+    )
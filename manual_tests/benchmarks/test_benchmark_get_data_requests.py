@@ -0,0 +1,85 @@
+"""
+Compares subquery load strategies for retrieving data requests
+with their linked data sources and locations.
+
+Requires a live database populated via TestDataCreatorDBClient; run with `pytest -s` to see timings.
+"""
+
+from database_client.enums import SubqueryLoadStrategy
+from middleware.primary_resource_logic.data_requests import (
+    get_data_requests_subquery_params,
+)
+from manual_tests.benchmarks.benchmark_helpers import run_benchmark
+from tests.helper_scripts.helper_classes.TestDataCreatorDBClient import (
+    TestDataCreatorDBClient,
+)
+
+NUM_DATA_REQUESTS = 100
+DATA_SOURCES_PER_DATA_REQUEST = 20
+LOCATIONS_PER_DATA_REQUEST = 1
+
+
+def create_benchmark_data(tdc: TestDataCreatorDBClient) -> list[int]:
+    data_source_ids = [
+        tdc.data_source().id for _ in range(DATA_SOURCES_PER_DATA_REQUEST)
+    ]
+    location_ids = [tdc.locality() for _ in range(LOCATIONS_PER_DATA_REQUEST)]
+    user_id = tdc.user().id
+    data_request_ids = []
+    for _ in range(NUM_DATA_REQUESTS):
+        data_request_id = tdc.data_request(user_id=user_id).id
+        for data_source_id in data_source_ids:
+            tdc.link_data_request_to_data_source(
+                data_request_id=data_request_id, data_source_id=data_source_id
+            )
+        for location_id in location_ids:
+            tdc.link_data_request_to_location(
+                data_request_id=data_request_id, location_id=location_id
+            )
+        data_request_ids.append(data_request_id)
+    return data_request_ids
+
+
+def test_benchmark_get_data_requests_load_strategies():
+    tdc = TestDataCreatorDBClient()
+    data_request_ids = create_benchmark_data(tdc)
+
+    def get_data_requests(load_strategy: SubqueryLoadStrategy):
+        subquery_parameters = get_data_requests_subquery_params()
+        for sp in subquery_parameters:
+            sp.load_strategy = load_strategy
+        return tdc.db_client.get_data_requests(
+            columns=["id", "title", "request_status"],
+            where_mappings={"id": data_request_ids},
+            subquery_parameters=subquery_parameters,
+            build_metadata=True,
+        )
+
+    results = {}
+    for load_strategy in SubqueryLoadStrategy:
+        results[load_strategy] = get_data_requests(load_strategy)
+        run_benchmark(
+            name=f"get_data_requests ({load_strategy.value})",
+            func=lambda: get_data_requests(load_strategy),
+        )
+    run_benchmark(
+        name="get_data_requests (default)",
+        func=lambda: tdc.db_client.get_data_requests(
+            columns=["id", "title", "request_status"],
+            where_mappings={"id": data_request_ids},
+            subquery_parameters=get_data_requests_subquery_params(),
+            build_metadata=True,
+        ),
+    )
+
+    # All strategies must produce the same data requests and linked data sources
+    def summarize(result: dict) -> dict[int, list[int]]:
+        return {
+            data_request["id"]: sorted(ds["id"] for ds in data_request["data_sources"])
+            for data_request in result["data"]
+        }
+
+    baseline = summarize(results[SubqueryLoadStrategy.JOINED])
+    for result in results.values():
+        assert summarize(result) == baseline
+    assert len(baseline) == NUM_DATA_REQUESTS
@@ -0,0 +1,129 @@
+"""
+Compares JSON providers when serializing a page of data sources
+as produced by ResultFormatter for GET /data-sources.
+
+Does not require a database; run with `pytest -s` to see timings.
+"""
+
+from datetime import date, datetime, timezone
+
+from flask import Flask
+from sqlalchemy.orm.collections import InstrumentedList
+
+from database_client.models import (
+    Agency,
+    DataRequestExpanded,
+    DataSourceExpanded,
+    LocationExpanded,
+)
+from database_client.result_formatter import ResultFormatter
+from manual_tests.benchmarks.benchmark_helpers import run_benchmark
+from middleware.enums import Relations
+from middleware.json_providers import JSON_PROVIDERS
+
+PAGE_SIZE = 100
+AGENCIES_PER_DATA_SOURCE = 3
+DATA_REQUESTS_PER_DATA_SOURCE = 2
+
+DATA_SOURCES_COLUMNS = [
+    "id",
+    "name",
+    "description",
+    "source_url",
+    "coverage_start",
+    "coverage_end",
+    "updated_at",
+    "created_at",
+    "approval_status_updated_at",
+    "record_type_name",
+]
+DATA_REQUESTS_COLUMNS = ["id", "title", "date_created"]
+
+
+def create_data_source(index: int) -> DataSourceExpanded:
+    data_source = DataSourceExpanded(
+        id=index,
+        name=f"Data Source {index}",
+        description="A data source used for benchmarking " * 4,
+        source_url=f"https://example.com/data-source/{index}",
+        coverage_start=date(2020, 1, 1),
+        coverage_end=date(2024, 12, 31),
+        updated_at=date(2025, 1, 1),
+        created_at=datetime(2024, 6, 1, 12, 30, tzinfo=timezone.utc),
+        approval_status_updated_at=datetime(2024, 7, 1, 8, 0, tzinfo=timezone.utc),
+        record_type_name="Incident Reports",
+    )
+    agencies = []
+    for agency_index in range(AGENCIES_PER_DATA_SOURCE):
+        agency = Agency(
+            id=index * 10 + agency_index,
+            name=f"Agency {agency_index}",
+            jurisdiction_type="local",
+            agency_type="police",
+            homepage_url="https://example.com/agency",
+        )
+        agency.locations = InstrumentedList(
+            [
+                LocationExpanded(
+                    id=agency_index,
+                    type="Locality",
+                    state_iso="PA",
+                    state_name="Pennsylvania",
+                    county_name="Allegheny",
+                    county_fips="42003",
+                    locality_name="Pittsburgh",
+                    display_name="Pittsburgh, Allegheny, PA",
+                )
+            ]
+        )
+        agencies.append(agency)
+    data_source.agencies = InstrumentedList(agencies)
+    data_source.data_requests = InstrumentedList(
+        [
+            DataRequestExpanded(
+                id=index * 10 + request_index,
+                title=f"Data Request {request_index}",
+                date_created=datetime(2024, 5, 1, tzinfo=timezone.utc),
+            )
+            for request_index in range(DATA_REQUESTS_PER_DATA_SOURCE)
+        ]
+    )
+    return data_source
+
+
+def create_payload() -> dict:
+    data = [
+        ResultFormatter.data_source_to_get_data_sources_output(
+            data_source=create_data_source(index),
+            data_sources_columns=DATA_SOURCES_COLUMNS,
+            data_requests_columns=DATA_REQUESTS_COLUMNS,
+        )
+        for index in range(PAGE_SIZE)
+    ]
+    payload = ResultFormatter.format_with_metadata(
+        data=data, relation_name=Relations.DATA_SOURCES_EXPANDED.value
+    )
+    payload["message"] = "Successfully returned data sources"
+    return payload
+
+
+def test_benchmark_json_providers():
+    app = Flask(__name__)
+    payload = create_payload()
+
+    bodies = {}
+    with app.app_context():
+        for name, provider_class in JSON_PROVIDERS.items():
+            provider = provider_class(app)
+            bodies[name] = provider.loads(provider.response(payload).get_data())
+            run_benchmark(
+                name=f"{name} JSON provider ({PAGE_SIZE} data sources)",
+                func=lambda: provider.response(payload),
+                iterations=200,
+                warmup=10,
+            )
+
+    # All providers must produce equivalent documents
+    baseline = bodies["default"]
+    for body in bodies.values():
+        assert body == baseline
@@ -0,0 +1,67 @@
+"""
+Compares sending outbound requests with a new connection for each request,
+as `requests.post` does, against sending them with the shared HTTP session,
+which keeps its connection to each host alive.
+
+Requests are sent over HTTPS to a local stub server with a small simulated processing delay,
+so the saving is mostly that of the TLS handshake;
+against third parties, each new connection also costs network round trips.
+
+Does not require a database; run with `pytest -s` to see timings.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from manual_tests.benchmarks.benchmark_helpers import run_benchmark
+from middleware.third_party_interaction_logic.http_session import (
+    create_http_session,
+    OutboundRequestMetrics,
+)
+from tests.helper_scripts.helper_classes.StubHTTPServer import (
+    StubHTTPServer,
+    StubResponse,
+)
+
+REQUESTS_PER_ITERATION = 20
+CONCURRENT_THREADS = 4
+
+
+def test_benchmark_outbound_http():
+    with StubHTTPServer(default_response=StubResponse(delay_seconds=0.001)) as server:
+        metrics = OutboundRequestMetrics()
+        session = create_http_session(metrics=metrics)
+        payload = {"content": "Benchmark notification"}
+
+        def post_without_session():
+            requests.post(server.url, json=payload, timeout=5, verify=server.cert_path)
+
+        def post_with_session():
+            session.post(server.url, json=payload, verify=server.cert_path)
+
+        def run_concurrently(post):
+            with ThreadPoolExecutor(max_workers=CONCURRENT_THREADS) as executor:
+                for _ in executor.map(lambda _: post(), range(REQUESTS_PER_ITERATION)):
+                    pass
+
+        results = {}
+        for name, post in (
+            ("requests.post", post_without_session),
+            ("shared session", post_with_session),
+        ):
+            server.connection_count = 0
+            results[name] = run_benchmark(
+                name=f"{REQUESTS_PER_ITERATION} posts across {CONCURRENT_THREADS} threads ({name})",
+                func=lambda: run_concurrently(post),
+                iterations=20,
+            )
+            print(f"{name}: {server.connection_count} connections opened")
+
+        print(
+            f"speedup {results['requests.post'].median_ms / results['shared session'].median_ms:.1f}x"
+        )
+        print(metrics.get_host_latencies()[server.host])
+
+        # The shared session opens at most one connection per thread
+        assert server.connection_count <= CONCURRENT_THREADS
@@ -46,6 +46,15 @@ ARCHIVE_WRITE_AUTH_INFO = AuthenticationInfo(
     allowed_access_methods=[AccessTypeEnum.JWT],
     restrict_to_permissions=[PermissionsEnum.ARCHIVE_WRITE],
 )
+CHANGE_FEED_READ_AUTH_INFO = AuthenticationInfo(
+    allowed_access_methods=[AccessTypeEnum.JWT],
+    restrict_to_permissions=[PermissionsEnum.CHANGE_FEED_READ],
+)
+# Allows API keys, so that metrics can be scraped without refreshing a JWT
+SYSTEM_METRICS_READ_AUTH_INFO = AuthenticationInfo(
+    allowed_access_methods=[AccessTypeEnum.API_KEY, AccessTypeEnum.JWT],
+    restrict_to_permissions=[PermissionsEnum.SYSTEM_METRICS_READ],
+)
 # Allow owners of a resource to use the endpoint as well, instead of only admin-level users
 STANDARD_JWT_AUTH_INFO = AuthenticationInfo(
     allowed_access_methods=[AccessTypeEnum.JWT],
@@ -299,14 +308,20 @@ def jwt_handler(
     return access_info
 
 
-def api_key_handler(token: str, **kwargs) -> Optional[AccessInfoPrimary]:
+def api_key_handler(
+    token: str, restrict_to_permissions=None
+) -> Optional[AccessInfoPrimary]:
     user_email = get_user_email_from_api_key(token)
-    if user_email:
-        return AccessInfoPrimary(
-            user_email=user_email,
-            access_type=AccessTypeEnum.API_KEY,
-        )
-    return None
+    if not user_email:
+        return None
+    access_info = AccessInfoPrimary(
+        user_email=user_email,
+        access_type=AccessTypeEnum.API_KEY,
+    )
+    if restrict_to_permissions:
+        access_info.permissions = get_user_permissions(user_email)
+        check_permissions_with_access_info(access_info, restrict_to_permissions)
+    return access_info
 
 
 def password_reset_handler(
@@ -12,7 +12,8 @@ from middleware.access_logic import (
     ParserDeterminator,
 )
 from middleware.argument_checking_logic import check_for_mutually_exclusive_arguments
-from middleware.enums import PermissionsEnum, AccessTypeEnum
+from middleware.enums import PermissionsEnum, AccessTypeEnum, RequestPhase
+from middleware.request_profiling import profile_phase
 from middleware.schema_and_dto_logic.dynamic_logic.dynamic_schema_documentation_construction import (
     get_restx_param_documentation,
 )
@@ -80,9 +81,10 @@ def authentication_required(
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            kwargs["access_info"] = get_authentication(
-                allowed_access_methods, restrict_to_permissions, no_auth=no_auth
-            )
+            with profile_phase(RequestPhase.AUTHENTICATION):
+                kwargs["access_info"] = get_authentication(
+                    allowed_access_methods, restrict_to_permissions, no_auth=no_auth
+                )
 
             return func(*args, **kwargs)
 
@@ -22,6 +22,8 @@ class PermissionsEnum(Enum):
     SOURCE_COLLECTOR = "source_collector"
     USER_CREATE_UPDATE = "user_create_update"
     ARCHIVE_WRITE = "archive_write"
+    CHANGE_FEED_READ = "change_feed_read"
+    SYSTEM_METRICS_READ = "system_metrics_read"
 
     @classmethod
     def values(cls):
@@ -93,7 +95,11 @@ class Relations(Enum):
     USER_PERMISSIONS = "user_permissions"
     TABLE_COUNT_LOG = "table_count_log"
     CHANGE_LOG = "change_log"
+    CHANGE_FEED = "change_feed"
     LINK_AGENCIES_LOCATIONS = "link_agencies_locations"
+    METRICS_SNAPSHOT = "metrics_snapshot"
+    SLOW_QUERY_LOG = "slow_query_log"
+    LOCATION_INDEX_VERSION = "location_index_version"
 
 
 class OperationType(Enum):
@@ -105,6 +111,16 @@ class OperationType(Enum):
     DELETE = "DELETE"
 
 
+class ChangeFeedOperationType(Enum):
+    """
+    A list of valid change feed operation types
+    """
+
+    INSERT = "INSERT"
+    UPDATE = "UPDATE"
+    DELETE = "DELETE"
+
+
 class JurisdictionType(Enum):
     """
     A list of valid agency jurisdiction types
@@ -187,3 +203,24 @@ class ContactFormMessageType(Enum):
     BUG_REPORT = "bug_report"
     SECURITY_VULNERABILITY = "security_vulnerability"
     DATA_CORRECTION = "data_correction"
+
+
+class ResponseValidationMode(Enum):
+    ALWAYS = "always"
+    SAMPLED = "sampled"
+    DEV_ONLY = "dev_only"
+
+
+class RequestPhase(Enum):
+    """
+    The phases of handling a request which are timed by request profiling
+    """
+
+    AUTHENTICATION = "authentication"
+    DTO_POPULATION = "dto_population"
+    SERIALIZATION = "serialization"
+
+
+class ArchiveUpdateStatus(Enum):
+    UPDATED = "updated"
+    NOT_FOUND = "not_found"
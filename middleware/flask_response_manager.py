@@ -4,16 +4,78 @@ through a single point of entry, which can be mocked as well as enable additiona
 logic to be added as necessary.
 """
 
+import logging
+import os
+import random
+from collections import Counter
 from http import HTTPStatus
+from threading import Lock
 from typing import Optional, Type
 
-from flask import make_response, Response, redirect
+from flask import make_response, Response, redirect, current_app, has_app_context
 from flask_restx import abort
 from marshmallow import Schema, ValidationError
 
+from middleware.enums import ResponseValidationMode
+
+logger = logging.getLogger(__name__)
+
+
+def is_dev_environment() -> bool:
+    return has_app_context() and (current_app.debug or current_app.testing)
+
+
+class ResponseValidationPolicy:
+    """
+    Determines which responses are validated against their schema.
+
+    In debug or testing, every response is validated.
+    Otherwise, responses are validated according to the mode:
+    always, a sampled percentage of responses, or never (dev only).
+    """
+
+    def __init__(
+        self,
+        mode: ResponseValidationMode = ResponseValidationMode.SAMPLED,
+        sample_rate: float = 10,
+    ):
+        """
+        :param mode:
+        :param sample_rate: The percentage of responses to validate in sampled mode.
+        """
+        self.mode = mode
+        self.sample_rate = sample_rate
+
+    @staticmethod
+    def from_env() -> "ResponseValidationPolicy":
+        return ResponseValidationPolicy(
+            mode=ResponseValidationMode(
+                os.getenv(
+                    "RESPONSE_VALIDATION_MODE", ResponseValidationMode.SAMPLED.value
+                )
+            ),
+            sample_rate=float(os.getenv("RESPONSE_VALIDATION_SAMPLE_RATE", 10)),
+        )
+
+    def should_validate(self) -> bool:
+        if is_dev_environment():
+            return True
+        if self.mode == ResponseValidationMode.ALWAYS:
+            return True
+        if self.mode == ResponseValidationMode.SAMPLED:
+            return random.random() * 100 < self.sample_rate
+        return False
+
 
 class FlaskResponseManager:
 
+    validation_policy = ResponseValidationPolicy.from_env()
+    # Counts of validated responses and schema violations, keyed by schema name
+    validation_counts: Counter = Counter()
+    violation_counts: Counter = Counter()
+    _counts_lock = Lock()
+    _schema_instances: dict[Type[Schema], Schema] = {}
+
     @classmethod
     def make_response(
         cls,
@@ -21,19 +83,43 @@ class FlaskResponseManager:
         status_code: HTTPStatus = HTTPStatus.OK,
         validation_schema: Optional[Type[Schema]] = None,
     ) -> Response:
-        if validation_schema is not None:
+        if validation_schema is not None and cls.validation_policy.should_validate():
             cls.validate_data_with_schema(data, validation_schema)
         return make_response(data, status_code)
 
+    @classmethod
+    def get_schema_instance(cls, validation_schema: Type[Schema]) -> Schema:
+        schema = cls._schema_instances.get(validation_schema)
+        if schema is None:
+            schema = validation_schema()
+            cls._schema_instances[validation_schema] = schema
+        return schema
+
     @classmethod
     def validate_data_with_schema(cls, data, validation_schema):
+        """
+        Validates the data against the schema.
+        Violations are logged and counted; they only abort the request in debug or testing.
+        """
+        schema_name = validation_schema.__name__
+        with cls._counts_lock:
+            cls.validation_counts[schema_name] += 1
         try:
-            validation_schema().load(data)
+            cls.get_schema_instance(validation_schema).load(data)
         except ValidationError as e:
-            abort(
-                code=HTTPStatus.INTERNAL_SERVER_ERROR,
-                message=f"Error validating response schema: {e}",
+            with cls._counts_lock:
+                cls.violation_counts[schema_name] += 1
+            logger.warning(
+                "Response failed validation against %s (%s violations): %s",
+                schema_name,
+                cls.violation_counts[schema_name],
+                e,
             )
+            if is_dev_environment():
+                abort(
+                    code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                    message=f"Error validating response schema: {e}",
+                )
 
     @classmethod
     def abort(cls, code: int, message: str) -> Response:
@@ -1,8 +1,18 @@
-from asyncio import Lock
+import threading
+import weakref
 
 import psycopg
 from psycopg import connection as PgConnection
-from middleware.util import get_env_variable
+from psycopg_pool import ConnectionPool, PoolTimeout
+
+from middleware.request_profiling import ProfiledCursor
+from middleware.util import get_env_variable, get_optional_env_int
+
+# The maximum number of connections each process holds open,
+# which must allow for every request thread and scheduled task thread
+DEFAULT_POOL_MAX_SIZE = 10
+# Seconds to wait for a connection before failing
+POOL_TIMEOUT_SECONDS = 10
 
 
 class DatabaseInitializationError(Exception):
@@ -15,39 +25,92 @@ class DatabaseInitializationError(Exception):
         super().__init__(self.message)
 
 
+def configure_connection(connection: PgConnection):
+    # Count queries against the request being profiled
+    connection.cursor_factory = ProfiledCursor
+
+
+class PooledConnectionCheckout:
+    """
+    A connection checked out of the pool,
+    which is returned to the pool once the checkout is garbage collected.
+    """
+
+    def __init__(self, pool: ConnectionPool):
+        self.connection = pool.getconn()
+        self._finalizer = weakref.finalize(self, pool.putconn, self.connection)
+
+    def release(self):
+        self._finalizer()
+
+
 class DatabaseConnectionSingleton:
+    """
+    Gives each thread its own connection, checked out of a connection pool shared by the process.
+    Connections are returned to the pool when their thread exits, or replaced if they are closed.
+    """
+
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         if not cls._instance:
-            if not cls._instance:
-                cls._instance = super(DatabaseConnectionSingleton, cls).__new__(cls)
-                cls._instance._connection = None
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(DatabaseConnectionSingleton, cls).__new__(cls)
+                    cls._instance._pool = None
+                    cls._instance._thread_checkouts = threading.local()
         return cls._instance
 
     def get_connection(self) -> PgConnection:
-        if self._connection is None or self._connection.closed != 0:
-            self._connection = self._initialize_psycopg_connection()
-        return self._connection
-
-    def _initialize_psycopg_connection(self) -> PgConnection:
+        checkout = getattr(self._thread_checkouts, "checkout", None)
+        if checkout is None or checkout.connection.closed != 0:
+            if checkout is not None:
+                # The pool discards closed connections
+                checkout.release()
+            try:
+                checkout = PooledConnectionCheckout(self.get_pool())
+            except PoolTimeout as e:
+                raise DatabaseInitializationError(e) from e
+            self._thread_checkouts.checkout = checkout
+        return checkout.connection
+
+    def get_pool(self) -> ConnectionPool:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = self._initialize_connection_pool()
+        return self._pool
+
+    def _initialize_connection_pool(self) -> ConnectionPool:
         """
-        Initializes a connection to a PostgreSQL database using psycopg with connection parameters
-        obtained from an environment variable. If the connection fails, it raises a DatabaseInitializationError.
+        Initializes a pool of connections to a PostgreSQL database using psycopg with connection parameters
+        obtained from an environment variable.
 
-        The function sets keepalive parameters to maintain the connection active during periods of inactivity.
+        Connections are checked before being handed out,
+        and set keepalive parameters to maintain the connection active during periods of inactivity.
 
-        :return: A psycopg connection object if successful.
+        :return: A psycopg connection pool.
         """
         try:
             DO_DATABASE_URL = get_env_variable("DO_DATABASE_URL")
 
-            return psycopg.connect(
+            return ConnectionPool(
                 DO_DATABASE_URL,
-                keepalives=1,
-                keepalives_idle=30,
-                keepalives_interval=10,
-                keepalives_count=5,
+                min_size=1,
+                max_size=get_optional_env_int(
+                    "DB_POOL_MAX_SIZE", default=DEFAULT_POOL_MAX_SIZE
+                ),
+                timeout=POOL_TIMEOUT_SECONDS,
+                kwargs={
+                    "keepalives": 1,
+                    "keepalives_idle": 30,
+                    "keepalives_interval": 10,
+                    "keepalives_count": 5,
+                },
+                check=ConnectionPool.check_connection,
+                configure=configure_connection,
+                open=True,
             )
 
         except psycopg.OperationalError as e:
@@ -56,12 +119,13 @@ class DatabaseConnectionSingleton:
 
 def initialize_psycopg_connection() -> PgConnection:
     """
-    Initializes a connection to a PostgreSQL database using psycopg with connection parameters
-    obtained from an environment variable. If the connection fails, it returns a default dictionary
-    indicating no data sources are available.
+    Returns the calling thread's connection to a PostgreSQL database,
+    checked out of a connection pool using connection parameters obtained from an environment variable.
+    If no connection can be obtained, it raises a DatabaseInitializationError.
 
-    The function sets keepalive parameters to maintain the connection active during periods of inactivity.
+    Connections are not shared between threads,
+    so a transaction in one thread is not committed or rolled back by another.
 
-    :return: A psycopg connection object if successful, or a dictionary with a count of 0 and an empty data list upon failure.
+    :return: A psycopg connection object.
     """
     return DatabaseConnectionSingleton().get_connection()
@@ -1,9 +1,17 @@
+import threading
+
 import sqlalchemy
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session as SQLAlchemySession
 from sqlalchemy.orm import sessionmaker
 
-from middleware.util import get_env_variable
+from middleware.request_profiling import add_sqlalchemy_query_hooks
+from middleware.util import get_env_variable, get_optional_env_int
+
+# The maximum number of connections each process holds open for sessions,
+# which must allow for every request thread and scheduled task thread.
+# This is in addition to the connections of the psycopg pool, sized by the same variable.
+DEFAULT_POOL_SIZE = 10
 
 
 class DatabaseInitializationError(Exception):
@@ -18,17 +26,21 @@ class DatabaseInitializationError(Exception):
 
 class DatabaseSessionSingleton:
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         if not cls._instance:
-            if not cls._instance:
-                cls._instance = super(DatabaseSessionSingleton, cls).__new__(cls)
-                cls._instance._session = None
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(DatabaseSessionSingleton, cls).__new__(cls)
+                    cls._instance._session = None
         return cls._instance
 
     def get_session(self) -> SQLAlchemySession:
         if self._session is None:
-            self._session = self._initialize_sqlalchemy_session()
+            with self._lock:
+                if self._session is None:
+                    self._session = self._initialize_sqlalchemy_session()
         return self._session
 
     def _initialize_sqlalchemy_session(self) -> SQLAlchemySession:
@@ -42,7 +54,18 @@ class DatabaseSessionSingleton:
             do_database_url = get_env_variable("DO_DATABASE_URL")
             do_database_url = "postgresql+psycopg" + do_database_url[10:]
 
-            engine = create_engine(do_database_url, pool_pre_ping=True)
+            # Sessions are created per call, and so may be used from any thread,
+            # each checking out its own connection from the engine's pool.
+            # No overflow connections are opened, so the pool size is a hard ceiling.
+            engine = create_engine(
+                do_database_url,
+                pool_pre_ping=True,
+                pool_size=get_optional_env_int(
+                    "DB_POOL_MAX_SIZE", default=DEFAULT_POOL_SIZE
+                ),
+                max_overflow=0,
+            )
+            add_sqlalchemy_query_hooks(engine)
             Session = sessionmaker(bind=engine)
             return Session
 
@@ -0,0 +1,95 @@
+"""
+JSON providers used by the Flask app to serialize responses.
+
+The provider is selected with the JSON_PROVIDER environment variable:
+"orjson" (the default) or "default" for the standard library provider.
+"""
+
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+import orjson
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+from pydantic import BaseModel
+
+DEFAULT_JSON_PROVIDER = "orjson"
+
+
+def json_default(o: Any) -> Any:
+    """
+    Converts objects not natively supported by the JSON encoder
+    into a serializable form.
+    """
+    if isinstance(o, (date, datetime)):
+        return o.isoformat()
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, Decimal):
+        return str(o)
+    if isinstance(o, BaseModel):
+        return o.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class UpdatedJSONProvider(DefaultJSONProvider):
+    """
+    Standard library JSON provider with support for additional types.
+    """
+
+    def default(self, o):
+        try:
+            return json_default(o)
+        except TypeError:
+            return super().default(o)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson, which serializes dates, datetimes,
+    enums, UUIDs and dataclasses natively.
+    """
+
+    sort_keys = True
+
+    def _options(self) -> int:
+        options = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=json_default, option=self._options()).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        options = self._options() | orjson.OPT_APPEND_NEWLINE
+        if self._app.debug:
+            options |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=json_default, option=options),
+            mimetype="application/json",
+        )
+
+
+JSON_PROVIDERS: dict[str, type[JSONProvider]] = {
+    "default": UpdatedJSONProvider,
+    "orjson": OrjsonProvider,
+}
+
+
+def get_json_provider(app: Flask) -> JSONProvider:
+    name = os.getenv("JSON_PROVIDER", DEFAULT_JSON_PROVIDER)
+    try:
+        provider_class = JSON_PROVIDERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON provider '{name}'. Expected one of: {list(JSON_PROVIDERS)}"
+        )
+    return provider_class(app)
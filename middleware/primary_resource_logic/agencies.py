@@ -52,6 +52,7 @@ def get_agencies(
         page=dto.page,
         limit=dto.limit,
         requested_columns=dto.requested_columns,
+        projection=True,
     )
 
     return FlaskResponseManager.make_response(
@@ -3,39 +3,47 @@ from http import HTTPStatus
 from typing import List, Dict, Any, Optional, Tuple
 
 import psycopg
-from flask import make_response
+from flask import make_response, Response
 
 from database_client.database_client import DatabaseClient
+from middleware.enums import ArchiveUpdateStatus
+from middleware.flask_response_manager import FlaskResponseManager
+from middleware.schema_and_dto_logic.primary_resource_schemas.archives_schemas import (
+    ArchivesGetRequestDTO,
+    ArchivesBatchPutRequestDTO,
+)
 from utilities.common import convert_dates_to_strings
 from psycopg import connection as PgConnection
 
 
-ARCHIVES_GET_COLUMNS = [
-    "id",
-    "source_url",
-    "update_frequency",
-    "last_cached",
-]
+MAX_BATCH_ARCHIVE_UPDATES = 1000
 
 
 def archives_get_query(
     db_client: DatabaseClient,
+    dto: ArchivesGetRequestDTO,
 ) -> List[Dict[str, Any]]:
     """
-    Processes the archives get results, either from the database and converts dates to strings.
+    Claims the data sources due for archival, most overdue first, and converts dates to strings.
 
     :param db_client: The database client object.
+    :param dto: The maximum number of data sources to claim, and how long to lease them for.
     :return: A list of dictionaries with the query results after processing and date conversion.
     """
-    results = db_client.get_data_sources_to_archive()
-    archives_combined_results = [
-        dict(zip(ARCHIVES_GET_COLUMNS, result)) for result in results
+    results = db_client.get_data_sources_to_archive(
+        limit=dto.limit, lease_seconds=dto.lease_seconds
+    )
+    return [
+        convert_dates_to_strings(
+            {
+                "id": result.id,
+                "source_url": result.url,
+                "update_frequency": result.update_frequency,
+                "last_cached": result.last_cached,
+            }
+        )
+        for result in results
     ]
-    archives_combined_results_clean = []
-    for item in archives_combined_results:
-        archives_combined_results_clean.append(convert_dates_to_strings(item))
-
-    return archives_combined_results_clean
 
 
 def update_archives_data(
@@ -60,3 +68,48 @@ def update_archives_data(
     db_client.update_last_cached(data_id, last_cached)
 
     return make_response({"status": "success"}, HTTPStatus.OK)
+
+
+def update_archives_data_batch(
+    db_client: DatabaseClient, dto: ArchivesBatchPutRequestDTO
+) -> Response:
+    """
+    Applies many archive updates in a single transaction
+
+    :param db_client: The database client
+    :param dto: The archive updates, each with an id, last_cached, and optional broken_source_url_as_of
+    :return: A response containing the result of each update, in the order submitted
+    """
+    if len(dto.entries) > MAX_BATCH_ARCHIVE_UPDATES:
+        FlaskResponseManager.abort(
+            code=HTTPStatus.BAD_REQUEST,
+            message=f"Cannot update more than {MAX_BATCH_ARCHIVE_UPDATES} archives at once",
+        )
+    updated_ids = set(
+        db_client.update_archives_batch(
+            [
+                DatabaseClient.ArchiveUpdate(
+                    id=entry.id,
+                    last_cached=entry.last_cached,
+                    broken_source_url_as_of=entry.broken_source_url_as_of,
+                )
+                for entry in dto.entries
+            ]
+        )
+    )
+    return FlaskResponseManager.make_response(
+        data={
+            "message": f"Updated {len(updated_ids)} data sources.",
+            "results": [
+                {
+                    "id": entry.id,
+                    "status": (
+                        ArchiveUpdateStatus.UPDATED.value
+                        if entry.id in updated_ids
+                        else ArchiveUpdateStatus.NOT_FOUND.value
+                    ),
+                }
+                for entry in dto.entries
+            ],
+        }
+    )
@@ -1,6 +1,7 @@
+import logging
 from dataclasses import dataclass
 from http import HTTPStatus
-from io import BytesIO
+from typing import Iterator, Optional
 
 from flask import Response
 from marshmallow import Schema, ValidationError
@@ -20,11 +21,9 @@ from middleware.primary_resource_logic.agencies import (
 from middleware.primary_resource_logic.data_sources_logic import (
     DataSourcesPostHandler,
 )
-from middleware.schema_and_dto_logic.dynamic_logic.dynamic_csv_to_schema_conversion_logic import (
-    SchemaUnflattener,
-)
-from middleware.schema_and_dto_logic.dynamic_logic.dynamic_schema_request_content_population import (
-    setup_dto_class,
+from middleware.schema_and_dto_logic.dynamic_logic.compiled_flat_row_loader import (
+    FlatRowLoader,
+    get_flat_row_loader,
 )
 from middleware.schema_and_dto_logic.primary_resource_dtos.agencies_dtos import (
     AgenciesPostDTO,
@@ -35,7 +34,13 @@ from middleware.schema_and_dto_logic.primary_resource_dtos.bulk_dtos import (
     BulkRequestDTO,
 )
 
-from middleware.util import bytes_to_text_iter, read_from_csv
+from middleware.util import iter_csv_rows, chunked
+
+logger = logging.getLogger(__name__)
+
+# The number of csv rows read, validated, and written at a time.
+# Bounds the number of rows held in memory, regardless of file size.
+BULK_CHUNK_SIZE = 500
 
 
 def replace_empty_strings_with_none(row: dict):
@@ -45,19 +50,71 @@ def replace_empty_strings_with_none(row: dict):
 
 
 def _get_raw_rows_from_csv(
-    file: BytesIO,
-):
+    file: FileStorage,
+) -> Iterator[dict]:
+    """
+    Lazily read raw rows from the csv file.
+    Errors reading the file are raised as rows are read.
+    """
     _abort_if_csv(file)
-    raw_rows = _get_raw_rows(file)
-    return raw_rows
+    return iter_csv_rows(file)
 
 
-def _get_raw_rows(file: FileStorage):
-    try:
-        return read_from_csv(file)
-    except Exception as e:
-        FlaskResponseManager.abort(
-            code=HTTPStatus.BAD_REQUEST, message=f"Error reading csv file: {e}"
+@dataclass
+class CsvReadError:
+    """
+    An error reading the csv file, after which no further rows were read
+    """
+
+    # The request id of the first row which was not read
+    request_id: int
+    message: str
+
+
+class CsvChunkReader:
+    """
+    Yields chunks of (request_id, raw_row) from the csv file.
+    If the file cannot be read, aborts if no chunk has been processed yet.
+    Otherwise, the rows read before the error are yielded as a final chunk,
+    and the error is kept in `read_error`, so that it can be reported alongside the rows written.
+    """
+
+    def __init__(self, file: FileStorage, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.chunks_processed = 0
+        self.read_error: Optional[CsvReadError] = None
+
+    def __iter__(self) -> Iterator[list[tuple[int, dict]]]:
+        for chunk in chunked(enumerate(self._iter_raw_rows()), self.chunk_size):
+            yield chunk
+            self.chunks_processed += 1
+
+    def _iter_raw_rows(self) -> Iterator[dict]:
+        raw_rows = _get_raw_rows_from_csv(self.file)
+        rows_read = 0
+        while True:
+            try:
+                raw_row = next(raw_rows)
+            except StopIteration:
+                return
+            except Exception as e:
+                self._handle_read_error(rows_read=rows_read, error=e)
+                return
+            rows_read += 1
+            yield raw_row
+
+    def _handle_read_error(self, rows_read: int, error: Exception):
+        if self.chunks_processed == 0:
+            FlaskResponseManager.abort(
+                code=HTTPStatus.BAD_REQUEST,
+                message=f"Error reading csv file: {error}",
+            )
+        logger.warning("Error reading csv file after row %s: %s", rows_read, error)
+        self.read_error = CsvReadError(
+            request_id=rows_read,
+            message=f"Error reading csv file: {error}. "
+            f"This row and all rows following it were not processed.",
         )
 
 
@@ -69,30 +126,33 @@ def _abort_if_csv(file):
 
 
 class BulkRequestManager:
+    """
+    Accumulates the outcomes of bulk requests.
+    Only ids and error messages are retained, so that requests
+    can be discarded once their chunk has been processed.
+    """
 
     def __init__(self):
-        self.requests = []
+        self.entry_ids = []
+        self.errors = {}
+        self.processed_count = 0
 
-    def add_request(self, request: PutPostRequestInfo):
-        self.requests.append(request)
+    def add_requests(self, requests: list[PutPostRequestInfo]):
+        for request in requests:
+            self.processed_count += 1
+            if request.error_message is None:
+                self.entry_ids.append(request.entry_id)
+            else:
+                self.errors[request.request_id] = request.error_message
 
-    def get_requests_with_error(self):
-        return [
-            request for request in self.requests if request.error_message is not None
-        ]
-
-    def get_requests_without_error(self):
-        return [request for request in self.requests if request.error_message is None]
+    def add_error(self, request_id: int, error_message: str):
+        self.errors[request_id] = error_message
 
     def get_error_dict(self):
-        d = {}
-        for request in self.requests:
-            if request.error_message is not None:
-                d[request.request_id] = request.error_message
-        return d
+        return self.errors
 
     def all_requests_errored_out(self):
-        return len(self.get_requests_without_error()) == 0
+        return len(self.entry_ids) == 0
 
 
 class BulkRowProcessor:
@@ -115,22 +175,14 @@ class BulkRowProcessor:
         )
         return request
 
-    def process(
-        self, unflattener: SchemaUnflattener, inner_dto_class: type, schema: Schema
-    ):
+    def process(self, row_loader: FlatRowLoader):
         try:
             replace_empty_strings_with_none(row=self.raw_row)
-            loaded_row = schema.load(self.raw_row)
+            inner_dto = row_loader.load_dto(self.raw_row)
         except ValidationError as e:
             # Handle validation error
             self.request = self.create_request_info_with_error(error_message=str(e))
             return
-        unflattened_row = unflattener.unflatten(flat_data=loaded_row)
-        inner_dto = setup_dto_class(
-            data=unflattened_row,
-            dto_class=inner_dto_class,
-            nested_dto_info_list=unflattener.nested_dto_info_list,
-        )
         self.request = self.create_completed_request(inner_dto)
 
     def create_completed_request(self, inner_dto):
@@ -158,72 +210,113 @@ class BulkConfig:
     schema: Schema
 
 
+def listify_row(raw_row: dict):
+    for k, v in raw_row.items():
+        if isinstance(v, str) and "," in v:
+            raw_row[k] = v.split(",")
+
+
 def listify_strings(raw_rows: list[dict]):
     for raw_row in raw_rows:
-        for k, v in raw_row.items():
-            if isinstance(v, str) and "," in v:
-                raw_row[k] = v.split(",")
+        listify_row(raw_row)
+
 
+def log_bulk_progress(resource_name: str, processed_count: int, error_count: int):
+    logger.info(
+        "Bulk %s: processed %s rows (%s errors)",
+        resource_name,
+        processed_count,
+        error_count,
+    )
 
-def run_bulk_agencies(bulk_config: BulkConfig) -> list[BulkPostResponse]:
-    raw_rows: list[dict] = _get_raw_rows_from_csv(file=bulk_config.dto.file)
+
+def run_bulk_agencies(
+    bulk_config: BulkConfig, chunk_size: int = BULK_CHUNK_SIZE
+) -> list[BulkPostResponse]:
     db_client = DatabaseClient()
     responses = []
-
-    for request_id, raw_row in enumerate(raw_rows):
-        try:
-            dto = AgenciesPostDTO(
-                agency_info=AgencyInfoPostDTO(
-                    name=raw_row["name"],
-                    jurisdiction_type=raw_row["jurisdiction_type"],
-                    agency_type=raw_row["agency_type"],
-                    homepage_url=raw_row["homepage_url"],
-                    lat=raw_row["lat"],
-                    lng=raw_row["lng"],
-                    defunct_year=raw_row["defunct_year"],
-                    multi_agency=raw_row["multi_agency"],
-                    no_web_presence=raw_row["no_web_presence"],
-                    submitter_contact=raw_row["submitter_contact"],
-                ),
-                location_ids=[raw_row["location_id"]] if raw_row["location_id"] else [],
+    error_count = 0
+
+    reader = CsvChunkReader(bulk_config.dto.file, chunk_size)
+    for chunk in reader:
+        for request_id, raw_row in chunk:
+            try:
+                dto = AgenciesPostDTO(
+                    agency_info=AgencyInfoPostDTO(
+                        name=raw_row["name"],
+                        jurisdiction_type=raw_row["jurisdiction_type"],
+                        agency_type=raw_row["agency_type"],
+                        homepage_url=raw_row["homepage_url"],
+                        lat=raw_row["lat"],
+                        lng=raw_row["lng"],
+                        defunct_year=raw_row["defunct_year"],
+                        multi_agency=raw_row["multi_agency"],
+                        no_web_presence=raw_row["no_web_presence"],
+                        submitter_contact=raw_row["submitter_contact"],
+                    ),
+                    location_ids=(
+                        [raw_row["location_id"]] if raw_row["location_id"] else []
+                    ),
+                )
+                agency_id = db_client.create_agency(dto)
+                response = BulkPostResponse(
+                    request_id=request_id,
+                    entry_id=agency_id,
+                )
+                responses.append(response)
+            except Exception as e:
+                error_count += 1
+                response = BulkPostResponse(
+                    request_id=request_id,
+                    error_message=str(e),
+                )
+                responses.append(response)
+        log_bulk_progress("agencies", len(responses), error_count)
+
+    if reader.read_error is not None:
+        responses.append(
+            BulkPostResponse(
+                request_id=reader.read_error.request_id,
+                error_message=reader.read_error.message,
             )
-            agency_id = db_client.create_agency(dto)
-            response = BulkPostResponse(
-                request_id=request_id,
-                entry_id=agency_id,
-            )
-            responses.append(response)
-        except Exception as e:
-            response = BulkPostResponse(
-                request_id=request_id,
-                error_message=str(e),
-            )
-            responses.append(response)
-
+        )
     return responses
 
 
 def run_bulk(
     bulk_config: BulkConfig,
-):
-    unflattener = SchemaUnflattener(
-        flat_schema_class=bulk_config.dto.csv_schema.__class__
+    resource_name: str,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> BulkRequestManager:
+    """
+    Read, validate, and write the rows of the csv file one chunk at a time,
+    so that memory use is bounded by the chunk size rather than the file size.
+    """
+    row_loader = get_flat_row_loader(
+        schema=bulk_config.schema, inner_dto_class=bulk_config.dto.inner_dto_class
     )
-    raw_rows = _get_raw_rows_from_csv(file=bulk_config.dto.file)
-    listify_strings(raw_rows)
-    schema = bulk_config.schema
+    handler = bulk_config.handler
     brm = BulkRequestManager()
-    for idx, raw_row in enumerate(raw_rows):
-        brp = bulk_config.brp_class(raw_row=raw_row, request_id=idx)
-        brp.process(
-            unflattener=unflattener,
-            inner_dto_class=bulk_config.dto.inner_dto_class,
-            schema=schema,
+    reader = CsvChunkReader(bulk_config.dto.file, chunk_size)
+    for chunk in reader:
+        requests = []
+        for request_id, raw_row in chunk:
+            listify_row(raw_row)
+            brp = bulk_config.brp_class(raw_row=raw_row, request_id=request_id)
+            brp.process(row_loader=row_loader)
+            requests.append(brp.request)
+
+        handler.mass_execute(
+            requests=[request for request in requests if request.error_message is None]
         )
-        brm.add_request(request=brp.request)
+        brm.add_requests(requests)
+        log_bulk_progress(resource_name, brm.processed_count, len(brm.errors))
 
-    handler = bulk_config.handler
-    handler.mass_execute(requests=brm.get_requests_without_error())
+    if reader.read_error is not None:
+        brm.add_error(
+            request_id=reader.read_error.request_id,
+            error_message=reader.read_error.message,
+        )
     return brm
 
 
@@ -267,9 +360,7 @@ def manage_response(
         )
 
     if include_ids:
-        kwargs = {
-            "ids": [request.entry_id for request in brm.get_requests_without_error()]
-        }
+        kwargs = {"ids": brm.entry_ids}
     else:
         kwargs = {}
 
@@ -303,6 +394,7 @@ def bulk_post_data_sources(db_client: DatabaseClient, dto: BulkRequestDTO):
             handler=DataSourcesPostHandler(),
             brp_class=BulkRowProcessor,
             schema=dto.csv_schema.__class__(exclude=["file"]),
-        )
+        ),
+        resource_name="data sources",
     )
     return manage_response(brm=brm, resource_name="data sources", verb="created")
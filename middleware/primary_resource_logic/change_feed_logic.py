@@ -0,0 +1,51 @@
+from http import HTTPStatus
+
+from flask import Response
+
+from database_client.database_client import DatabaseClient
+from database_client.db_client_dataclasses import ChangeFeedCursor
+from middleware.flask_response_manager import FlaskResponseManager
+from middleware.schema_and_dto_logic.primary_resource_schemas.change_feed_schemas import (
+    ChangesGetRequestDTO,
+)
+
+
+def get_changes_wrapper(
+    db_client: DatabaseClient, dto: ChangesGetRequestDTO
+) -> Response:
+    """
+    Returns the batch of changes following the cursor.
+    Consumers sync by requesting again with `next_cursor` until `has_more` is false.
+    If changes following the cursor have expired, consumers must resync from the start.
+    """
+    since = None if dto.since is None else ChangeFeedCursor.from_string(dto.since)
+    if since is not None and not db_client.is_change_feed_cursor_retained(since):
+        FlaskResponseManager.abort(
+            code=HTTPStatus.GONE,
+            message="Changes following the cursor have expired. "
+            "Resync by requesting without `since`.",
+        )
+    # Request one extra change to determine if more are available
+    changes = db_client.get_changes(since=since, tables=dto.tables, limit=dto.limit + 1)
+    has_more = len(changes) > dto.limit
+    changes = changes[: dto.limit]
+
+    return FlaskResponseManager.make_response(
+        data={
+            "message": f"Returned {len(changes)} changes.",
+            "data": [
+                {
+                    "cursor": str(change["cursor"]),
+                    "table_name": change["table_name"],
+                    "operation_type": change["operation_type"],
+                    "affected_id": change["affected_id"],
+                    "row_data": change["row_data"],
+                    "created_at": change["created_at"].isoformat(),
+                }
+                for change in changes
+            ],
+            "next_cursor": str(changes[-1]["cursor"]) if changes else dto.since,
+            "has_more": has_more,
+        },
+        status_code=HTTPStatus.OK,
+    )
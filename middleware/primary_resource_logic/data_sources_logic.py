@@ -121,6 +121,7 @@ def get_data_sources_wrapper(
         ),
         page=dto.page,
         limit=dto.limit,
+        projection=True,
     )
 
     return FlaskResponseManager.make_response(
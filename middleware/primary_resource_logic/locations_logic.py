@@ -16,7 +16,9 @@ from middleware.primary_resource_logic.data_requests import (
     get_data_requests_subquery_params,
 )
 
-from middleware.schema_and_dto_logic.common_schemas_and_dtos import GetByIDBaseDTO
+from middleware.schema_and_dto_logic.common_schemas_and_dtos import (
+    GetLinkedRowsByIDDTO,
+)
 
 
 def get_location_by_id_wrapper(db_client: DatabaseClient, location_id: int) -> Response:
@@ -29,7 +31,7 @@ def get_location_by_id_wrapper(db_client: DatabaseClient, location_id: int) -> R
 
 
 def get_locations_related_data_requests_wrapper(
-    db_client: DatabaseClient, access_info: AccessInfoPrimary, dto: GetByIDBaseDTO
+    db_client: DatabaseClient, access_info: AccessInfoPrimary, dto: GetLinkedRowsByIDDTO
 ) -> Response:
     results = db_client.get_linked_rows(
         link_table=Relations.LINK_LOCATIONS_DATA_REQUESTS,
@@ -45,6 +47,8 @@ def get_locations_related_data_requests_wrapper(
         ),
         build_metadata=True,
         subquery_parameters=get_data_requests_subquery_params(),
+        limit=dto.limit,
+        after=dto.after,
     )
     if results is None:
         return message_response(
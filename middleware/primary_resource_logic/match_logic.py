@@ -1,15 +1,24 @@
 from enum import Enum
+from http import HTTPStatus
 from typing import Optional, List
 
 from flask import Response
+from marshmallow import ValidationError
+from pydantic import ValidationError as PydanticValidationError
+from werkzeug.datastructures import FileStorage
 
 from database_client.database_client import DatabaseClient
 from database_client.db_client_dataclasses import WhereMapping
 from middleware.flask_response_manager import FlaskResponseManager
+from middleware.util import read_from_csv
+from middleware.schema_and_dto_logic.primary_resource_dtos.bulk_dtos import (
+    BulkRequestDTO,
+)
 from middleware.schema_and_dto_logic.primary_resource_dtos.match_dtos import (
     AgencyMatchResponseOuterDTO,
     AgencyMatchRequestDTO,
     AgencyMatchResponseInnerDTO,
+    AgencyMatchBatchRequestDTO,
 )
 
 
@@ -20,6 +29,7 @@ class AgencyMatchStatus(Enum):
 
 
 SIMILARITY_THRESHOLD = 80
+MAX_BATCH_MATCH_ENTRIES = 1000
 
 
 def get_agency_match_message(status: AgencyMatchStatus):
@@ -77,6 +87,75 @@ def try_matching_agency(
     entries: list[AgencyMatchResponseInnerDTO] = db_client.get_similar_agencies(
         name=dto.name, location_id=location_id
     )
+    return _match_response_from_entries(entries)
+
+
+def match_agencies_batch_wrapper(
+    db_client: DatabaseClient, dto: AgencyMatchBatchRequestDTO
+) -> Response:
+    results = match_agencies_batch(db_client=db_client, entries=dto.entries)
+    return format_batch_response(results)
+
+
+def match_agencies_batch_csv_wrapper(
+    db_client: DatabaseClient, dto: BulkRequestDTO
+) -> Response:
+    raw_rows = _get_raw_rows_from_csv(file=dto.file)
+    schema = dto.csv_schema.__class__(exclude=["file"])
+    entries = []
+    for row_number, raw_row in enumerate(raw_rows):
+        # Empty cells denote missing location data
+        row = {key: value for key, value in raw_row.items() if value != ""}
+        try:
+            entries.append(AgencyMatchRequestDTO(**schema.load(row)))
+        except (ValidationError, PydanticValidationError) as e:
+            FlaskResponseManager.abort(
+                code=HTTPStatus.BAD_REQUEST,
+                message=f"Error in row {row_number}: {e}",
+            )
+    results = match_agencies_batch(db_client=db_client, entries=entries)
+    return format_batch_response(results)
+
+
+def _get_raw_rows_from_csv(file: FileStorage) -> list[dict]:
+    if file is None or file.filename.split(".")[-1] != "csv":
+        FlaskResponseManager.abort(
+            code=HTTPStatus.UNSUPPORTED_MEDIA_TYPE, message="File must be of type csv"
+        )
+    try:
+        return read_from_csv(file)
+    except Exception as e:
+        FlaskResponseManager.abort(
+            code=HTTPStatus.BAD_REQUEST, message=f"Error reading csv file: {e}"
+        )
+
+
+def match_agencies_batch(
+    db_client: DatabaseClient, entries: list[AgencyMatchRequestDTO]
+) -> list[AgencyMatchResponse]:
+    if len(entries) > MAX_BATCH_MATCH_ENTRIES:
+        FlaskResponseManager.abort(
+            code=HTTPStatus.BAD_REQUEST,
+            message=f"Cannot match more than {MAX_BATCH_MATCH_ENTRIES} agencies at once",
+        )
+    return [
+        _match_response_from_entries(agency_entries)
+        for agency_entries in db_client.get_similar_agencies_batch(entries)
+    ]
+
+
+def format_batch_response(results: list[AgencyMatchResponse]) -> Response:
+    return FlaskResponseManager.make_response(
+        data={
+            "message": f"Matched {len(results)} agencies.",
+            "results": [result.to_json() for result in results],
+        }
+    )
+
+
+def _match_response_from_entries(
+    entries: list[AgencyMatchResponseInnerDTO],
+) -> AgencyMatchResponse:
     if len(entries) == 0:
         return _no_match_response()
 
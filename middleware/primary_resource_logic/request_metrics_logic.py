@@ -0,0 +1,16 @@
+from flask import Response
+
+from database_client.database_client import DatabaseClient
+from middleware.process_metrics import process_metrics_publisher
+from middleware.prometheus_metrics import PROMETHEUS_CONTENT_TYPE
+
+
+def get_request_metrics(db_client: DatabaseClient) -> Response:
+    """
+    Returns the metrics of every worker process, summed, in the Prometheus text format.
+    The metrics of the process handling the request are published first so they are current,
+    while those of other processes are at most the publishing interval old.
+    """
+    process_metrics_publisher.publish()
+    writer = process_metrics_publisher.directory.read()
+    return Response(writer.render(), mimetype=PROMETHEUS_CONTENT_TYPE)
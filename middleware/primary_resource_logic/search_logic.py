@@ -17,6 +17,7 @@ from middleware.dynamic_request_logic.supporting_classes import (
 )
 from middleware.enums import JurisdictionSimplified, Relations, OutputFormatEnum
 from middleware.flask_response_manager import FlaskResponseManager
+from middleware.schema_and_dto_logic.common_schemas_and_dtos import LinkedRowsPageDTO
 from middleware.schema_and_dto_logic.primary_resource_schemas.search_schemas import (
     SearchRequestsDTO,
     FederalSearchRequestDTO,
@@ -26,24 +27,9 @@ from middleware.util import get_datetime_now, write_to_csv, find_root_directory
 from utilities.enums import RecordCategories
 
 
-def get_jurisdiction_type_enum(
-    jurisdiction_type_str: str,
-) -> Optional[JurisdictionSimplified]:
-    if jurisdiction_type_str in [
-        "local",
-        "school",
-        "military",
-        "tribal",
-        "transit",
-        "port",
-    ]:
-        return JurisdictionSimplified.LOCALITY
-    return JurisdictionSimplified(jurisdiction_type_str)
-
-
-def format_search_results(search_results: list[dict]) -> dict:
+def format_search_results(grouped_search_results: list[dict]) -> dict:
     """
-    Convert results to the following format:
+    Convert results, grouped and counted by jurisdiction in the database, to the following format:
 
     {
       "count": <number>,
@@ -67,7 +53,10 @@ def format_search_results(search_results: list[dict]) -> dict:
         }
     }
 
-    :param search_results:
+    Counts include all matching results for each jurisdiction,
+    even if only a page of the results is included.
+
+    :param grouped_search_results: One row per jurisdiction, with its count and results
     :return:
     """
 
@@ -78,12 +67,12 @@ def format_search_results(search_results: list[dict]) -> dict:
     for jurisdiction in [j.value for j in JurisdictionSimplified]:
         data[jurisdiction] = {"count": 0, "results": []}
 
-    for result in search_results:
-        jurisdiction_str = result.get("jurisdiction_type")
-        jurisdiction = get_jurisdiction_type_enum(jurisdiction_str)
-        data[jurisdiction.value]["count"] += 1
-        data[jurisdiction.value]["results"].append(result)
-        response["count"] += 1
+    for group in grouped_search_results:
+        data[group["jurisdiction"]] = {
+            "count": group["count"],
+            "results": group["results"],
+        }
+        response["count"] += group["count"]
 
     return response
 
@@ -105,15 +94,28 @@ def search_wrapper(
 ) -> Response:
     create_search_record(access_info, db_client, dto)
     explicit_record_categories = get_explicit_record_categories(dto.record_categories)
-    search_results = db_client.search_with_location_and_record_type(
-        location_id=dto.location_id,
-        record_categories=explicit_record_categories,
-        record_types=dto.record_types,
+    search_parameters = {
+        "location_id": dto.location_id,
         # Pass modified record categories, which breaks down ALL into individual categories
-    )
-    return send_search_results(
-        search_results=search_results,
-        output_format=dto.output_format,
+        "record_categories": explicit_record_categories,
+        "record_types": dto.record_types,
+    }
+    if dto.output_format == OutputFormatEnum.JSON:
+        # Results are grouped, counted, and paginated by jurisdiction in the database
+        grouped_search_results = db_client.search_with_location_and_record_type_grouped(
+            **search_parameters,
+            per_jurisdiction_limit=dto.per_jurisdiction_limit,
+            per_jurisdiction_offset=dto.per_jurisdiction_offset,
+        )
+        return send_as_json(grouped_search_results)
+    if dto.output_format == OutputFormatEnum.CSV:
+        search_results = db_client.search_with_location_and_record_type(
+            **search_parameters
+        )
+        return send_as_csv(search_results)
+    FlaskResponseManager.abort(
+        message="Invalid output format.",
+        code=HTTPStatus.BAD_REQUEST,
     )
 
 
@@ -145,20 +147,8 @@ def create_search_record(access_info, db_client, dto):
     )
 
 
-def send_search_results(search_results: list[dict], output_format: OutputFormatEnum):
-    if output_format == OutputFormatEnum.JSON:
-        return send_as_json(search_results)
-    elif output_format == OutputFormatEnum.CSV:
-        return send_as_csv(search_results)
-    else:
-        FlaskResponseManager.abort(
-            message="Invalid output format.",
-            code=HTTPStatus.BAD_REQUEST,
-        )
-
-
-def send_as_json(search_results):
-    formatted_search_results = format_search_results(search_results)
+def send_as_json(grouped_search_results: list[dict]):
+    formatted_search_results = format_search_results(grouped_search_results)
     return make_response(formatted_search_results, HTTPStatus.OK)
 
 
@@ -211,9 +201,12 @@ def try_getting_location_id_and_raise_error_if_not_found(
 def get_followed_searches(
     db_client: DatabaseClient,
     access_info: AccessInfoPrimary,
+    dto: LinkedRowsPageDTO,
 ) -> Response:
     results = db_client.get_user_followed_searches(
         left_id=access_info.get_user_id(),
+        limit=dto.limit,
+        after=dto.after,
     )
     results["message"] = "Followed searches found."
     return FlaskResponseManager.make_response(results)
@@ -11,15 +11,19 @@ from middleware.flask_response_manager import FlaskResponseManager
 from utilities.enums import SourceMappingEnum
 
 
-def normalize_url(source_url: str) -> str:
-    # Remove 'https://', 'http://' from the beginning
-    url = re.sub(r"^(https://|http://)", "", source_url)
-    # Remove "www." from the beginning
-    url = re.sub(r"^www\.", "", url)
-    # Remove trailing '/'
-    url = url.rstrip("/")
+# Matches 'https://' or 'http://', followed by 'www.', at the beginning of a url
+URL_PREFIX_PATTERN = re.compile(r"^(?:https?://)?(?:www\.)?")
+
+MAX_BATCH_URL_CHECKS = 1000
+
 
-    return url
+def normalize_url(source_url: str) -> str:
+    """
+    Normalizes a url for duplicate checking.
+    Must be kept consistent with the `source_url_normalized` column of `data_sources`.
+    """
+    # Remove the scheme and "www." from the beginning, and trailing '/'
+    return URL_PREFIX_PATTERN.sub("", source_url, count=1).rstrip("/")
 
 
 class UniqueURLCheckerRequestSchema(Schema):
@@ -81,9 +85,73 @@ class UniqueURLCheckerResponseOuterSchema(Schema):
     )
 
 
+class UniqueURLCheckerBatchRequestSchema(Schema):
+    urls = fields.List(
+        fields.Str(
+            metadata={
+                "description": "A URL to check.",
+                "source": SourceMappingEnum.JSON,
+            },
+        ),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_BATCH_URL_CHECKS),
+        metadata={
+            "description": "The URLs to check.",
+            "source": SourceMappingEnum.JSON,
+        },
+    )
+
+
+class UniqueURLCheckerBatchRequestDTO(BaseModel):
+    urls: list[str]
+
+
+class UniqueURLCheckerBatchResponseInnerSchema(UniqueURLCheckerResponseOuterSchema):
+    url = fields.Str(
+        required=True,
+        metadata={
+            "description": "The URL that was checked, as submitted.",
+            "source": SourceMappingEnum.JSON,
+        },
+    )
+
+
+class UniqueURLCheckerBatchResponseOuterSchema(Schema):
+    results = fields.List(
+        fields.Nested(
+            UniqueURLCheckerBatchResponseInnerSchema,
+            required=True,
+            metadata={
+                "description": "The duplicates of a URL.",
+                "source": SourceMappingEnum.JSON,
+            },
+        ),
+        required=True,
+        metadata={
+            "description": "The duplicates of each URL, in the order submitted.",
+            "source": SourceMappingEnum.JSON,
+        },
+    )
+
+
 def unique_url_checker_wrapper(
     db_client: DatabaseClient, dto: UniqueURLCheckerRequestDTO
 ) -> Response:
     return FlaskResponseManager.make_response(
         data={"duplicates": db_client.check_for_url_duplicates(dto.url)}
     )
+
+
+def unique_url_checker_batch_wrapper(
+    db_client: DatabaseClient, dto: UniqueURLCheckerBatchRequestDTO
+) -> Response:
+    normalized_urls = [normalize_url(url) for url in dto.urls]
+    duplicates = db_client.check_for_url_duplicates_batch(normalized_urls)
+    return FlaskResponseManager.make_response(
+        data={
+            "results": [
+                {"url": url, "duplicates": duplicates[normalized_url]}
+                for url, normalized_url in zip(dto.urls, normalized_urls)
+            ]
+        }
+    )
@@ -1,5 +1,6 @@
 from http import HTTPStatus
 
+from database_client.constants import LINKED_ROWS_DEFAULT_LIMIT
 from database_client.database_client import DatabaseClient
 from database_client.db_client_dataclasses import WhereMapping
 from database_client.enums import RelationRoleEnum
@@ -60,7 +61,10 @@ def get_user_by_id_wrapper(
     email = db_client.get_user_email(user_id=user_id)
     external_accounts = db_client.get_user_external_accounts(user_id=user_id)
     recent_searches = db_client.get_user_recent_searches(user_id=user_id)
-    followed_searches = db_client.get_user_followed_searches(left_id=user_id)
+    # The first page of followed searches, which may be continued through GET /search/follow
+    followed_searches = db_client.get_user_followed_searches(
+        left_id=user_id, limit=LINKED_ROWS_DEFAULT_LIMIT
+    )
     data_requests = get_owner_data_requests(
         db_client=db_client, dto=GetManyBaseDTO(page=1), user_id=user_id
     )
@@ -0,0 +1,115 @@
+"""
+Collects the metrics each worker process keeps in memory,
+and publishes them to the directory shared by the worker processes.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+
+from middleware.flask_response_manager import FlaskResponseManager
+from middleware.prometheus_metrics import (
+    PrometheusTextWriter,
+    ProcessMetricsDirectory,
+    get_process_metrics_directory,
+)
+from middleware.query_observability import query_observer
+from middleware.request_profiling import request_metrics
+from middleware.third_party_interaction_logic.http_session import (
+    outbound_request_metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between each process publishing its metrics
+PUBLISH_INTERVAL_SECONDS = 5
+
+
+def write_outbound_request_metrics(writer: PrometheusTextWriter):
+    host_latencies = sorted(outbound_request_metrics.get_host_latencies().items())
+    writer.add_counter(
+        "outbound_http_requests_total",
+        "Requests sent to third parties, including retries.",
+        (({"host": host}, latency.request_count) for host, latency in host_latencies),
+    )
+    writer.add_counter(
+        "outbound_http_request_errors_total",
+        "Requests to third parties which failed or returned a 5xx status.",
+        (({"host": host}, latency.error_count) for host, latency in host_latencies),
+    )
+    writer.add_counter(
+        "outbound_http_request_duration_seconds_total",
+        "Time spent on requests to third parties.",
+        (({"host": host}, latency.total_seconds) for host, latency in host_latencies),
+    )
+
+
+def write_response_validation_metrics(writer: PrometheusTextWriter):
+    with FlaskResponseManager._counts_lock:
+        validation_counts = sorted(FlaskResponseManager.validation_counts.items())
+        violation_counts = sorted(FlaskResponseManager.violation_counts.items())
+    writer.add_counter(
+        "response_validations_total",
+        "Responses validated against their schema.",
+        (({"schema": schema}, count) for schema, count in validation_counts),
+    )
+    writer.add_counter(
+        "response_validation_violations_total",
+        "Responses which failed validation against their schema.",
+        (({"schema": schema}, count) for schema, count in violation_counts),
+    )
+
+
+def collect_process_metrics() -> PrometheusTextWriter:
+    writer = PrometheusTextWriter()
+    request_metrics.write_prometheus(writer)
+    query_observer.write_prometheus(writer)
+    write_outbound_request_metrics(writer)
+    write_response_validation_metrics(writer)
+    return writer
+
+
+class ProcessMetricsPublisher:
+    """
+    Publishes the metrics of the current process to the shared directory,
+    periodically in the background and when the process exits.
+    """
+
+    def __init__(
+        self,
+        directory: ProcessMetricsDirectory,
+        interval_seconds: float = PUBLISH_INTERVAL_SECONDS,
+    ):
+        self.directory = directory
+        self.interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._started_pid = None
+
+    def publish(self):
+        try:
+            self.directory.write(collect_process_metrics())
+        except OSError as e:
+            logger.warning("Could not publish process metrics: %s", e)
+
+    def start(self):
+        """
+        Starts publishing in the background, once per process
+        """
+        with self._lock:
+            if self._started_pid == os.getpid():
+                return
+            self._started_pid = os.getpid()
+        threading.Thread(
+            target=self._run, name="process-metrics-publisher", daemon=True
+        ).start()
+        atexit.register(self.publish)
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval_seconds)
+            self.publish()
+
+
+process_metrics_publisher = ProcessMetricsPublisher(get_process_metrics_directory())
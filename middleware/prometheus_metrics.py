@@ -0,0 +1,234 @@
+"""
+Metric types rendered in the Prometheus text exposition format,
+for metrics which each worker process keeps in memory.
+Each process shares its metrics through a directory, so that they are served summed across processes.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """
+    Counts observations into cumulative buckets, as Prometheus histograms do.
+    """
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        index = bisect_left(self.buckets, value)
+        if index < len(self.bucket_counts):
+            self.bucket_counts[index] += 1
+
+    def get_cumulative_counts(self) -> list[tuple[str, int]]:
+        """
+        Returns the number of observations less than or equal to each bucket,
+        including the `+Inf` bucket
+        """
+        cumulative_counts = []
+        total = 0
+        for bucket, bucket_count in zip(self.buckets, self.bucket_counts):
+            total += bucket_count
+            cumulative_counts.append((str(bucket), total))
+        cumulative_counts.append(("+Inf", self.count))
+        return cumulative_counts
+
+
+# A sample's name and labels
+SampleKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class MetricFamily:
+    """
+    The samples of a metric, keyed by sample name and labels
+    """
+
+    metric_type: str
+    description: str
+    samples: dict[SampleKey, float] = field(default_factory=dict)
+
+    def add_sample(self, key: SampleKey, value: float):
+        # Samples with the same name and labels, such as those of different processes, are summed
+        self.samples[key] = self.samples.get(key, 0) + value
+
+
+class PrometheusTextWriter:
+    """
+    Writes metrics in the Prometheus text exposition format.
+    """
+
+    def __init__(self):
+        self.families: dict[str, MetricFamily] = {}
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+    @staticmethod
+    def _get_sample_key(name: str, labels: dict) -> SampleKey:
+        return name, tuple((label, str(value)) for label, value in labels.items())
+
+    def _format_labels(self, labels: tuple[tuple[str, str], ...]) -> str:
+        if not labels:
+            return ""
+        formatted = ",".join(
+            f'{name}="{self._escape(value)}"' for name, value in labels
+        )
+        return "{" + formatted + "}"
+
+    def _get_family(
+        self, name: str, metric_type: str, description: str
+    ) -> MetricFamily:
+        family = self.families.get(name)
+        if family is None:
+            family = MetricFamily(metric_type=metric_type, description=description)
+            self.families[name] = family
+        return family
+
+    def add_counter(
+        self, name: str, description: str, samples: Iterable[tuple[dict, float]]
+    ):
+        family = self._get_family(name, "counter", description)
+        for labels, value in samples:
+            family.add_sample(self._get_sample_key(name, labels), value)
+
+    def add_histogram(
+        self, name: str, description: str, samples: Iterable[tuple[dict, Histogram]]
+    ):
+        family = self._get_family(name, "histogram", description)
+        for labels, histogram in samples:
+            for bucket, cumulative_count in histogram.get_cumulative_counts():
+                family.add_sample(
+                    self._get_sample_key(f"{name}_bucket", {**labels, "le": bucket}),
+                    cumulative_count,
+                )
+            family.add_sample(
+                self._get_sample_key(f"{name}_sum", labels), histogram.sum
+            )
+            family.add_sample(
+                self._get_sample_key(f"{name}_count", labels), histogram.count
+            )
+
+    def merge(self, other: "PrometheusTextWriter"):
+        """
+        Adds the samples of another writer to this writer's
+        """
+        for name, other_family in other.families.items():
+            family = self._get_family(
+                name, other_family.metric_type, other_family.description
+            )
+            for key, value in other_family.samples.items():
+                family.add_sample(key, value)
+
+    def to_dict(self) -> dict:
+        return {
+            name: {
+                "metric_type": family.metric_type,
+                "description": family.description,
+                "samples": [
+                    [sample_name, labels, value]
+                    for (sample_name, labels), value in family.samples.items()
+                ],
+            }
+            for name, family in self.families.items()
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "PrometheusTextWriter":
+        writer = PrometheusTextWriter()
+        for name, family_data in data.items():
+            family = writer._get_family(
+                name, family_data["metric_type"], family_data["description"]
+            )
+            for sample_name, labels, value in family_data["samples"]:
+                key = sample_name, tuple(tuple(label) for label in labels)
+                family.add_sample(key, value)
+        return writer
+
+    def render(self) -> str:
+        lines = []
+        for name, family in self.families.items():
+            lines.append(f"# HELP {name} {family.description}")
+            lines.append(f"# TYPE {name} {family.metric_type}")
+            for (sample_name, labels), value in family.samples.items():
+                lines.append(f"{sample_name}{self._format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class ProcessMetricsDirectory:
+    """
+    Shares the metrics of each worker process through a file per process in a directory,
+    so that the metrics of every process can be served together.
+
+    The files of exited processes are kept, so that summed counters
+    do not decrease when a worker process is replaced.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _get_process_path(self, pid: int) -> str:
+        return os.path.join(self.path, f"metrics_{pid}.json")
+
+    def write(self, writer: PrometheusTextWriter):
+        """
+        Replaces the metrics of the calling process
+        """
+        os.makedirs(self.path, exist_ok=True)
+        path = self._get_process_path(os.getpid())
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump(writer.to_dict(), f)
+        # Replaced atomically, so that a partially written file is never read
+        os.replace(temporary_path, path)
+
+    def read(self) -> PrometheusTextWriter:
+        """
+        Returns the metrics of every process, summed
+        """
+        writer = PrometheusTextWriter()
+        try:
+            file_names = sorted(os.listdir(self.path))
+        except FileNotFoundError:
+            return writer
+        for file_name in file_names:
+            if not file_name.endswith(".json"):
+                continue
+            path = os.path.join(self.path, file_name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    process_writer = PrometheusTextWriter.from_dict(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning("Could not read process metrics from %s: %s", path, e)
+                continue
+            writer.merge(process_writer)
+        return writer
+
+    def clear(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def get_process_metrics_directory() -> ProcessMetricsDirectory:
+    return ProcessMetricsDirectory(
+        os.getenv("METRICS_DIRECTORY")
+        or os.path.join(tempfile.gettempdir(), "app_metrics")
+    )
@@ -0,0 +1,292 @@
+"""
+Observes the queries built by `DynamicQueryConstructor`.
+
+Queries are fingerprinted by the constructor method which built them,
+and the duration and row count of each execution is recorded per fingerprint.
+
+Read queries slower than a threshold are run again under `EXPLAIN (ANALYZE, BUFFERS)`,
+and the plan is stored in `slow_query_log`, so that a plan regression is visible as soon as it ships.
+As this runs the query a second time, each fingerprint's plan is captured
+at most once per interval, per worker process.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Optional
+
+import psycopg
+from psycopg import sql
+from psycopg.types.json import Jsonb
+from sqlalchemy import Executable
+
+from middleware.enums import Relations
+from middleware.prometheus_metrics import (
+    Histogram,
+    PrometheusTextWriter,
+    LATENCY_BUCKETS_SECONDS,
+)
+from middleware.util import get_optional_env_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_THRESHOLD_MS = 500
+DEFAULT_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS = 300
+# The SQLAlchemy execution option under which a statement's fingerprint is kept
+FINGERPRINT_EXECUTION_OPTION = "query_fingerprint"
+# Only queries starting with these may be run under EXPLAIN ANALYZE without side effects
+READ_QUERY_PREFIXES = ("SELECT", "WITH")
+
+
+def fingerprint_query(func: Callable) -> Callable:
+    """
+    Fingerprints the queries built by a `DynamicQueryConstructor` method with the method's name.
+    The method must build a psycopg `Composable` or a SQLAlchemy statement.
+    """
+    fingerprint = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        query = func(*args, **kwargs)
+        if isinstance(query, sql.Composable):
+            query.fingerprint = fingerprint
+            return query
+        if isinstance(query, Executable):
+            return query.execution_options(
+                **{FINGERPRINT_EXECUTION_OPTION: fingerprint}
+            )
+        raise TypeError(
+            f"Cannot fingerprint query of type {type(query).__name__} built by {fingerprint}"
+        )
+
+    return wrapper
+
+
+def get_query_fingerprint(query: Any) -> Optional[str]:
+    return getattr(query, "fingerprint", None)
+
+
+class QueryObservabilityPolicy:
+    """
+    Determines which queries are slow, and how often their plans are captured.
+    """
+
+    def __init__(
+        self,
+        slow_query_threshold_ms: int = DEFAULT_SLOW_QUERY_THRESHOLD_MS,
+        explain_interval_seconds: int = DEFAULT_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS,
+    ):
+        """
+        :param slow_query_threshold_ms: Queries taking at least this long are slow.
+        :param explain_interval_seconds: The minimum time between plan captures for each fingerprint.
+        """
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.explain_interval_seconds = explain_interval_seconds
+
+    @staticmethod
+    def from_env() -> "QueryObservabilityPolicy":
+        return QueryObservabilityPolicy(
+            slow_query_threshold_ms=get_optional_env_int(
+                "SLOW_QUERY_THRESHOLD_MS", default=DEFAULT_SLOW_QUERY_THRESHOLD_MS
+            ),
+            explain_interval_seconds=get_optional_env_int(
+                "SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS",
+                default=DEFAULT_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS,
+            ),
+        )
+
+    def is_slow(self, duration_seconds: float) -> bool:
+        return duration_seconds * 1000 >= self.slow_query_threshold_ms
+
+
+@dataclass
+class QueryStatistics:
+    duration: Histogram = field(
+        default_factory=lambda: Histogram(LATENCY_BUCKETS_SECONDS)
+    )
+    row_count: int = 0
+    slow_count: int = 0
+    # The monotonic time of the fingerprint's last plan capture
+    last_explained_at: Optional[float] = None
+
+
+class QueryObserver:
+    """
+    Records the executions of fingerprinted queries,
+    and captures the plans of those which are slow.
+    """
+
+    def __init__(self, policy: QueryObservabilityPolicy):
+        self.policy = policy
+        self._lock = Lock()
+        self.statistics: dict[str, QueryStatistics] = defaultdict(QueryStatistics)
+
+    def record(self, fingerprint: str, duration_seconds: float, row_count: int) -> bool:
+        """
+        Records an execution of a query.
+
+        :return: Whether the query's plan should be captured
+        """
+        is_slow = self.policy.is_slow(duration_seconds)
+        with self._lock:
+            statistics = self.statistics[fingerprint]
+            statistics.duration.observe(duration_seconds)
+            statistics.row_count += max(row_count, 0)
+            if not is_slow:
+                return False
+            statistics.slow_count += 1
+            now = time.monotonic()
+            if (
+                statistics.last_explained_at is not None
+                and now - statistics.last_explained_at
+                < self.policy.explain_interval_seconds
+            ):
+                return False
+            statistics.last_explained_at = now
+            return True
+
+    def record_execution(
+        self,
+        connection: psycopg.Connection,
+        fingerprint: str,
+        query: Any,
+        params: Any,
+        duration_seconds: float,
+        row_count: int,
+    ):
+        """
+        Records an execution of a query, capturing its plan if it is slow
+        """
+        if self.record(fingerprint, duration_seconds, row_count):
+            capture_slow_query(
+                connection=connection,
+                fingerprint=fingerprint,
+                query=query,
+                params=params,
+                duration_seconds=duration_seconds,
+                row_count=row_count,
+            )
+
+    @contextmanager
+    def observe(self, cursor: psycopg.Cursor, query: Any, params: Any = None):
+        """
+        Records the execution of the query within the context, if it is fingerprinted
+        """
+        fingerprint = get_query_fingerprint(query)
+        if fingerprint is None:
+            yield
+            return
+        start = time.perf_counter()
+        yield
+        self.record_execution(
+            connection=cursor.connection,
+            fingerprint=fingerprint,
+            query=query,
+            params=params,
+            duration_seconds=time.perf_counter() - start,
+            row_count=cursor.rowcount,
+        )
+
+    def reset(self):
+        with self._lock:
+            self.statistics.clear()
+
+    def write_prometheus(self, writer: PrometheusTextWriter):
+        with self._lock:
+            statistics = sorted(self.statistics.items())
+            writer.add_histogram(
+                "db_query_duration_seconds",
+                "Time taken by queries, by the constructor method which built them.",
+                (
+                    ({"fingerprint": fingerprint}, query_statistics.duration)
+                    for fingerprint, query_statistics in statistics
+                ),
+            )
+            writer.add_counter(
+                "db_query_rows_total",
+                "Rows returned or affected by queries.",
+                (
+                    ({"fingerprint": fingerprint}, query_statistics.row_count)
+                    for fingerprint, query_statistics in statistics
+                ),
+            )
+            writer.add_counter(
+                "db_slow_queries_total",
+                "Queries which exceeded the slow query threshold.",
+                (
+                    ({"fingerprint": fingerprint}, query_statistics.slow_count)
+                    for fingerprint, query_statistics in statistics
+                ),
+            )
+
+
+def get_query_text(connection: psycopg.Connection, query: Any) -> str:
+    if isinstance(query, sql.Composable):
+        return query.as_string(connection)
+    return query
+
+
+def get_explain_query(query: Any) -> sql.Composable:
+    if not isinstance(query, sql.Composable):
+        query = sql.SQL(query)
+    return sql.SQL("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ") + query
+
+
+def is_read_query(query_text: str) -> bool:
+    return query_text.lstrip().upper().startswith(READ_QUERY_PREFIXES)
+
+
+def capture_slow_query(
+    connection: psycopg.Connection,
+    fingerprint: str,
+    query: Any,
+    params: Any,
+    duration_seconds: float,
+    row_count: int,
+):
+    """
+    Runs a slow read query again under `EXPLAIN (ANALYZE, BUFFERS)`, and logs its plan to `slow_query_log`.
+
+    This is done within a savepoint of the query's transaction,
+    so that a failure does not affect the transaction.
+    """
+    query_text = get_query_text(connection, query)
+    if not is_read_query(query_text):
+        return
+    try:
+        with connection.transaction():
+            # A plain cursor, so these queries are not themselves observed or profiled
+            cursor = psycopg.Cursor(connection)
+            cursor.execute(get_explain_query(query), params)
+            plan = cursor.fetchone()[0]
+            cursor.execute(
+                sql.SQL(
+                    """
+                    INSERT INTO {table} (fingerprint, duration_ms, row_count, query, plan)
+                    VALUES (%s, %s, %s, %s, %s)
+                    """
+                ).format(table=sql.Identifier(Relations.SLOW_QUERY_LOG.value)),
+                (
+                    fingerprint,
+                    duration_seconds * 1000,
+                    row_count,
+                    query_text,
+                    Jsonb(plan),
+                ),
+            )
+    except psycopg.Error as e:
+        logger.warning("Could not capture plan of slow query %s: %s", fingerprint, e)
+        return
+    logger.warning(
+        "Slow query %s took %.0f ms; plan captured to %s",
+        fingerprint,
+        duration_seconds * 1000,
+        Relations.SLOW_QUERY_LOG.value,
+    )
+
+
+query_observer = QueryObserver(policy=QueryObservabilityPolicy.from_env())
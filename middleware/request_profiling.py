@@ -0,0 +1,467 @@
+"""
+Profiles requests to the app, recording for each endpoint:
+- a histogram of request latency
+- the number of database queries each request makes, and the time spent on them
+- the time spent in each phase of a request (authentication, DTO population and serialization)
+
+Database queries are timed by hooks on psycopg cursors and SQLAlchemy engines,
+and only counted while a request is being profiled.
+
+Requests slower than a threshold are logged.
+A sampled percentage of requests may also be run under a profiler,
+whose output is written to a directory for those requests which turn out to be slow.
+
+Metrics are kept per worker process, and rendered in the Prometheus text format
+summed across the worker processes.
+"""
+
+import cProfile
+import logging
+import os
+import random
+import re
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from typing import Optional
+
+import psycopg
+from flask import Flask, Response, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from middleware.enums import RequestPhase
+from middleware.prometheus_metrics import (
+    Histogram,
+    PrometheusTextWriter,
+    LATENCY_BUCKETS_SECONDS,
+)
+from middleware.query_observability import FINGERPRINT_EXECUTION_OPTION, query_observer
+from middleware.util import get_optional_env_int
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+DEFAULT_SLOW_REQUEST_THRESHOLD_MS = 1000
+# Requests which did not match a route
+UNMATCHED_ENDPOINT = "<unmatched>"
+
+
+@dataclass
+class RequestProfile:
+    """
+    The profile of the request in progress
+    """
+
+    start: float = field(default_factory=time.perf_counter)
+    phase_seconds: dict[RequestPhase, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+    db_query_count: int = 0
+    db_seconds: float = 0.0
+    profiler: Optional["RequestProfiler"] = None
+    is_profiling: bool = False
+
+    def start_profiler(self):
+        try:
+            self.profiler.start()
+        except ValueError:
+            # Another profiler is already running in this process
+            self.profiler = None
+            return
+        self.is_profiling = True
+
+    def stop_profiler(self):
+        if self.is_profiling:
+            self.profiler.stop()
+            self.is_profiling = False
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "current_request_profile", default=None
+)
+
+
+def get_request_profile() -> Optional[RequestProfile]:
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_phase(phase: RequestPhase):
+    """
+    Adds the time spent within the context to the given phase of the request in progress, if any
+    """
+    profile = get_request_profile()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.phase_seconds[phase] += time.perf_counter() - start
+
+
+@contextmanager
+def profile_db_query():
+    """
+    Counts a database query made within the context against the request in progress, if any
+    """
+    profile = get_request_profile()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.db_query_count += 1
+        profile.db_seconds += time.perf_counter() - start
+
+
+class ProfiledCursor(psycopg.Cursor):
+    """
+    A psycopg cursor whose queries are counted against the request in progress,
+    and whose fingerprinted queries are observed.
+    """
+
+    def execute(self, query, params=None, **kwargs):
+        with profile_db_query(), query_observer.observe(self, query, params):
+            return super().execute(query, params, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        with profile_db_query():
+            return super().executemany(*args, **kwargs)
+
+
+def add_sqlalchemy_query_hooks(engine: Engine):
+    """
+    Counts the queries made through the engine against the request in progress,
+    and observes those which are fingerprinted.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        context.profile_query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "profile_query_start", None)
+        if start is None:
+            return
+        duration_seconds = time.perf_counter() - start
+        profile = get_request_profile()
+        if profile is not None:
+            profile.db_query_count += 1
+            profile.db_seconds += duration_seconds
+        fingerprint = context.execution_options.get(FINGERPRINT_EXECUTION_OPTION)
+        if fingerprint is None or executemany:
+            return
+        query_observer.record_execution(
+            connection=cursor.connection,
+            fingerprint=fingerprint,
+            query=statement,
+            params=parameters,
+            duration_seconds=duration_seconds,
+            row_count=cursor.rowcount,
+        )
+
+
+class CProfileRequestProfiler:
+    extension = "prof"
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        self._profile.enable()
+
+    def stop(self):
+        self._profile.disable()
+
+    def write(self, path: str):
+        self._profile.dump_stats(path)
+
+
+class PyinstrumentRequestProfiler:
+    extension = "html"
+
+    def __init__(self):
+        # Optional dependency, only required when selected
+        from pyinstrument import Profiler
+
+        self._profiler = Profiler(async_mode="disabled")
+
+    def start(self):
+        self._profiler.start()
+
+    def stop(self):
+        self._profiler.stop()
+
+    def write(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self._profiler.output_html())
+
+
+RequestProfiler = CProfileRequestProfiler | PyinstrumentRequestProfiler
+
+REQUEST_PROFILERS: dict[str, type[RequestProfiler]] = {
+    "cprofile": CProfileRequestProfiler,
+    "pyinstrument": PyinstrumentRequestProfiler,
+}
+
+
+class RequestProfilingPolicy:
+    """
+    Determines which requests are slow, and which are run under a profiler.
+    """
+
+    def __init__(
+        self,
+        slow_request_threshold_ms: int = DEFAULT_SLOW_REQUEST_THRESHOLD_MS,
+        profiler_name: Optional[str] = None,
+        profile_sample_rate: float = 1,
+        profile_directory: Optional[str] = None,
+    ):
+        """
+        :param slow_request_threshold_ms: Requests taking at least this long are logged as slow.
+        :param profiler_name: The profiler to run sampled requests under, if any.
+        :param profile_sample_rate: The percentage of requests to profile.
+        :param profile_directory: The directory to write the profiles of slow requests to.
+        """
+        if profiler_name is not None and profiler_name not in REQUEST_PROFILERS:
+            raise ValueError(
+                f"Unknown request profiler '{profiler_name}'. Expected one of: {list(REQUEST_PROFILERS)}"
+            )
+        self.slow_request_threshold_ms = slow_request_threshold_ms
+        self.profiler_name = profiler_name
+        self.profile_sample_rate = profile_sample_rate
+        self.profile_directory = profile_directory or os.path.join(
+            tempfile.gettempdir(), "request_profiles"
+        )
+
+    @staticmethod
+    def from_env() -> "RequestProfilingPolicy":
+        return RequestProfilingPolicy(
+            slow_request_threshold_ms=get_optional_env_int(
+                "SLOW_REQUEST_THRESHOLD_MS", default=DEFAULT_SLOW_REQUEST_THRESHOLD_MS
+            ),
+            profiler_name=os.getenv("REQUEST_PROFILER") or None,
+            profile_sample_rate=float(os.getenv("REQUEST_PROFILE_SAMPLE_RATE", 1)),
+            profile_directory=os.getenv("REQUEST_PROFILE_DIRECTORY"),
+        )
+
+    def is_slow(self, duration_seconds: float) -> bool:
+        return duration_seconds * 1000 >= self.slow_request_threshold_ms
+
+    def create_profiler(self) -> Optional[RequestProfiler]:
+        if self.profiler_name is None:
+            return None
+        if random.random() * 100 >= self.profile_sample_rate:
+            return None
+        return REQUEST_PROFILERS[self.profiler_name]()
+
+
+class RequestMetrics:
+    """
+    Aggregates the profiles of completed requests, per endpoint.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.latency: dict[tuple, Histogram] = {}
+        self.db_query_counts: dict[tuple, Histogram] = {}
+        self.db_seconds: dict[tuple, Histogram] = {}
+        self.phase_seconds: dict[tuple, float] = defaultdict(float)
+        self.slow_request_counts: dict[tuple, int] = defaultdict(int)
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        duration_seconds: float,
+        profile: RequestProfile,
+        is_slow: bool,
+    ):
+        endpoint_key = (method, endpoint)
+        with self._lock:
+            self.latency.setdefault(
+                (method, endpoint, status), Histogram(LATENCY_BUCKETS_SECONDS)
+            ).observe(duration_seconds)
+            self.db_query_counts.setdefault(
+                endpoint_key, Histogram(QUERY_COUNT_BUCKETS)
+            ).observe(profile.db_query_count)
+            self.db_seconds.setdefault(
+                endpoint_key, Histogram(LATENCY_BUCKETS_SECONDS)
+            ).observe(profile.db_seconds)
+            for phase, seconds in profile.phase_seconds.items():
+                self.phase_seconds[(method, endpoint, phase.value)] += seconds
+            if is_slow:
+                self.slow_request_counts[endpoint_key] += 1
+
+    def reset(self):
+        with self._lock:
+            self.latency.clear()
+            self.db_query_counts.clear()
+            self.db_seconds.clear()
+            self.phase_seconds.clear()
+            self.slow_request_counts.clear()
+
+    def write_prometheus(self, writer: PrometheusTextWriter):
+        def endpoint_labels(key: tuple) -> dict:
+            return {"method": key[0], "endpoint": key[1]}
+
+        with self._lock:
+            writer.add_histogram(
+                "http_request_duration_seconds",
+                "Time taken to handle requests.",
+                (
+                    ({**endpoint_labels(key), "status": str(key[2])}, histogram)
+                    for key, histogram in sorted(self.latency.items())
+                ),
+            )
+            writer.add_histogram(
+                "http_request_db_queries",
+                "Database queries made per request.",
+                (
+                    (endpoint_labels(key), histogram)
+                    for key, histogram in sorted(self.db_query_counts.items())
+                ),
+            )
+            writer.add_histogram(
+                "http_request_db_duration_seconds",
+                "Time spent on database queries per request.",
+                (
+                    (endpoint_labels(key), histogram)
+                    for key, histogram in sorted(self.db_seconds.items())
+                ),
+            )
+            writer.add_counter(
+                "http_request_phase_seconds_total",
+                "Time spent in each phase of handling requests.",
+                (
+                    ({**endpoint_labels(key), "phase": key[2]}, seconds)
+                    for key, seconds in sorted(self.phase_seconds.items())
+                ),
+            )
+            writer.add_counter(
+                "http_slow_requests_total",
+                "Requests which exceeded the slow request threshold.",
+                (
+                    (endpoint_labels(key), count)
+                    for key, count in sorted(self.slow_request_counts.items())
+                ),
+            )
+
+
+request_metrics = RequestMetrics()
+
+
+class RequestProfilingHooks:
+    """
+    Profiles each request handled by a Flask app.
+    """
+
+    def __init__(self, policy: RequestProfilingPolicy, metrics: RequestMetrics):
+        self.policy = policy
+        self.metrics = metrics
+
+    def init_app(self, app: Flask):
+        app.before_request(self.before_request)
+        app.after_request(self.after_request)
+        app.teardown_request(self.teardown_request)
+        self._profile_serialization(app)
+
+    @staticmethod
+    def _profile_serialization(app: Flask):
+        json_response = app.json.response
+
+        def response(*args, **kwargs) -> Response:
+            with profile_phase(RequestPhase.SERIALIZATION):
+                return json_response(*args, **kwargs)
+
+        app.json.response = response
+
+    def before_request(self):
+        profile = RequestProfile()
+        profile.profiler = self.policy.create_profiler()
+        if profile.profiler is not None:
+            profile.start_profiler()
+        _current_profile.set(profile)
+
+    def after_request(self, response: Response) -> Response:
+        profile = get_request_profile()
+        if profile is None:
+            return response
+        duration_seconds = time.perf_counter() - profile.start
+        profile.stop_profiler()
+
+        endpoint = (
+            request.url_rule.rule
+            if request.url_rule is not None
+            else UNMATCHED_ENDPOINT
+        )
+        is_slow = self.policy.is_slow(duration_seconds)
+        self.metrics.record(
+            method=request.method,
+            endpoint=endpoint,
+            status=response.status_code,
+            duration_seconds=duration_seconds,
+            profile=profile,
+            is_slow=is_slow,
+        )
+        if is_slow:
+            self._report_slow_request(endpoint, duration_seconds, profile)
+        return response
+
+    @staticmethod
+    def teardown_request(exception: Optional[BaseException] = None):
+        profile = get_request_profile()
+        if profile is not None:
+            # Stop the profiler if the request failed before `after_request`
+            profile.stop_profiler()
+        _current_profile.set(None)
+
+    def _report_slow_request(
+        self, endpoint: str, duration_seconds: float, profile: RequestProfile
+    ):
+        logger.warning(
+            "Slow request: %s %s took %.0f ms, including %d database queries taking %.0f ms",
+            request.method,
+            request.path,
+            duration_seconds * 1000,
+            profile.db_query_count,
+            profile.db_seconds * 1000,
+        )
+        if profile.profiler is None:
+            return
+        path = self._get_profile_path(endpoint, profile.profiler)
+        try:
+            os.makedirs(self.policy.profile_directory, exist_ok=True)
+            profile.profiler.write(path)
+        except OSError as e:
+            logger.warning("Could not write request profile to %s: %s", path, e)
+            return
+        logger.warning("Profile of slow request written to %s", path)
+
+    def _get_profile_path(self, endpoint: str, profiler: RequestProfiler) -> str:
+        endpoint_name = re.sub(r"[^A-Za-z0-9]+", "_", endpoint).strip("_") or "root"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return os.path.join(
+            self.policy.profile_directory,
+            f"{timestamp}_{request.method}_{endpoint_name}.{profiler.extension}",
+        )
+
+
+def init_request_profiling(app: Flask, policy: Optional[RequestProfilingPolicy] = None):
+    RequestProfilingHooks(
+        policy=policy or RequestProfilingPolicy.from_env(), metrics=request_metrics
+    ).init_app(app)
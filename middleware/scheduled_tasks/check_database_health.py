@@ -1,3 +1,5 @@
+from typing import Optional
+
 from database_client.database_client import DatabaseClient
 from middleware.miscellaneous_logic.table_count_logic import TableCountReferenceManager
 from middleware.third_party_interaction_logic.DiscordNotifier import DiscordPoster
@@ -20,20 +22,37 @@ def check_database_health():
 
     print("Checking database health...")
     db_client = DatabaseClient()
-    check_database_health_inner(db_client)
+    check_database_health_inner(db_client, use_estimates=True)
 
 
-def check_database_health_inner(db_client):
-    tcrm = check_table_counts_and_alert_if_exceeded(db_client)
+def check_database_health_inner(db_client, use_estimates: bool = False):
+    tcrm = check_table_counts_and_alert_if_exceeded(
+        db_client, use_estimates=use_estimates
+    )
     updated_table_counts = tcrm.get_modified_table_references()
     db_client.log_table_counts(updated_table_counts)
 
 
-def check_table_counts_and_alert_if_exceeded(db_client):
+def check_table_counts_and_alert_if_exceeded(db_client, use_estimates: bool = False):
+    """
+    Compares current table counts against the most recently logged counts,
+    alerting if the change for any table exceeds the threshold.
+
+    If use_estimates is True, statistics-based estimates are retrieved for all tables in one query,
+    and exact counts are only run for tables whose estimate exceeds the threshold.
+    """
     tcrm: TableCountReferenceManager = db_client.get_most_recent_logged_table_counts()
+    estimates = (
+        db_client.get_table_count_estimates(TABLES_TO_CHECK) if use_estimates else {}
+    )
     for table in TABLES_TO_CHECK:
         prev_count = tcrm.get_table_count(table)
-        new_count = db_client.get_table_count(table)
+        new_count = get_new_table_count(
+            db_client=db_client,
+            table=table,
+            prev_count=prev_count,
+            estimated_count=get_estimated_count(estimates, table),
+        )
         is_new = prev_count is None
         tcrm.add_table_count(table, new_count, is_new)
 
@@ -45,6 +64,29 @@ def check_table_counts_and_alert_if_exceeded(db_client):
     return tcrm
 
 
+def get_estimated_count(estimates: dict, table: str) -> Optional[int]:
+    if table not in estimates:
+        return None
+    return estimates[table].estimated_count
+
+
+def get_new_table_count(
+    db_client,
+    table: str,
+    prev_count: Optional[int],
+    estimated_count: Optional[int],
+) -> int:
+    """
+    Returns the estimated count if it is within the threshold of the previous count.
+    Otherwise (or if there is no previous count or estimate to compare), returns the exact count.
+    """
+    if prev_count is None or estimated_count is None:
+        return db_client.get_table_count(table)
+    if change_exceeds_ratio(estimated_count, prev_count):
+        return db_client.get_table_count(table)
+    return estimated_count
+
+
 def change_exceeds_ratio(new_count, prev_count):
     abs_diff = abs(new_count - prev_count) + 1  # Prevent dividing by 0
     prev_count = prev_count + 1
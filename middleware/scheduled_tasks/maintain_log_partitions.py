@@ -0,0 +1,40 @@
+from database_client.constants import (
+    LOG_TABLE_RETENTION_MONTHS,
+    LOG_TABLE_PARTITION_MONTHS_AHEAD,
+)
+from database_client.database_client import DatabaseClient
+from middleware.enums import Relations
+
+
+def maintain_log_partitions():
+    """
+    Creates upcoming monthly partitions of the log tables,
+    and drops partitions which precede their retention period.
+    """
+
+    print("Maintaining log table partitions...")
+    db_client = DatabaseClient()
+    maintain_log_partitions_inner(db_client)
+
+
+def maintain_log_partitions_inner(
+    db_client,
+    retention_months: dict[Relations, int] = LOG_TABLE_RETENTION_MONTHS,
+    months_ahead: int = LOG_TABLE_PARTITION_MONTHS_AHEAD,
+) -> list[str]:
+    """
+    Dropping whole partitions avoids the table scans and bloat of deleting expired rows.
+
+    :return: The names of the dropped partitions.
+    """
+    dropped_partitions = []
+    for table, table_retention_months in retention_months.items():
+        db_client.create_monthly_partitions(table=table, months_ahead=months_ahead)
+        dropped_partitions.extend(
+            db_client.drop_expired_partitions(
+                table=table, retention_months=table_retention_months
+            )
+        )
+    for partition in dropped_partitions:
+        print(f"Dropped expired partition {partition}")
+    return dropped_partitions
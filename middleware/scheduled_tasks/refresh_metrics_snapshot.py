@@ -0,0 +1,11 @@
+from database_client.database_client import DatabaseClient
+
+
+def refresh_metrics_snapshot():
+    """
+    Recomputes the metrics snapshot returned by the metrics endpoint.
+    """
+
+    print("Refreshing metrics snapshot...")
+    db_client = DatabaseClient()
+    db_client.refresh_metrics_snapshot()
@@ -39,6 +39,18 @@ class GetManyResponseSchemaBase(MessageSchema):
     )
 
 
+class LinkedRowsPageResponseSchema(Schema):
+    next_after = fields.Integer(
+        required=True,
+        allow_none=True,
+        metadata={
+            "description": "The value to pass as `after` to retrieve the following results. "
+            "Null if there are no more results.",
+            "source": SourceMappingEnum.JSON,
+        },
+    )
+
+
 class GetManyResponseSchema(GetManyResponseSchemaBase):
     data = EntryDataListField(
         fields.Dict,
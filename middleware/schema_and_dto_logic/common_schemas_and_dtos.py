@@ -9,7 +9,11 @@ from typing import Optional
 from marshmallow import Schema, fields, validate
 from pydantic import BaseModel
 
-from database_client.constants import PAGE_SIZE
+from database_client.constants import (
+    PAGE_SIZE,
+    LINKED_ROWS_DEFAULT_LIMIT,
+    LINKED_ROWS_MAX_LIMIT,
+)
 from database_client.enums import SortOrder, LocationType
 from middleware.schema_and_dto_logic.custom_fields import DataField
 from middleware.schema_and_dto_logic.non_dto_dataclasses import (
@@ -99,6 +103,39 @@ class GetByIDBaseDTO(BaseModel):
     resource_id: str
 
 
+class LinkedRowsPageRequestSchema(Schema):
+    limit = fields.Integer(
+        validate=validate.Range(min=1, max=LINKED_ROWS_MAX_LIMIT),
+        load_default=LINKED_ROWS_DEFAULT_LIMIT,
+        metadata={
+            "description": "The maximum number of results to retrieve.",
+            "source": SourceMappingEnum.QUERY_ARGS,
+        },
+    )
+    after = fields.Integer(
+        required=False,
+        load_default=None,
+        metadata={
+            "description": "The `next_after` value of the previous results, "
+            "to retrieve the results following them.",
+            "source": SourceMappingEnum.QUERY_ARGS,
+        },
+    )
+
+
+class LinkedRowsPageDTO(BaseModel):
+    limit: int = LINKED_ROWS_DEFAULT_LIMIT
+    after: Optional[int] = None
+
+
+class GetLinkedRowsByIDRequestSchema(GetByIDBaseSchema, LinkedRowsPageRequestSchema):
+    pass
+
+
+class GetLinkedRowsByIDDTO(GetByIDBaseDTO, LinkedRowsPageDTO):
+    pass
+
+
 class EntryDataRequestSchema(Schema):
     entry_data = DataField(
         required=True,
@@ -0,0 +1,267 @@
+"""
+Compiled loaders for rows validated against flat (csv) schemas.
+
+Loading a row with `Schema.load`, `SchemaUnflattener.unflatten`, and `setup_dto_class`
+re-walks the schema's fields, hooks, and field paths for every row.
+A `FlatRowLoader` makes that walk once per flat schema, producing a converter per field
+with fast paths for common field types, and applies those directly to each row.
+
+Results and error messages match `Schema.load`: any value outside a fast path,
+and any field with validators, is deferred to the field's own `deserialize`.
+"""
+
+import math
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from marshmallow import EXCLUDE, INCLUDE, Schema, ValidationError, fields
+from marshmallow.utils import missing
+
+from middleware.schema_and_dto_logic.dynamic_logic.dynamic_csv_to_schema_conversion_logic import (
+    SchemaUnflattener,
+)
+from middleware.schema_and_dto_logic.dynamic_logic.dynamic_schema_request_content_population import (
+    setup_dto_class,
+)
+
+Converter = Callable[[Any], Any]
+
+
+def _compile_string(field: fields.String) -> Converter:
+    def convert(value):
+        if type(value) is str:
+            return value
+        return field.deserialize(value)
+
+    return convert
+
+
+def _compile_boolean(field: fields.Boolean) -> Converter:
+    if not field.truthy:
+        return field.deserialize
+    truthy, falsy = field.truthy, field.falsy
+
+    def convert(value):
+        if type(value) is str:
+            if value in truthy:
+                return True
+            if value in falsy:
+                return False
+        return field.deserialize(value)
+
+    return convert
+
+
+def _compile_number(field: fields.Number, cast: type) -> Converter:
+    def convert(value):
+        if type(value) is str:
+            try:
+                number = cast(value)
+            except ValueError:
+                return field.deserialize(value)
+            # Special float values are rejected by the field
+            if cast is not float or math.isfinite(number):
+                return number
+        return field.deserialize(value)
+
+    return convert
+
+
+def _compile_enum(field: fields.Enum) -> Converter:
+    if field.by_value and type(field.field) is fields.String:
+        members = {member.value: member for member in field.enum}
+    elif not field.by_value:
+        members = field.enum.__members__
+    else:
+        return field.deserialize
+
+    def convert(value):
+        if type(value) is str and value in members:
+            return members[value]
+        return field.deserialize(value)
+
+    return convert
+
+
+def _compile_list(field: fields.List) -> Converter:
+    convert_inner = _compile_value_converter(field.inner)
+
+    def convert(value):
+        if type(value) is list:
+            try:
+                return [convert_inner(item) for item in value]
+            except ValidationError:
+                # Rerun generically, to collect the errors of every item
+                pass
+        return field.deserialize(value)
+
+    return convert
+
+
+# Field types whose deserialization depends only on the value being deserialized.
+# Schemas with fields of other types are loaded with `Schema.load`.
+SUPPORTED_FIELD_TYPES = (
+    fields.String,
+    fields.Boolean,
+    fields.Integer,
+    fields.Float,
+    fields.Enum,
+    fields.Date,
+    fields.DateTime,
+)
+
+
+def _is_supported_field(field: fields.Field) -> bool:
+    if type(field) is fields.List:
+        return _is_supported_field(field.inner)
+    return type(field) in SUPPORTED_FIELD_TYPES
+
+
+def _compile_value_converter(field: fields.Field) -> Converter:
+    """
+    Compile a converter for present, non-null values of the field.
+    """
+    if field.validators:
+        return field.deserialize
+    field_type = type(field)
+    if field_type is fields.String:
+        return _compile_string(field)
+    if field_type is fields.Boolean:
+        return _compile_boolean(field)
+    if field_type is fields.Integer and not field.strict:
+        return _compile_number(field, cast=int)
+    if field_type is fields.Float and not field.allow_nan:
+        return _compile_number(field, cast=float)
+    if field_type is fields.Enum:
+        return _compile_enum(field)
+    if field_type is fields.List:
+        return _compile_list(field)
+    return field.deserialize
+
+
+class FlatRowLoader:
+    """
+    Validates rows against a flat schema, and loads them into the nested DTO
+    the flat schema was generated from.
+    """
+
+    def __init__(self, schema: Schema, inner_dto_class: type):
+        self.schema = schema
+        self.inner_dto_class = inner_dto_class
+        self.unflattener = SchemaUnflattener(flat_schema_class=type(schema))
+        # Hooks (pre/post load, schema and field validators) are only run by `Schema.load`
+        self.is_compiled = not any(schema._hooks.values()) and all(
+            _is_supported_field(field) for field in schema.load_fields.values()
+        )
+
+        # (data key, attribute, field, converter)
+        self._fields = []
+        for field_name, field in schema.load_fields.items():
+            self._fields.append(
+                (
+                    field.data_key if field.data_key is not None else field_name,
+                    field.attribute or field_name,
+                    field,
+                    _compile_value_converter(field),
+                )
+            )
+        self._data_keys = frozenset(data_key for data_key, _, _, _ in self._fields)
+        self._unknown_message = schema.error_messages["unknown"]
+
+        # (flat attribute, parent keys, leaf key)
+        self._nested_paths = [
+            (fpvm.name, tuple(fpvm.field_path[:-1]), fpvm.field_path[-1])
+            for fpvm in self.unflattener.fpvms
+        ]
+
+    def load(self, raw_row: dict) -> dict:
+        """
+        Equivalent to `schema.load(raw_row)`.
+        :raises ValidationError: If the row is invalid.
+        """
+        if not self.is_compiled:
+            return self.schema.load(raw_row)
+
+        loaded = {}
+        errors = {}
+        for data_key, attribute, field, convert in self._fields:
+            value = raw_row.get(data_key, missing)
+            if value is None and field.allow_none:
+                loaded[attribute] = None
+                continue
+            try:
+                if value is None or value is missing:
+                    value = field.deserialize(value)
+                else:
+                    value = convert(value)
+            except ValidationError as e:
+                errors[data_key] = e.messages
+                continue
+            if value is not missing:
+                loaded[attribute] = value
+
+        unknown = self.schema.unknown
+        if unknown != EXCLUDE:
+            for key in raw_row:
+                if key in self._data_keys:
+                    continue
+                if unknown == INCLUDE:
+                    loaded[key] = raw_row[key]
+                else:
+                    errors[key] = [self._unknown_message]
+
+        if errors:
+            raise ValidationError(errors, data=raw_row, valid_data=loaded)
+        return loaded
+
+    def unflatten(self, loaded_row: dict) -> dict:
+        """
+        Equivalent to `SchemaUnflattener.unflatten`.
+        """
+        data = {}
+        for name, parent_keys, leaf_key in self._nested_paths:
+            if name not in loaded_row:
+                continue
+            target = data
+            for key in parent_keys:
+                target = target.setdefault(key, {})
+            target[leaf_key] = loaded_row[name]
+        return data
+
+    def load_dto(self, raw_row: dict):
+        """
+        Validate the row and load it into the inner DTO class.
+        :raises ValidationError: If the row is invalid.
+        """
+        return setup_dto_class(
+            data=self.unflatten(self.load(raw_row)),
+            dto_class=self.inner_dto_class,
+            nested_dto_info_list=self.unflattener.nested_dto_info_list,
+        )
+
+
+_FLAT_ROW_LOADERS: dict[tuple, FlatRowLoader] = {}
+_FLAT_ROW_LOADERS_LOCK = Lock()
+
+
+def _get_schema_options_key(schema: Schema) -> tuple:
+    only: Optional[frozenset] = (
+        frozenset(schema.only) if schema.only is not None else None
+    )
+    return type(schema), only, frozenset(schema.exclude), schema.unknown
+
+
+def get_flat_row_loader(schema: Schema, inner_dto_class: type) -> FlatRowLoader:
+    """
+    Get the loader for the flat schema, compiling it on first use.
+    Loaders are shared between schema instances of the same class and options.
+    """
+    key = (*_get_schema_options_key(schema), inner_dto_class)
+    loader = _FLAT_ROW_LOADERS.get(key)
+    if loader is None:
+        with _FLAT_ROW_LOADERS_LOCK:
+            loader = _FLAT_ROW_LOADERS.get(key)
+            if loader is None:
+                loader = FlatRowLoader(schema=schema, inner_dto_class=inner_dto_class)
+                _FLAT_ROW_LOADERS[key] = loader
+    return loader
@@ -20,6 +20,10 @@ class AgencyMatchRequestDTO(BaseModel):
         )
 
 
+class AgencyMatchBatchRequestDTO(BaseModel):
+    entries: list[AgencyMatchRequestDTO]
+
+
 class AgencyMatchResponseLocationDTO(BaseModel):
     state: Optional[str]
     county: Optional[str]
@@ -1,6 +1,41 @@
-from marshmallow import Schema, fields
+from datetime import date, datetime
+from typing import Optional
 
-from middleware.schema_and_dto_logic.util import get_json_metadata
+from marshmallow import Schema, fields, validate
+from pydantic import BaseModel
+
+from database_client.constants import (
+    ARCHIVE_QUEUE_DEFAULT_LIMIT,
+    ARCHIVE_QUEUE_DEFAULT_LEASE_SECONDS,
+)
+from middleware.enums import ArchiveUpdateStatus
+from middleware.schema_and_dto_logic.common_response_schemas import MessageSchema
+from middleware.schema_and_dto_logic.util import get_json_metadata, get_query_metadata
+
+
+class ArchivesGetRequestSchema(Schema):
+    limit = fields.Integer(
+        required=False,
+        load_default=ARCHIVE_QUEUE_DEFAULT_LIMIT,
+        validate=validate.Range(min=1, max=1000),
+        metadata=get_query_metadata(
+            "The maximum number of data sources due for archival to return."
+        ),
+    )
+    lease_seconds = fields.Integer(
+        required=False,
+        load_default=ARCHIVE_QUEUE_DEFAULT_LEASE_SECONDS,
+        validate=validate.Range(min=0, max=24 * 60 * 60),
+        metadata=get_query_metadata(
+            "How long, in seconds, the returned data sources are withheld from other requests. "
+            "The lease ends early once the data source's last cached date is updated."
+        ),
+    )
+
+
+class ArchivesGetRequestDTO(BaseModel):
+    limit: int = ARCHIVE_QUEUE_DEFAULT_LIMIT
+    lease_seconds: int = ARCHIVE_QUEUE_DEFAULT_LEASE_SECONDS
 
 
 class ArchivesGetResponseSchema(Schema):
@@ -31,3 +66,68 @@ class ArchivesPutRequestSchema(Schema):
         required=True,
         metadata=get_json_metadata("The date the source was marked as broken"),
     )
+
+
+class ArchivesBatchPutEntrySchema(Schema):
+    id = fields.Integer(
+        required=True, metadata=get_json_metadata("The ID of the data source")
+    )
+    last_cached = fields.DateTime(
+        required=True,
+        metadata=get_json_metadata("The last date the data source was cached"),
+    )
+    broken_source_url_as_of = fields.Date(
+        required=False,
+        allow_none=True,
+        load_default=None,
+        metadata=get_json_metadata(
+            "The date the source url was found to be broken, if it is broken"
+        ),
+    )
+
+
+class ArchivesBatchPutRequestSchema(Schema):
+    entries = fields.List(
+        fields.Nested(
+            ArchivesBatchPutEntrySchema(),
+            metadata=get_json_metadata("An archive update for a data source"),
+        ),
+        required=True,
+        metadata=get_json_metadata("The archive updates to apply"),
+    )
+
+
+class ArchivesBatchPutEntryDTO(BaseModel):
+    id: int
+    last_cached: datetime
+    broken_source_url_as_of: Optional[date] = None
+
+
+class ArchivesBatchPutRequestDTO(BaseModel):
+    entries: list[ArchivesBatchPutEntryDTO]
+
+
+class ArchivesBatchPutResultSchema(Schema):
+    id = fields.Integer(
+        required=True, metadata=get_json_metadata("The ID of the data source")
+    )
+    status = fields.String(
+        required=True,
+        validate=validate.OneOf([status.value for status in ArchiveUpdateStatus]),
+        metadata=get_json_metadata(
+            "Whether the data source was updated, or could not be found"
+        ),
+    )
+
+
+class ArchivesBatchPutResponseSchema(MessageSchema):
+    results = fields.List(
+        fields.Nested(
+            ArchivesBatchPutResultSchema(),
+            metadata=get_json_metadata("The result of an archive update"),
+        ),
+        required=True,
+        metadata=get_json_metadata(
+            "The result of each archive update, in the order submitted"
+        ),
+    )
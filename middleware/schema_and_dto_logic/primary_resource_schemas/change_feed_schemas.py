@@ -0,0 +1,114 @@
+from typing import Optional
+
+from marshmallow import Schema, fields, validate, pre_load
+from pydantic import BaseModel
+
+from database_client.constants import (
+    CHANGE_FEED_TABLES,
+    CHANGE_FEED_DEFAULT_LIMIT,
+    CHANGE_FEED_MAX_LIMIT,
+)
+from middleware.enums import Relations, ChangeFeedOperationType
+from middleware.schema_and_dto_logic.common_response_schemas import MessageSchema
+from middleware.schema_and_dto_logic.util import get_json_metadata, get_query_metadata
+
+CHANGE_FEED_CURSOR_PATTERN = r"^\d+-\d+$"
+
+
+class ChangesGetRequestSchema(Schema):
+    since = fields.String(
+        required=False,
+        load_default=None,
+        validate=validate.Regexp(
+            CHANGE_FEED_CURSOR_PATTERN, error="Invalid change feed cursor."
+        ),
+        metadata=get_query_metadata(
+            "The cursor after which to return changes, as returned in `next_cursor`. "
+            "If omitted, changes are returned from the oldest change retained."
+        ),
+    )
+    tables = fields.List(
+        fields.String(
+            validate=validate.OneOf([table.value for table in CHANGE_FEED_TABLES]),
+            metadata=get_query_metadata("A table to return changes for."),
+        ),
+        required=False,
+        load_default=None,
+        metadata=get_query_metadata(
+            "A comma-separated list of tables to return changes for. "
+            "If omitted, changes to all tables in the change feed are returned. "
+            f"Valid tables: {', '.join(table.value for table in CHANGE_FEED_TABLES)}"
+        ),
+    )
+    limit = fields.Integer(
+        required=False,
+        load_default=CHANGE_FEED_DEFAULT_LIMIT,
+        validate=validate.Range(min=1, max=CHANGE_FEED_MAX_LIMIT),
+        metadata=get_query_metadata("The maximum number of changes to return."),
+    )
+
+    @pre_load
+    def listify_tables(self, in_data, **kwargs):
+        tables = in_data.get("tables", None)
+        if tables is None:
+            return in_data
+        in_data["tables"] = tables.split(",")
+
+        return in_data
+
+
+class ChangesGetRequestDTO(BaseModel):
+    since: Optional[str] = None
+    tables: Optional[list[Relations]] = None
+    limit: int = CHANGE_FEED_DEFAULT_LIMIT
+
+
+class ChangeSchema(Schema):
+    cursor = fields.String(
+        required=True, metadata=get_json_metadata("The cursor of the change")
+    )
+    table_name = fields.String(
+        required=True, metadata=get_json_metadata("The table which was changed")
+    )
+    operation_type = fields.Enum(
+        enum=ChangeFeedOperationType,
+        by_value=fields.Str,
+        required=True,
+        metadata=get_json_metadata("The type of change"),
+    )
+    affected_id = fields.Integer(
+        required=True,
+        allow_none=True,
+        metadata=get_json_metadata(
+            "The id of the changed row, or null for tables without an id column"
+        ),
+    )
+    row_data = fields.Dict(
+        required=True,
+        metadata=get_json_metadata(
+            "The row after the change, or before the change for deletes"
+        ),
+    )
+    created_at = fields.DateTime(
+        required=True, metadata=get_json_metadata("When the change was made")
+    )
+
+
+class ChangesGetResponseSchema(MessageSchema):
+    data = fields.List(
+        fields.Nested(ChangeSchema(), metadata=get_json_metadata("A change")),
+        required=True,
+        metadata=get_json_metadata("The changes following the cursor, in order"),
+    )
+    next_cursor = fields.String(
+        required=True,
+        allow_none=True,
+        metadata=get_json_metadata(
+            "The cursor to request the following changes with. "
+            "Unchanged from `since` if no changes were returned."
+        ),
+    )
+    has_more = fields.Boolean(
+        required=True,
+        metadata=get_json_metadata("Whether further changes are available immediately"),
+    )
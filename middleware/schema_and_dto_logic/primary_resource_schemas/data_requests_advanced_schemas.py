@@ -7,6 +7,9 @@ from middleware.schema_and_dto_logic.primary_resource_schemas.data_requests_base
 from middleware.schema_and_dto_logic.primary_resource_schemas.typeahead_suggestion_schemas import (
     TypeaheadLocationsResponseSchema,
 )
+from middleware.schema_and_dto_logic.common_response_schemas import (
+    LinkedRowsPageResponseSchema,
+)
 from middleware.schema_and_dto_logic.common_schemas_and_dtos import (
     GetManyRequestsBaseSchema,
     GetByIDBaseSchema,
@@ -162,6 +165,13 @@ GetManyDataRequestsResponseSchema = create_get_many_schema(
     description="The list of data requests",
 )
 
+
+class GetLinkedDataRequestsResponseSchema(
+    GetManyDataRequestsResponseSchema, LinkedRowsPageResponseSchema
+):
+    pass
+
+
 GetByIDDataRequestsResponseSchema = create_get_by_id_schema(
     data_schema=DataRequestsGetSchemaBase,
     description="The data request result",
@@ -2,6 +2,9 @@ from marshmallow import Schema, fields
 
 from middleware.primary_resource_logic.match_logic import AgencyMatchStatus
 from middleware.schema_and_dto_logic.common_response_schemas import MessageSchema
+from middleware.schema_and_dto_logic.primary_resource_schemas.bulk_schemas import (
+    BatchRequestSchema,
+)
 from middleware.schema_and_dto_logic.util import get_json_metadata
 
 
@@ -12,6 +15,21 @@ class AgencyMatchSchema(Schema):
     locality = fields.String(metadata=get_json_metadata("The locality of the agency"))
 
 
+class AgencyMatchBatchSchema(Schema):
+    entries = fields.List(
+        fields.Nested(
+            AgencyMatchSchema(),
+            metadata=get_json_metadata("An agency to match"),
+        ),
+        required=True,
+        metadata=get_json_metadata("The agencies to match"),
+    )
+
+
+class AgencyMatchBatchCSVSchema(BatchRequestSchema, AgencyMatchSchema):
+    pass
+
+
 class MatchAgenciesLocationSchema(Schema):
     state = fields.String(metadata=get_json_metadata("The state of the agency"))
     county = fields.String(metadata=get_json_metadata("The county of the agency"))
@@ -58,3 +76,16 @@ class MatchAgencyResponseSchema(MessageSchema):
         required=False,
         metadata=get_json_metadata("The list of results, if any"),
     )
+
+
+class MatchAgencyBatchResponseSchema(MessageSchema):
+    results = fields.List(
+        fields.Nested(
+            MatchAgencyResponseSchema(),
+            metadata=get_json_metadata("The match result for an agency"),
+        ),
+        required=True,
+        metadata=get_json_metadata(
+            "The match results, in the same order as the agencies submitted"
+        ),
+    )
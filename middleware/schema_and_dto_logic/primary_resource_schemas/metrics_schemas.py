@@ -8,3 +8,6 @@ class MetricsGetResponseSchema(Schema):
     agency_count = fields.Int(metadata=get_json_metadata("The number of agencies"))
     county_count = fields.Int(metadata=get_json_metadata("The number of counties"))
     state_count = fields.Int(metadata=get_json_metadata("The number of states"))
+    computed_at = fields.DateTime(
+        metadata=get_json_metadata("The date and time the metrics were computed")
+    )
@@ -2,11 +2,14 @@ from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Optional
 
-from marshmallow import Schema, fields, validates_schema, ValidationError
+from marshmallow import Schema, fields, validates_schema, ValidationError, validate
 from pydantic import BaseModel, model_validator
 
 from middleware.enums import OutputFormatEnum, RecordTypes
 from middleware.flask_response_manager import FlaskResponseManager
+from middleware.schema_and_dto_logic.common_response_schemas import (
+    LinkedRowsPageResponseSchema,
+)
 from middleware.schema_and_dto_logic.schema_helpers import create_get_many_schema
 from middleware.schema_and_dto_logic.util import get_json_metadata, get_query_metadata
 from utilities.common import get_enums_from_string
@@ -156,6 +159,23 @@ class SearchRequestSchema(Schema):
             "location": ParserLocation.QUERY.value,
         },
     )
+    per_jurisdiction_limit = fields.Int(
+        required=False,
+        validate=validate.Range(min=0),
+        metadata=get_query_metadata(
+            "The maximum number of results to return for each jurisdiction. "
+            "Counts always include all results. "
+            "If not provided, all results are returned. Ignored for CSV output."
+        ),
+    )
+    per_jurisdiction_offset = fields.Int(
+        required=False,
+        load_default=0,
+        validate=validate.Range(min=0),
+        metadata=get_query_metadata(
+            "The number of results to skip for each jurisdiction. Ignored for CSV output."
+        ),
+    )
 
 
 class SearchResultsInnerSchema(Schema):
@@ -290,10 +310,14 @@ class FollowSearchResponseSchema(Schema):
     )
 
 
-GetUserFollowedSearchesSchema = create_get_many_schema(
-    data_list_schema=FollowSearchResponseSchema,
-    description="The searches that the user follows.",
-)
+class GetUserFollowedSearchesSchema(
+    create_get_many_schema(
+        data_list_schema=FollowSearchResponseSchema,
+        description="The searches that the user follows.",
+    ),
+    LinkedRowsPageResponseSchema,
+):
+    pass
 
 
 class FederalSearchRequestDTO(BaseModel):
@@ -306,6 +330,8 @@ class SearchRequestsDTO(BaseModel):
     record_categories: Optional[list[RecordCategories]] = None
     record_types: Optional[list[RecordTypes]] = None
     output_format: Optional[OutputFormatEnum] = None
+    per_jurisdiction_limit: Optional[int] = None
+    per_jurisdiction_offset: int = 0
 
     @model_validator(mode="after")
     def check_exclusive_fields(self):
@@ -1,5 +1,4 @@
-import requests
-
+from middleware.third_party_interaction_logic.http_session import get_http_session
 from middleware.util import get_env_variable
 
 
@@ -9,4 +8,4 @@ class DiscordPoster:
         self.webhook_url = get_env_variable("WEBHOOK_URL")
 
     def post_to_discord(self, message):
-        requests.post(self.webhook_url, json={"content": message}, timeout=5)
+        get_http_session().post(self.webhook_url, json={"content": message}, timeout=5)
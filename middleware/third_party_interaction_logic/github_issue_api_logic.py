@@ -1,11 +1,17 @@
 import re
+from functools import lru_cache
 
 from github import Github
 from github import Auth
-import requests
+from github.Repository import Repository
 from pydantic import BaseModel
 
 from database_client.enums import RequestStatus
+from middleware.third_party_interaction_logic.http_session import (
+    get_http_session,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT_SECONDS,
+)
 from middleware.util import get_env_variable
 from dataclasses import dataclass
 
@@ -15,6 +21,30 @@ class GithubIssueInfo(BaseModel):
     number: int
 
 
+@lru_cache(maxsize=1)
+def _get_github_repo(token: str, repo_full_name: str) -> Repository:
+    """
+    Returns the issue repository, using a Github client which is kept for the life of the process,
+    so that its connections to the Github API are reused.
+    The repository is not fetched until it is used.
+    """
+    g = Github(
+        auth=Auth.Token(token),
+        timeout=DEFAULT_TIMEOUT_SECONDS,
+        pool_size=DEFAULT_POOL_MAXSIZE,
+    )
+    return g.get_repo(repo_full_name, lazy=True)
+
+
+def get_github_repo() -> Repository:
+    repo_name = get_env_variable("GH_ISSUE_REPO_NAME")
+    repo_owner = get_env_variable("GH_ISSUE_REPO_OWNER")
+    return _get_github_repo(
+        token=get_env_variable("GH_API_ACCESS_TOKEN"),
+        repo_full_name=f"{repo_owner}/{repo_name}",
+    )
+
+
 def create_github_issue(title: str, body: str) -> GithubIssueInfo:
     """
     Create a github issue and return its url
@@ -22,13 +52,7 @@ def create_github_issue(title: str, body: str) -> GithubIssueInfo:
     :param body: The body of the issue
     :return:
     """
-    auth = Auth.Token(get_env_variable("GH_API_ACCESS_TOKEN"))
-
-    g = Github(auth=auth)
-    repo_name = get_env_variable("GH_ISSUE_REPO_NAME")
-    repo_owner = get_env_variable("GH_ISSUE_REPO_OWNER")
-
-    repo = g.get_repo(f"{repo_owner}/{repo_name}")
+    repo = get_github_repo()
 
     issue = repo.create_issue(title=title, body=body)
 
@@ -110,13 +134,12 @@ def get_github_issue_project_statuses(
 
     token = get_env_variable("GH_API_ACCESS_TOKEN")
 
-    response = requests.post(
+    response = get_http_session().post(
         url="https://api.github.com/graphql",
         headers={
             "Authorization": f"Bearer {token}",
         },
         json={"query": query},
-        timeout=10,
     )
 
     gipi = convert_graph_ql_result_to_issue_info(response.json())
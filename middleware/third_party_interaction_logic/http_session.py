@@ -0,0 +1,175 @@
+"""
+Provides the HTTP session shared by all outbound requests to third parties.
+
+Reusing a session keeps connections to each host alive between requests,
+so that requests do not each pay for a new TCP and TLS handshake.
+The session keeps a separate connection pool for each host,
+applies a default timeout, retries failed connections and unavailable responses with jittered backoff,
+and records the latency of requests to each host.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from middleware.util import get_optional_env_int
+
+# The number of hosts for which connection pools are kept
+POOL_CONNECTIONS = 10
+# The number of connections kept per host, which should allow for every request thread
+DEFAULT_POOL_MAXSIZE = 10
+# Seconds to wait to connect and, separately, for each read, for requests without a timeout
+DEFAULT_TIMEOUT_SECONDS = 10
+RETRY_STATUSES = (429, 502, 503, 504)
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+class JitteredRetry(Retry):
+    """
+    Retries with "full jitter": a random backoff between zero and the exponential backoff,
+    so that clients which failed together do not all retry together.
+    """
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+
+def get_default_retry() -> JitteredRetry:
+    """
+    Retries failed connections, and responses which indicate the host is unavailable.
+    Responses are only retried for idempotent methods,
+    and timed out reads are not retried,
+    as the host may have acted on the request.
+    """
+    return JitteredRetry(
+        total=2,
+        connect=2,
+        read=False,
+        status=2,
+        status_forcelist=RETRY_STATUSES,
+        backoff_factor=0.5,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+
+
+@dataclass
+class HostLatency:
+    request_count: int = 0
+    error_count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        if self.request_count == 0:
+            return 0.0
+        return self.total_seconds / self.request_count
+
+
+class OutboundRequestMetrics:
+    """
+    Records the latency of outbound requests per host, including retries.
+    Errors are requests which raised, or whose response had a 5xx status.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: dict[str, HostLatency] = {}
+
+    def record(self, host: str, seconds: float, is_error: bool):
+        with self._lock:
+            latency = self._hosts.setdefault(host, HostLatency())
+            latency.request_count += 1
+            latency.error_count += int(is_error)
+            latency.total_seconds += seconds
+            latency.max_seconds = max(latency.max_seconds, seconds)
+
+    def get_host_latencies(self) -> dict[str, HostLatency]:
+        with self._lock:
+            return {
+                host: HostLatency(**vars(latency))
+                for host, latency in self._hosts.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+
+
+outbound_request_metrics = OutboundRequestMetrics()
+
+
+class OutboundHTTPAdapter(HTTPAdapter):
+    """
+    An adapter which applies a default timeout to requests, and records their latency.
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        metrics: OutboundRequestMetrics,
+        *args,
+        **kwargs,
+    ):
+        self.timeout = timeout
+        self.metrics = metrics
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        host = urlsplit(request.url).netloc
+        start = time.perf_counter()
+        try:
+            response = super().send(request, timeout=timeout, **kwargs)
+        except Exception:
+            self.metrics.record(host, time.perf_counter() - start, is_error=True)
+            raise
+        self.metrics.record(
+            host, time.perf_counter() - start, is_error=response.status_code >= 500
+        )
+        return response
+
+
+def create_http_session(
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    retry: Optional[Retry] = None,
+    metrics: OutboundRequestMetrics = outbound_request_metrics,
+) -> requests.Session:
+    session = requests.Session()
+    adapter = OutboundHTTPAdapter(
+        timeout=timeout,
+        metrics=metrics,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=get_optional_env_int(
+            "OUTBOUND_HTTP_POOL_MAXSIZE", default=DEFAULT_POOL_MAXSIZE
+        ),
+        max_retries=get_default_retry() if retry is None else retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the HTTP session shared by the process, creating it on first use.
+    The session may be used from any thread, but its state (such as headers) must not be modified;
+    pass per-request headers and auth to each request instead.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_http_session()
+    return _session
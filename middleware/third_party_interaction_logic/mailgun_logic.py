@@ -1,7 +1,6 @@
 from typing import Optional
 
-import requests
-
+from middleware.third_party_interaction_logic.http_session import get_http_session
 from middleware.util import get_env_variable
 
 MAILGUN_URL = "https://api.mailgun.net/v3/mail.pdap.io/messages"
@@ -29,7 +28,7 @@ def send_via_mailgun(
     if bcc is not None:
         data["bcc"] = bcc
 
-    r = requests.post(
+    r = get_http_session().post(
         MAILGUN_URL, auth=("api", get_env_variable("MAILGUN_KEY")), data=data, timeout=5
     )
 
@@ -4,7 +4,8 @@ from dataclasses import is_dataclass, asdict
 from datetime import datetime
 from enum import Enum
 from io import BytesIO, StringIO
-from typing import Any, Dict, TextIO, Generator
+from itertools import islice
+from typing import Any, Dict, TextIO, Generator, Iterable
 
 from dotenv import dotenv_values, find_dotenv
 from pydantic import BaseModel
@@ -28,6 +29,25 @@ def get_env_variable(name: str) -> str:
     return value
 
 
+def get_optional_env_int(name: str, default: int) -> int:
+    """
+    Get the value of the specified environment variable as an integer,
+    or the default if it is not set.
+    Raises:
+        ValueError: If the environment variable is set but is not an integer.
+    """
+    try:
+        value = get_env_variable(name)
+    except ValueError:
+        return default
+    try:
+        return int(value)
+    except ValueError as e:
+        raise ValueError(
+            f"Environment variable '{name}' must be an integer, not '{value}'."
+        ) from e
+
+
 def get_datetime_now() -> str:
     return datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
 
@@ -55,15 +75,35 @@ def bytes_to_text_iter(file: BytesIO | FileStorage) -> Generator[str, Any, None]
     return (line.decode("utf-8") for line in file)
 
 
-def read_from_csv(file: str | FileStorage | bytes) -> list[dict[str, Any]]:
+def iter_csv_rows(
+    file: str | FileStorage | bytes,
+) -> Generator[dict[str, Any], Any, None]:
+    """
+    Lazily read rows from a csv file, so that only the current row is held in memory
+    """
     if isinstance(file, FileStorage):
-        file = bytes_to_text_iter(file)
+        yield from csv.DictReader(bytes_to_text_iter(file))
     elif isinstance(file, str):
-        file = open(file, "r", newline="", encoding="utf-8")
-    elif isinstance(file, bytes):
-        content = file.decode("utf-8")
-        file = StringIO(content)
-    return list(csv.DictReader(file))
+        with open(file, "r", newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    else:
+        if isinstance(file, bytes):
+            file = StringIO(file.decode("utf-8"))
+        yield from csv.DictReader(file)
+
+
+def read_from_csv(file: str | FileStorage | bytes) -> list[dict[str, Any]]:
+    return list(iter_csv_rows(file))
+
+
+def chunked(iterable: Iterable, chunk_size: int) -> Generator[list, Any, None]:
+    """
+    Split an iterable into lists of at most chunk_size items,
+    consuming only one chunk of the iterable at a time
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
 
 
 def dict_enums_to_values(d: dict[str, Any]) -> dict[str, Any]:
@@ -1,5 +1,4 @@
-import requests
-
+from middleware.third_party_interaction_logic.http_session import get_http_session
 from middleware.third_party_interaction_logic.mailgun_logic import send_via_mailgun
 from middleware.util import get_env_variable, create_web_app_url
 from tests.helper_scripts.helper_functions_simple import add_query_params
@@ -9,7 +8,7 @@ def post_to_webhook(msg: str):
     vite_vue_app_base_url = get_env_variable("VITE_VUE_APP_BASE_URL")
     webhook_url = get_env_variable("WEBHOOK_URL")
 
-    requests.post(
+    get_http_session().post(
         url=webhook_url,
         data=f"({vite_vue_app_base_url}) {msg}",
         headers={"Content-Type": "application/json"},
@@ -5,6 +5,7 @@ from middleware.access_logic import (
     AccessInfoPrimary,
     WRITE_USER_AUTH_INFO,
     READ_USER_AUTH_INFO,
+    SYSTEM_METRICS_READ_AUTH_INFO,
 )
 from middleware.decorators import (
     endpoint_info,
@@ -14,6 +15,9 @@ from middleware.primary_resource_logic.admin import (
     create_admin_user,
     update_user_password,
 )
+from middleware.primary_resource_logic.request_metrics_logic import (
+    get_request_metrics,
+)
 from middleware.schema_and_dto_logic.common_schemas_and_dtos import (
     GET_MANY_SCHEMA_POPULATE_PARAMETERS,
 )
@@ -89,3 +93,23 @@ class AdminUsersByID(PsycopgResource):
             schema_populate_parameters=SchemaConfigs.ADMIN_USERS_BY_ID_PUT.value.get_schema_populate_parameters(),
             user_id=int(resource_id),
         )
+
+
+@namespace_admin.route("/metrics", methods=["GET"])
+class AdminRequestMetrics(PsycopgResource):
+
+    @endpoint_info(
+        namespace=namespace_admin,
+        auth_info=SYSTEM_METRICS_READ_AUTH_INFO,
+        schema_config=SchemaConfigs.ADMIN_REQUEST_METRICS_GET,
+        response_info=ResponseInfo(
+            success_message="Returns request metrics in the Prometheus text format."
+        ),
+        description="""
+        Returns per-endpoint request latency histograms, database queries per request,
+        time spent per request phase, slow request counts, and outbound request metrics,
+        summed across worker processes, in the Prometheus text format.
+        """,
+    )
+    def get(self, access_info: AccessInfoPrimary) -> Response:
+        return self.run_endpoint(wrapper_function=get_request_metrics)
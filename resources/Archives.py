@@ -12,6 +12,8 @@ from middleware.decorators import api_key_required, permissions_required, endpoi
 from middleware.primary_resource_logic.archives_queries import (
     archives_get_query,
     update_archives_data,
+    update_archives_data_batch,
+    MAX_BATCH_ARCHIVE_UPDATES,
 )
 
 import json
@@ -39,25 +41,27 @@ class Archives(PsycopgResource):
         auth_info=API_OR_JWT_AUTH_INFO,
         schema_config=SchemaConfigs.ARCHIVES_GET,
         response_info=ResponseInfo(
-            success_message="Returns a list of archived data sources.",
+            success_message="Returns a list of data sources due for archival.",
         ),
-        description="Retrieves archived data sources from the database.",
+        description="""
+        Claims data sources due for archival, most overdue first.
+        Returned data sources are leased, and will not be returned by other requests
+        until the lease expires or their last cached date is updated.
+        """,
     )
     def get(self, access_info: AccessInfoPrimary) -> Any:
         """
-        Retrieves archived data sources from the database.
+        Claims data sources due for archival.
 
-        Uses an API-required middleware for security and a database connection to fetch archived data.
+        Uses an API-required middleware for security and a database connection to fetch and lease due data sources.
 
         Returns:
-        - Any: The cleaned results of archives combined from the database query, or an error message if an exception occurs.
+        - Any: The data sources due for archival, or an error message if an exception occurs.
         """
-        with self.setup_database_client() as db_client:
-            archives_combined_results_clean = archives_get_query(
-                db_client=db_client,
-            )
-
-        return archives_combined_results_clean
+        return self.run_endpoint(
+            archives_get_query,
+            schema_populate_parameters=SchemaConfigs.ARCHIVES_GET.value.get_schema_populate_parameters(),
+        )
 
     @endpoint_info(
         namespace=namespace_archives,
@@ -100,3 +104,29 @@ class Archives(PsycopgResource):
             last_cached=last_cached,
             broken_as_of=broken_as_of,
         )
+
+
+@namespace_archives.route("/archives/batch")
+class ArchivesBatch(PsycopgResource):
+
+    @endpoint_info(
+        namespace=namespace_archives,
+        auth_info=ARCHIVE_WRITE_AUTH_INFO,
+        schema_config=SchemaConfigs.ARCHIVES_BATCH_PUT,
+        response_info=ResponseInfo(
+            success_message="Successfully applied the archive updates.",
+        ),
+        description=f"""
+        Updates the archive data of multiple data sources in a single transaction.
+        Each entry updates the last_cached date of a data source, and,
+        if broken_source_url_as_of is provided, marks its source url as broken as of that date.
+        Returns whether each entry was applied, in the order submitted.
+        At most {MAX_BATCH_ARCHIVE_UPDATES} entries may be submitted at once.
+        """,
+    )
+    @limiter.limit("25/minute;1000/hour")
+    def put(self, access_info: AccessInfoPrimary) -> Response:
+        return self.run_endpoint(
+            update_archives_data_batch,
+            schema_populate_parameters=SchemaConfigs.ARCHIVES_BATCH_PUT.value.get_schema_populate_parameters(),
+        )
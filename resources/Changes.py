@@ -0,0 +1,37 @@
+from flask import Response
+
+from middleware.access_logic import AccessInfoPrimary, CHANGE_FEED_READ_AUTH_INFO
+from middleware.decorators import endpoint_info
+from middleware.primary_resource_logic.change_feed_logic import get_changes_wrapper
+from resources.PsycopgResource import PsycopgResource
+from resources.endpoint_schema_config import SchemaConfigs
+from resources.resource_helpers import ResponseInfo
+from utilities.namespace import create_namespace, AppNamespaces
+
+namespace_changes = create_namespace(AppNamespaces.CHANGES)
+
+
+@namespace_changes.route("", methods=["GET"])
+class Changes(PsycopgResource):
+
+    @endpoint_info(
+        namespace=namespace_changes,
+        auth_info=CHANGE_FEED_READ_AUTH_INFO,
+        schema_config=SchemaConfigs.CHANGES_GET,
+        response_info=ResponseInfo(
+            success_message="Returns the changes following the cursor."
+        ),
+        description="""
+        Returns inserts, updates, and deletes to agencies, data sources, data requests,
+        locations, and the tables linking them, in the order they can be applied.
+        To sync incrementally, request again with `since` set to the returned `next_cursor`
+        until `has_more` is false, then poll with the latest cursor.
+        If changes following `since` have expired, 410 is returned, and consumers
+        must resync by requesting without `since`.
+        """,
+    )
+    def get(self, access_info: AccessInfoPrimary) -> Response:
+        return self.run_endpoint(
+            wrapper_function=get_changes_wrapper,
+            schema_populate_parameters=SchemaConfigs.CHANGES_GET.value.get_schema_populate_parameters(),
+        )
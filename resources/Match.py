@@ -5,6 +5,9 @@ from middleware.decorators import endpoint_info
 from middleware.primary_resource_logic.match_logic import (
     try_matching_agency,
     match_agency_wrapper,
+    match_agencies_batch_wrapper,
+    match_agencies_batch_csv_wrapper,
+    MAX_BATCH_MATCH_ENTRIES,
 )
 from resources.PsycopgResource import PsycopgResource
 from resources.endpoint_schema_config import SchemaConfigs
@@ -36,3 +39,52 @@ class MatchAgencies(PsycopgResource):
             wrapper_function=match_agency_wrapper,
             schema_populate_parameters=SchemaConfigs.MATCH_AGENCY.value.get_schema_populate_parameters(),
         )
+
+
+@namespace_match.route("/agency/batch")
+class MatchAgenciesBatch(PsycopgResource):
+
+    @endpoint_info(
+        namespace=namespace_match,
+        auth_info=STANDARD_JWT_AUTH_INFO,
+        schema_config=SchemaConfigs.MATCH_AGENCY_BATCH,
+        response_info=ResponseInfo(
+            success_message="Found any possible matches for each set of search criteria."
+        ),
+        description=f"""
+        Matches multiple agencies at once, following the same rules as `/match/agency`.
+        Returns a match result for each agency, in the order submitted.
+        At most {MAX_BATCH_MATCH_ENTRIES} agencies may be submitted at once.
+        """,
+    )
+    def post(self, access_info: AccessInfoPrimary) -> Response:
+        return self.run_endpoint(
+            wrapper_function=match_agencies_batch_wrapper,
+            schema_populate_parameters=SchemaConfigs.MATCH_AGENCY_BATCH.value.get_schema_populate_parameters(),
+        )
+
+
+@namespace_match.route("/agency/batch/csv")
+class MatchAgenciesBatchCSV(PsycopgResource):
+
+    @endpoint_info(
+        namespace=namespace_match,
+        auth_info=STANDARD_JWT_AUTH_INFO,
+        schema_config=SchemaConfigs.MATCH_AGENCY_BATCH_CSV,
+        response_info=ResponseInfo(
+            success_message="Found any possible matches for each set of search criteria."
+        ),
+        description=f"""
+        Matches multiple agencies at once from a CSV file, following the same rules as `/match/agency`.
+        Returns a match result for each row, in the order of the file.
+        At most {MAX_BATCH_MATCH_ENTRIES} rows may be submitted at once.
+
+        Note: Only file upload should be provided.
+        The json arguments simply denote the columns of the csv
+        """,
+    )
+    def post(self, access_info: AccessInfoPrimary) -> Response:
+        return self.run_endpoint(
+            wrapper_function=match_agencies_batch_csv_wrapper,
+            schema_populate_parameters=SchemaConfigs.MATCH_AGENCY_BATCH_CSV.value.get_schema_populate_parameters(),
+        )
@@ -7,10 +7,11 @@ from typing import Callable, Any, Union, Tuple, Dict, Optional
 from flask import Response
 from flask_restx import abort, Resource
 
-from config import config
 from database_client.database_client import DatabaseClient
 from middleware.argument_checking_logic import check_for_mutually_exclusive_arguments
+from middleware.enums import RequestPhase
 from middleware.initialize_psycopg_connection import initialize_psycopg_connection
+from middleware.request_profiling import profile_phase
 from middleware.schema_and_dto_logic.dynamic_logic.dynamic_schema_request_content_population import (
     populate_schema_with_request_content,
 )
@@ -78,24 +79,11 @@ class PsycopgResource(Resource):
         """
         super().__init__(*args, **kwargs)
 
-    def connection_is_closed(self) -> bool:
+    def get_connection(self):
         """
-        Per https://www.psycopg.org/docs/connection.html#connection.closed
-        a connection is open is the integer attribute is 0,
-        closed or broken of the integer attribute is nonzero
-
-        A connection is only determined to be closed after
-        an operation has been tried and failed.
-        Thus, in the case of a closed connection, the operation will fail
-        on the first run, then succeed on the second run.
-        :return:
+        Returns the calling thread's connection, which the request's database client also uses.
         """
-        return config.connection.closed != 0
-
-    def get_connection(self):
-        if self.connection_is_closed():
-            config.connection = initialize_psycopg_connection()
-        return config.connection
+        return initialize_psycopg_connection()
 
     @contextmanager
     def setup_database_client(self) -> DatabaseClient:
@@ -127,20 +115,21 @@ class PsycopgResource(Resource):
             with self.setup_database_client() as db_client:
                 return wrapper_function(db_client, **wrapper_kwargs)
 
-        if dto_populate_parameters is not None:
-            dto = populate_dto_with_request_content(
-                dto_class=dto_populate_parameters.dto_class,
-                source=dto_populate_parameters.source,
-                attribute_source_mapping=dto_populate_parameters.attribute_source_mapping,
-                transformation_functions=dto_populate_parameters.transformation_functions,
-                validation_schema=dto_populate_parameters.validation_schema,
-            )
-        elif schema_populate_parameters is not None:
-            dto = populate_schema_with_request_content(
-                schema=schema_populate_parameters.schema,
-                dto_class=schema_populate_parameters.dto_class,
-                load_file=schema_populate_parameters.load_file,
-            )
+        with profile_phase(RequestPhase.DTO_POPULATION):
+            if dto_populate_parameters is not None:
+                dto = populate_dto_with_request_content(
+                    dto_class=dto_populate_parameters.dto_class,
+                    source=dto_populate_parameters.source,
+                    attribute_source_mapping=dto_populate_parameters.attribute_source_mapping,
+                    transformation_functions=dto_populate_parameters.transformation_functions,
+                    validation_schema=dto_populate_parameters.validation_schema,
+                )
+            elif schema_populate_parameters is not None:
+                dto = populate_schema_with_request_content(
+                    schema=schema_populate_parameters.schema,
+                    dto_class=schema_populate_parameters.dto_class,
+                    load_file=schema_populate_parameters.load_file,
+                )
         with self.setup_database_client() as db_client:
             response = wrapper_function(db_client, dto=dto, **wrapper_kwargs)
 
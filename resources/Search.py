@@ -101,7 +101,9 @@ class SearchFollow(PsycopgResource):
         :return:
         """
         return self.run_endpoint(
-            wrapper_function=get_followed_searches, access_info=access_info
+            wrapper_function=get_followed_searches,
+            schema_populate_parameters=SchemaConfigs.SEARCH_FOLLOW_GET.value.get_schema_populate_parameters(),
+            access_info=access_info,
         )
 
     @endpoint_info(
@@ -8,6 +8,8 @@ from middleware.primary_resource_logic.unique_url_checker import (
     UniqueURLCheckerResponseOuterSchema,
     unique_url_checker_wrapper,
     UniqueURLCheckerRequestDTO,
+    unique_url_checker_batch_wrapper,
+    MAX_BATCH_URL_CHECKS,
 )
 from middleware.schema_and_dto_logic.dynamic_logic.dynamic_schema_documentation_construction import (
     get_restx_param_documentation,
@@ -41,3 +43,29 @@ class UniqueURLChecker(PsycopgResource):
             wrapper_function=unique_url_checker_wrapper,
             schema_populate_parameters=SchemaConfigs.CHECKER_GET.value.get_schema_populate_parameters(),
         )
+
+
+@namespace_url_checker.route("/unique-url/batch")
+class UniqueURLCheckerBatch(PsycopgResource):
+
+    @endpoint_info(
+        namespace=namespace_url_checker,
+        description=f"""
+        Check if multiple URLs are unique, in a single request.
+        Returns the duplicates of each URL, in the order submitted.
+        At most {MAX_BATCH_URL_CHECKS} URLs may be submitted at once.
+        """,
+        schema_config=SchemaConfigs.CHECKER_BATCH_POST,
+        auth_info=NO_AUTH_INFO,
+        response_info=ResponseInfo(
+            response_dictionary={
+                200: "OK. Returns duplicate urls for each url, if they exist.",
+                500: "Internal server error",
+            }
+        ),
+    )
+    def post(self, access_info: AccessInfoPrimary) -> Response:
+        return self.run_endpoint(
+            wrapper_function=unique_url_checker_batch_wrapper,
+            schema_populate_parameters=SchemaConfigs.CHECKER_BATCH_POST.value.get_schema_populate_parameters(),
+        )
@@ -23,6 +23,7 @@ from middleware.schema_and_dto_logic.primary_resource_dtos.contact_dtos import (
     ContactFormPostDTO,
 )
 from middleware.schema_and_dto_logic.primary_resource_dtos.match_dtos import (
+    AgencyMatchBatchRequestDTO,
     AgencyMatchRequestDTO,
 )
 from middleware.schema_and_dto_logic.primary_resource_dtos.reset_token_dtos import (
@@ -35,9 +36,19 @@ from middleware.schema_and_dto_logic.primary_resource_schemas.admin_schemas impo
     AdminUsersGetManyResponseSchema,
 )
 from middleware.schema_and_dto_logic.primary_resource_schemas.archives_schemas import (
+    ArchivesBatchPutRequestDTO,
+    ArchivesBatchPutRequestSchema,
+    ArchivesBatchPutResponseSchema,
+    ArchivesGetRequestSchema,
+    ArchivesGetRequestDTO,
     ArchivesGetResponseSchema,
     ArchivesPutRequestSchema,
 )
+from middleware.schema_and_dto_logic.primary_resource_schemas.change_feed_schemas import (
+    ChangesGetRequestSchema,
+    ChangesGetRequestDTO,
+    ChangesGetResponseSchema,
+)
 from middleware.schema_and_dto_logic.primary_resource_schemas.bulk_schemas import (
     BatchRequestSchema,
     BatchPostResponseSchema,
@@ -51,7 +62,10 @@ from middleware.schema_and_dto_logic.primary_resource_schemas.locations_schemas
     LocationInfoExpandedSchema,
 )
 from middleware.schema_and_dto_logic.primary_resource_schemas.match_schemas import (
+    AgencyMatchBatchCSVSchema,
+    AgencyMatchBatchSchema,
     AgencyMatchSchema,
+    MatchAgencyBatchResponseSchema,
     MatchAgencyResponseSchema,
 )
 from middleware.schema_and_dto_logic.primary_resource_schemas.metrics_schemas import (
@@ -94,6 +108,9 @@ from middleware.primary_resource_logic.unique_url_checker import (
     UniqueURLCheckerRequestSchema,
     UniqueURLCheckerResponseOuterSchema,
     UniqueURLCheckerRequestDTO,
+    UniqueURLCheckerBatchRequestSchema,
+    UniqueURLCheckerBatchRequestDTO,
+    UniqueURLCheckerBatchResponseOuterSchema,
 )
 from middleware.primary_resource_logic.user_queries import (
     UserRequestSchema,
@@ -128,6 +145,10 @@ from middleware.schema_and_dto_logic.common_schemas_and_dtos import (
     GetManyBaseDTO,
     GetByIDBaseSchema,
     GetByIDBaseDTO,
+    GetLinkedRowsByIDRequestSchema,
+    GetLinkedRowsByIDDTO,
+    LinkedRowsPageRequestSchema,
+    LinkedRowsPageDTO,
     EntryDataRequestSchema,
     TypeaheadDTO,
     TypeaheadQuerySchema,
@@ -151,6 +172,7 @@ from middleware.schema_and_dto_logic.primary_resource_dtos.agencies_dtos import
 )
 from middleware.schema_and_dto_logic.primary_resource_schemas.data_requests_advanced_schemas import (
     GetManyDataRequestsResponseSchema,
+    GetLinkedDataRequestsResponseSchema,
     DataRequestsPostSchema,
     GetByIDDataRequestsResponseSchema,
     GetManyDataRequestsRequestsSchema,
@@ -432,6 +454,8 @@ class SchemaConfigs(Enum):
         input_dto_class=FederalSearchRequestDTO,
     )
     SEARCH_FOLLOW_GET = EndpointSchemaConfig(
+        input_schema=LinkedRowsPageRequestSchema(),
+        input_dto_class=LinkedRowsPageDTO,
         primary_output_schema=GetUserFollowedSearchesSchema(),
     )
     SEARCH_FOLLOW_POST = SEARCH_FOLLOW_UPDATE
@@ -452,6 +476,11 @@ class SchemaConfigs(Enum):
         primary_output_schema=UniqueURLCheckerResponseOuterSchema(),
         input_dto_class=UniqueURLCheckerRequestDTO,
     )
+    CHECKER_BATCH_POST = EndpointSchemaConfig(
+        input_schema=UniqueURLCheckerBatchRequestSchema(),
+        primary_output_schema=UniqueURLCheckerBatchResponseOuterSchema(),
+        input_dto_class=UniqueURLCheckerBatchRequestDTO,
+    )
     # endregion
     # region Notifications
     NOTIFICATIONS_POST = EndpointSchemaConfig(
@@ -526,11 +555,18 @@ class SchemaConfigs(Enum):
 
     # region Archives
     ARCHIVES_GET = EndpointSchemaConfig(
+        input_schema=ArchivesGetRequestSchema(),
+        input_dto_class=ArchivesGetRequestDTO,
         primary_output_schema=ArchivesGetResponseSchema(),
     )
     ARCHIVES_PUT = EndpointSchemaConfig(
         input_schema=ArchivesPutRequestSchema(),
     )
+    ARCHIVES_BATCH_PUT = EndpointSchemaConfig(
+        input_schema=ArchivesBatchPutRequestSchema(),
+        input_dto_class=ArchivesBatchPutRequestDTO,
+        primary_output_schema=ArchivesBatchPutResponseSchema(),
+    )
     # endregion
 
     # region Permission
@@ -559,6 +595,16 @@ class SchemaConfigs(Enum):
         input_dto_class=AgencyMatchRequestDTO,
         primary_output_schema=MatchAgencyResponseSchema(),
     )
+    MATCH_AGENCY_BATCH = EndpointSchemaConfig(
+        input_schema=AgencyMatchBatchSchema(),
+        input_dto_class=AgencyMatchBatchRequestDTO,
+        primary_output_schema=MatchAgencyBatchResponseSchema(),
+    )
+    MATCH_AGENCY_BATCH_CSV = EndpointSchemaConfig(
+        input_schema=AgencyMatchBatchCSVSchema(),
+        input_dto_class=AgencyMatchRequestDTO,
+        primary_output_schema=MatchAgencyBatchResponseSchema(),
+    )
     # endregion
 
     # region Location
@@ -566,9 +612,9 @@ class SchemaConfigs(Enum):
         primary_output_schema=LocationInfoExpandedSchema(),
     )
     LOCATIONS_RELATED_DATA_REQUESTS_GET = EndpointSchemaConfig(
-        input_schema=GetByIDBaseSchema(),
-        input_dto_class=GetByIDBaseDTO,
-        primary_output_schema=GetManyDataRequestsResponseSchema(),
+        input_schema=GetLinkedRowsByIDRequestSchema(),
+        input_dto_class=GetLinkedRowsByIDDTO,
+        primary_output_schema=GetLinkedDataRequestsResponseSchema(),
     )
     # endregion
 
@@ -603,6 +649,9 @@ class SchemaConfigs(Enum):
         input_dto_class=AdminUserPostDTO,
     )
 
+    # Returns the Prometheus text format rather than JSON
+    ADMIN_REQUEST_METRICS_GET = EndpointSchemaConfig()
+
     # endregion
 
     # region Contact
@@ -619,3 +668,12 @@ class SchemaConfigs(Enum):
     RECORD_TYPE_AND_CATEGORY_GET = EndpointSchemaConfig(
         primary_output_schema=RecordTypeAndCategoryResponseSchema(),
     )
+    # endregion
+
+    # region Changes
+    CHANGES_GET = EndpointSchemaConfig(
+        input_schema=ChangesGetRequestSchema(),
+        input_dto_class=ChangesGetRequestDTO,
+        primary_output_schema=ChangesGetResponseSchema(),
+    )
+    # endregion
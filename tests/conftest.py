@@ -25,7 +25,9 @@ def client_with_mock_db(mocker, monkeypatch) -> ClientWithMockDB:
     from app import create_app
 
     mock_db = mocker.MagicMock()
-    monkeypatch.setattr("app.initialize_psycopg_connection", lambda: mock_db)
+    monkeypatch.setattr(
+        "resources.PsycopgResource.initialize_psycopg_connection", lambda: mock_db
+    )
     app = create_app()
     app.config["TESTING"] = True
     app.config["PROPAGATE_EXCEPTIONS"] = True
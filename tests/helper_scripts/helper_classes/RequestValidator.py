@@ -12,7 +12,7 @@ from marshmallow import Schema
 
 from database_client.constants import PAGE_SIZE
 from database_client.enums import SortOrder, RequestStatus, ApprovalStatus
-from middleware.enums import OutputFormatEnum, PermissionsEnum, RecordTypes
+from middleware.enums import OutputFormatEnum, PermissionsEnum, RecordTypes, Relations
 from middleware.util import update_if_not_none
 from resources.endpoint_schema_config import SchemaConfigs
 from tests.helper_scripts.common_test_data import get_test_name
@@ -281,6 +281,8 @@ class RequestValidator:
             Union[Type[Schema], Schema]
         ] = SchemaConfigs.SEARCH_LOCATION_AND_RECORD_TYPE_GET.value.primary_output_schema,
         expected_json_content: Optional[dict] = None,
+        per_jurisdiction_limit: Optional[int] = None,
+        per_jurisdiction_offset: Optional[int] = None,
     ):
         endpoint_base = "/search/search-location-and-record-type"
         query_params = self._get_search_query_params(
@@ -289,6 +291,10 @@ class RequestValidator:
             record_types=record_types,
         )
         query_params.update({} if format is None else {"output_format": format.value})
+        if per_jurisdiction_limit is not None:
+            query_params["per_jurisdiction_limit"] = per_jurisdiction_limit
+        if per_jurisdiction_offset is not None:
+            query_params["per_jurisdiction_offset"] = per_jurisdiction_offset
         endpoint = add_query_params(
             url=endpoint_base,
             params=query_params,
@@ -694,6 +700,68 @@ class RequestValidator:
             expected_schema=SchemaConfigs.MATCH_AGENCY.value.primary_output_schema,
         )
 
+    def archives_batch_put(
+        self,
+        headers: dict,
+        entries: list[dict],
+        expected_response_status: HTTPStatus = HTTPStatus.OK,
+    ):
+        return self.put(
+            endpoint="/api/archives/batch",
+            headers=headers,
+            json={"entries": entries},
+            expected_schema=SchemaConfigs.ARCHIVES_BATCH_PUT.value.primary_output_schema,
+            expected_response_status=expected_response_status,
+        )
+
+    def get_changes(
+        self,
+        headers: dict,
+        since: Optional[str] = None,
+        tables: Optional[list[Relations]] = None,
+        limit: Optional[int] = None,
+        expected_response_status: HTTPStatus = HTTPStatus.OK,
+    ):
+        query_params = {}
+        if since is not None:
+            query_params["since"] = since
+        if tables is not None:
+            query_params["tables"] = ",".join(table.value for table in tables)
+        if limit is not None:
+            query_params["limit"] = limit
+        return self.get(
+            endpoint=add_query_params(url="/api/changes", params=query_params),
+            headers=headers,
+            expected_schema=SchemaConfigs.CHANGES_GET.value.primary_output_schema,
+            expected_response_status=expected_response_status,
+        )
+
+    def match_agency_batch(
+        self,
+        headers: dict,
+        entries: list[dict],
+        expected_response_status: HTTPStatus = HTTPStatus.OK,
+    ):
+        return self.post(
+            endpoint="/api/match/agency/batch",
+            headers=headers,
+            json={"entries": entries},
+            expected_schema=SchemaConfigs.MATCH_AGENCY_BATCH.value.primary_output_schema,
+            expected_response_status=expected_response_status,
+        )
+
+    def match_agency_batch_csv(
+        self,
+        bop: BulkOperationParams,
+    ):
+        return self.post(
+            endpoint="/api/match/agency/batch/csv",
+            headers=bop.headers,
+            file=bop.file,
+            expected_schema=SchemaConfigs.MATCH_AGENCY_BATCH_CSV.value.primary_output_schema,
+            expected_response_status=bop.expected_response_status,
+        )
+
     # region Locations
 
     def get_location_by_id(
@@ -712,9 +780,19 @@ class RequestValidator:
         self,
         headers: dict,
         location_id: int,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
     ):
+        query_params = {}
+        if limit is not None:
+            query_params["limit"] = limit
+        if after is not None:
+            query_params["after"] = after
         return self.get(
-            endpoint=f"/api/locations/{location_id}/data-requests",
+            endpoint=add_query_params(
+                url=f"/api/locations/{location_id}/data-requests",
+                params=query_params,
+            ),
             headers=headers,
             expected_schema=SchemaConfigs.LOCATIONS_RELATED_DATA_REQUESTS_GET.value.primary_output_schema,
         )
@@ -729,6 +807,18 @@ class RequestValidator:
             expected_schema=SchemaConfigs.METRICS_GET.value.primary_output_schema,
         )
 
+    def get_request_metrics(
+        self,
+        headers: dict,
+        expected_response_status: HTTPStatus = HTTPStatus.OK,
+    ):
+        return self.get(
+            endpoint="/api/admin/metrics",
+            headers=headers,
+            expected_response_status=expected_response_status,
+            return_json=False,
+        )
+
     def get_user_by_id_admin(self, headers: dict, user_id: str):
         return self.get(
             endpoint=f"/api/admin/users/{user_id}",
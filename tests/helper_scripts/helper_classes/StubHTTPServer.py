@@ -0,0 +1,193 @@
+import datetime
+import ipaddress
+import os
+import ssl
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+
+@dataclass
+class StubResponse:
+    status: int = 200
+    body: bytes = b'{"message": "ok"}'
+    delay_seconds: float = 0.0
+    headers: dict = field(default_factory=dict)
+
+
+@dataclass
+class StubRequest:
+    method: str
+    path: str
+    body: bytes
+    # The port of the client connection over which the request was sent
+    client_port: int
+
+
+def create_self_signed_certificate(cert_path: str, key_path: str):
+    """
+    Writes a certificate for 127.0.0.1, and its private key, to the given paths
+    """
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    with open(cert_path, "wb") as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+
+
+class StubHTTPServer:
+    """
+    A local HTTP/1.1 server standing in for a third party,
+    which keeps connections alive and records the requests and connections it receives.
+    With `tls`, it serves HTTPS using a self-signed certificate,
+    which clients must verify against `cert_path`.
+
+    Responses are given in the order they are queued,
+    after which `default_response` is given.
+
+    Usage:
+        with StubHTTPServer() as server:
+            server.queue_responses(StubResponse(status=503))
+            requests.get(server.url)
+    """
+
+    def __init__(
+        self, default_response: StubResponse = StubResponse(), tls: bool = False
+    ):
+        self.default_response = default_response
+        self.tls = tls
+        self.cert_path = None
+        self.requests: list[StubRequest] = []
+        self.connection_count = 0
+        self._queued_responses: list[StubResponse] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+        self._server.daemon_threads = True
+        # Clients which time out close their connection before the response is written
+        self._server.handle_error = lambda request, client_address: None
+        self._thread = None
+        self._cert_dir = None
+        if tls:
+            self._enable_tls()
+
+    def _enable_tls(self):
+        self._cert_dir = tempfile.TemporaryDirectory()
+        self.cert_path = os.path.join(self._cert_dir.name, "cert.pem")
+        key_path = os.path.join(self._cert_dir.name, "key.pem")
+        create_self_signed_certificate(cert_path=self.cert_path, key_path=key_path)
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(certfile=self.cert_path, keyfile=key_path)
+        # Handshakes are completed by each connection's handler thread
+        self._server.socket = context.wrap_socket(
+            self._server.socket, server_side=True, do_handshake_on_connect=False
+        )
+
+    @property
+    def host(self) -> str:
+        host, port = self._server.server_address
+        return f"{host}:{port}"
+
+    @property
+    def url(self) -> str:
+        scheme = "https" if self.tls else "http"
+        return f"{scheme}://{self.host}"
+
+    def queue_responses(self, *responses: StubResponse):
+        with self._lock:
+            self._queued_responses.extend(responses)
+
+    def _next_response(self) -> StubResponse:
+        with self._lock:
+            if self._queued_responses:
+                return self._queued_responses.pop(0)
+            return self.default_response
+
+    def _create_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately,
+            # which would otherwise be delayed on kept alive connections
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                if stub.tls:
+                    self.request.do_handshake()
+                super().setup()
+                with stub._lock:
+                    stub.connection_count += 1
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                with stub._lock:
+                    stub.requests.append(
+                        StubRequest(
+                            method=self.command,
+                            path=self.path,
+                            body=body,
+                            client_port=self.client_address[1],
+                        )
+                    )
+                response = stub._next_response()
+                time.sleep(response.delay_seconds)
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+
+            do_GET = _respond
+            do_POST = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        if self._cert_dir is not None:
+            self._cert_dir.cleanup()
@@ -187,6 +187,8 @@ def create_admin_test_user_setup(flask_client: FlaskClient) -> TestUserSetup:
             PermissionsEnum.DB_WRITE,
             PermissionsEnum.USER_CREATE_UPDATE,
             PermissionsEnum.ARCHIVE_WRITE,
+            PermissionsEnum.CHANGE_FEED_READ,
+            PermissionsEnum.SYSTEM_METRICS_READ,
         ],
     )
     return tus_admin
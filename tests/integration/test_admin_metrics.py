@@ -0,0 +1,29 @@
+from http import HTTPStatus
+
+from tests.helper_scripts.helper_classes.TestDataCreatorFlask import (
+    TestDataCreatorFlask,
+)
+
+
+def test_admin_metrics_get(test_data_creator_flask: TestDataCreatorFlask):
+    """
+    Test that GET call to /admin/metrics returns request metrics in the Prometheus text format,
+    to admins authenticated with an API key, but not to standard users
+    """
+    tdc = test_data_creator_flask
+    tdc.request_validator.get_metrics(
+        headers=tdc.get_admin_tus().jwt_authorization_header
+    )
+
+    metrics = tdc.request_validator.get_request_metrics(
+        headers=tdc.get_admin_tus().api_authorization_header
+    ).decode()
+
+    assert "# TYPE http_request_duration_seconds histogram" in metrics
+    assert 'endpoint="/metrics"' in metrics
+    assert "http_request_db_queries_count" in metrics
+
+    tdc.request_validator.get_request_metrics(
+        headers=tdc.standard_user().api_authorization_header,
+        expected_response_status=HTTPStatus.FORBIDDEN,
+    )
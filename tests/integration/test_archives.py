@@ -85,3 +85,53 @@ def test_archives_put(
     )
     assert row[0]["last_cached"] == last_cached
     assert row[0]["broken_source_url_as_of"] is None
+
+
+def test_archives_batch_put(
+    test_data_creator_flask: TestDataCreatorFlask,
+):
+    """
+    Test that PUT call to /archives/batch endpoint updates multiple data sources at once,
+    and reports data sources which could not be found
+    """
+    tdc = test_data_creator_flask
+    cached_data_source_id = int(tdc.data_source().id)
+    broken_data_source_id = int(tdc.data_source().id)
+    missing_data_source_id = 2_000_000_000
+    last_cached = datetime.datetime(year=2020, month=3, day=4)
+    broken_as_of = datetime.date(year=2020, month=3, day=5)
+
+    response_json = tdc.request_validator.archives_batch_put(
+        headers=tdc.get_admin_tus().jwt_authorization_header,
+        entries=[
+            {"id": cached_data_source_id, "last_cached": str(last_cached)},
+            {
+                "id": broken_data_source_id,
+                "last_cached": str(last_cached),
+                "broken_source_url_as_of": str(broken_as_of),
+            },
+            {"id": missing_data_source_id, "last_cached": str(last_cached)},
+        ],
+    )
+
+    assert response_json["results"] == [
+        {"id": cached_data_source_id, "status": "updated"},
+        {"id": broken_data_source_id, "status": "updated"},
+        {"id": missing_data_source_id, "status": "not_found"},
+    ]
+
+    rows = tdc.db_client.execute_raw_sql(
+        query="""
+        SELECT data_sources.id, last_cached, broken_source_url_as_of, url_status
+        FROM data_sources
+        INNER JOIN data_sources_archive_info ON data_sources.id = data_sources_archive_info.data_source_id
+        WHERE data_sources.id = ANY(%s)
+        """,
+        vars=([cached_data_source_id, broken_data_source_id],),
+    )
+    rows_by_id = {row["id"]: row for row in rows}
+    assert rows_by_id[cached_data_source_id]["last_cached"] == last_cached
+    assert rows_by_id[cached_data_source_id]["broken_source_url_as_of"] is None
+    assert rows_by_id[broken_data_source_id]["last_cached"] == last_cached
+    assert rows_by_id[broken_data_source_id]["broken_source_url_as_of"] == broken_as_of
+    assert rows_by_id[broken_data_source_id]["url_status"] == "broken"
@@ -0,0 +1,127 @@
+from http import HTTPStatus
+
+from middleware.enums import Relations
+from tests.helper_scripts.common_test_data import get_test_name
+from tests.helper_scripts.helper_classes.TestDataCreatorFlask import (
+    TestDataCreatorFlask,
+)
+
+
+def get_latest_cursor(tdc: TestDataCreatorFlask, tables: list[Relations]):
+    since = None
+    while True:
+        response_json = tdc.request_validator.get_changes(
+            headers=tdc.get_admin_tus().jwt_authorization_header,
+            since=since,
+            tables=tables,
+            limit=5000,
+        )
+        since = response_json["next_cursor"]
+        if not response_json["has_more"]:
+            return since
+
+
+def test_changes_get(test_data_creator_flask: TestDataCreatorFlask):
+    """
+    Test that GET call to /changes returns inserts, updates, and deletes
+    to the requested tables following the cursor, in order
+    """
+    tdc = test_data_creator_flask
+    tables = [Relations.DATA_SOURCES, Relations.LINK_AGENCIES_DATA_SOURCES]
+    since = get_latest_cursor(tdc, tables=tables)
+
+    data_source_id = int(tdc.data_source().id)
+    new_name = get_test_name()
+    tdc.db_client._update_entry_in_table(
+        table_name=Relations.DATA_SOURCES.value,
+        entry_id=data_source_id,
+        column_edit_mappings={"name": new_name},
+    )
+    agency_id = int(tdc.agency().id)
+    tdc.link_data_source_to_agency(
+        data_source_id=data_source_id,
+        agency_id=agency_id,
+    )
+    tdc.db_client._delete_from_table(
+        table_name=Relations.DATA_SOURCES.value, id_column_value=data_source_id
+    )
+
+    response_json = tdc.request_validator.get_changes(
+        headers=tdc.get_admin_tus().jwt_authorization_header,
+        since=since,
+        tables=tables,
+    )
+    assert response_json["has_more"] is False
+    changes = response_json["data"]
+    data_source_changes = [
+        change
+        for change in changes
+        if change["table_name"] == Relations.DATA_SOURCES.value
+    ]
+    assert all(
+        change["affected_id"] == data_source_id for change in data_source_changes
+    )
+    assert data_source_changes[0]["operation_type"] == "INSERT"
+    assert data_source_changes[-1]["operation_type"] == "DELETE"
+    assert any(
+        change["operation_type"] == "UPDATE" and change["row_data"]["name"] == new_name
+        for change in data_source_changes
+    )
+
+    link_changes = [
+        change
+        for change in changes
+        if change["table_name"] == Relations.LINK_AGENCIES_DATA_SOURCES.value
+    ]
+    assert link_changes[0]["operation_type"] == "INSERT"
+    assert link_changes[0]["row_data"]["agency_id"] == agency_id
+    # Link table has no id column
+    assert link_changes[0]["affected_id"] is None
+    assert response_json["next_cursor"] == changes[-1]["cursor"]
+
+    # Paging through one change at a time returns the same changes
+    cursor = since
+    for change in changes:
+        response_json = tdc.request_validator.get_changes(
+            headers=tdc.get_admin_tus().jwt_authorization_header,
+            since=cursor,
+            tables=tables,
+            limit=1,
+        )
+        assert response_json["data"] == [change]
+        cursor = response_json["next_cursor"]
+
+    # No further changes
+    response_json = tdc.request_validator.get_changes(
+        headers=tdc.get_admin_tus().jwt_authorization_header,
+        since=cursor,
+        tables=tables,
+    )
+    assert response_json["data"] == []
+    assert response_json["next_cursor"] == cursor
+
+    # Invalid cursors and tables are rejected
+    tdc.request_validator.get_changes(
+        headers=tdc.get_admin_tus().jwt_authorization_header,
+        since="not-a-cursor",
+        expected_response_status=HTTPStatus.BAD_REQUEST,
+    )
+    tdc.request_validator.get_changes(
+        headers=tdc.get_admin_tus().jwt_authorization_header,
+        tables=[Relations.USERS],
+        expected_response_status=HTTPStatus.BAD_REQUEST,
+    )
+
+    # Cursors preceding every retained change have expired
+    tdc.request_validator.get_changes(
+        headers=tdc.get_admin_tus().jwt_authorization_header,
+        since="1-1",
+        expected_response_status=HTTPStatus.GONE,
+    )
+
+    # Standard users cannot read the change feed
+    tdc.request_validator.get_changes(
+        headers=tdc.standard_user().jwt_authorization_header,
+        since=cursor,
+        expected_response_status=HTTPStatus.FORBIDDEN,
+    )
@@ -63,6 +63,24 @@ def test_locations_related_data_requests(locations_test_setup: LocationsTestSetu
 
     # Confirm information matches
     assert len(data["data"]) == 2
+    assert data["next_after"] is None
+
+    # Confirm data requests can be retrieved a page at a time
+    first_page = tdc.request_validator.get_location_related_data_requests(
+        location_id=location_id,
+        headers=tus.api_authorization_header,
+        limit=1,
+    )
+    assert [result["id"] for result in first_page["data"]] == [int(dr_1)]
+    assert first_page["next_after"] == int(dr_1)
+    second_page = tdc.request_validator.get_location_related_data_requests(
+        location_id=location_id,
+        headers=tus.api_authorization_header,
+        limit=1,
+        after=first_page["next_after"],
+    )
+    assert [result["id"] for result in second_page["data"]] == [int(dr_2)]
+    assert second_page["next_after"] is None
 
     # Confirm also works with jwt
     data = tdc.request_validator.get_location_related_data_requests(
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+from dateutil.relativedelta import relativedelta
+
+from middleware.enums import Relations
+from middleware.scheduled_tasks.maintain_log_partitions import (
+    maintain_log_partitions_inner,
+)
+
+
+def get_partition_names(db_client, table: Relations) -> list[str]:
+    results = db_client.execute_raw_sql(
+        """
+        SELECT child.relname AS partition_name
+        FROM pg_inherits
+        INNER JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        INNER JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = %s
+        """,
+        (table.value,),
+    )
+    return [result["partition_name"] for result in results or []]
+
+
+def get_partition_name(table: Relations, month: datetime) -> str:
+    return f"{table.value}_p{month.strftime('%Y_%m')}"
+
+
+def test_maintain_log_partitions(test_data_creator_db_client):
+    tdc = test_data_creator_db_client
+    db_client = tdc.db_client
+    table = Relations.TABLE_COUNT_LOG
+
+    # Create a partition older than the retention period, containing a log
+    now = datetime.now()
+    expired_month = now - relativedelta(years=10)
+    db_client.execute_raw_sql(
+        "SELECT create_monthly_partition(%s, %s)", (table.value, expired_month.date())
+    )
+    db_client.execute_raw_sql(
+        "INSERT INTO table_count_log (table_name, count, created_at) VALUES (%s, %s, %s)",
+        ("expired_table", 1, expired_month),
+    )
+    assert get_partition_name(table, expired_month) in get_partition_names(
+        db_client, table
+    )
+
+    dropped_partitions = maintain_log_partitions_inner(
+        db_client, retention_months={table: 12}, months_ahead=2
+    )
+
+    # The expired partition, and its logs, are dropped
+    assert get_partition_name(table, expired_month) in dropped_partitions
+    partition_names = get_partition_names(db_client, table)
+    assert get_partition_name(table, expired_month) not in partition_names
+    assert (
+        db_client.execute_raw_sql(
+            "SELECT id FROM table_count_log WHERE table_name = %s",
+            ("expired_table",),
+        )
+        is None
+    )
+
+    # Partitions for the current month and the months ahead are present
+    for month_offset in range(3):
+        month = now + relativedelta(months=month_offset)
+        assert get_partition_name(table, month) in partition_names
+    assert f"{table.value}_default" in partition_names
+
+    # Running again creates and drops nothing further
+    assert (
+        maintain_log_partitions_inner(
+            db_client, retention_months={table: 12}, months_ahead=2
+        )
+        == []
+    )
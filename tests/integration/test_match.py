@@ -14,6 +14,12 @@ from tests.helper_scripts.common_test_data import get_test_name
 from tests.helper_scripts.complex_test_data_creation_functions import (
     get_sample_location_info,
 )
+from middleware.schema_and_dto_logic.primary_resource_schemas.match_schemas import (
+    AgencyMatchSchema,
+)
+from tests.helper_scripts.helper_classes.RequestValidator import RequestValidator
+from tests.helper_scripts.helper_classes.SimpleTempFile import SimpleTempFile
+from tests.helper_scripts.helper_classes.TestCSVCreator import TestCSVCreator
 from tests.helper_scripts.helper_classes.TestDataCreatorFlask import (
     TestDataCreatorFlask,
 )
@@ -137,4 +143,65 @@ def test_agency_match_no_match(match_agency_setup: TestMatchAgencySetup):
     assert data["status"] == AgencyMatchStatus.NO_MATCH.value
 
 
+def get_batch_match_entries(mas: TestMatchAgencySetup) -> list[dict]:
+    location_kwargs = {
+        "state": mas.location_kwargs["state_name"],
+        "county": mas.location_kwargs["county_name"],
+        "locality": mas.location_kwargs["locality_name"],
+    }
+    return [
+        # Exact match
+        {"name": mas.agency_name, **location_kwargs},
+        # Partial match
+        {"name": mas.agency_name + "1", **location_kwargs},
+        # No match, as the location does not exist
+        {
+            "name": mas.agency_name,
+            "state": "New York",
+            "county": "New York",
+            "locality": get_test_name(),
+        },
+    ]
+
+
+def assert_batch_match_results(results: list[dict], agency_name: str):
+    assert [result["status"] for result in results] == [
+        AgencyMatchStatus.EXACT.value,
+        AgencyMatchStatus.PARTIAL.value,
+        AgencyMatchStatus.NO_MATCH.value,
+    ]
+    assert len(results[0]["agencies"]) == 1
+    assert results[0]["agencies"][0]["name"] == agency_name
+    assert results[1]["agencies"][0]["name"] == agency_name
+    assert results[2]["agencies"] == []
+
+
+def test_agency_match_batch(match_agency_setup: TestMatchAgencySetup):
+    mas = match_agency_setup
+
+    data = mas.tdc.request_validator.match_agency_batch(
+        headers=mas.jwt_authorization_header,
+        entries=get_batch_match_entries(mas),
+    )
+
+    assert_batch_match_results(data["results"], agency_name=mas.agency_name)
+
+
+def test_agency_match_batch_csv(match_agency_setup: TestMatchAgencySetup):
+    mas = match_agency_setup
+
+    with SimpleTempFile() as temp_file:
+        TestCSVCreator(AgencyMatchSchema()).create_csv(
+            file=temp_file, rows=get_batch_match_entries(mas)
+        )
+        data = mas.tdc.request_validator.match_agency_batch_csv(
+            bop=RequestValidator.BulkOperationParams(
+                file=temp_file,
+                headers=mas.jwt_authorization_header,
+            )
+        )
+
+    assert_batch_match_results(data["results"], agency_name=mas.agency_name)
+
+
 # region Test Full Integration
@@ -16,3 +16,4 @@ def test_metrics(test_data_creator_flask: TestDataCreatorFlask):
     assert metrics["agency_count"] > 0
     assert metrics["county_count"] > 0
     assert metrics["state_count"] > 0
+    assert metrics["computed_at"] is not None
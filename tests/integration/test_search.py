@@ -149,6 +149,40 @@ def test_search_get(search_test_setup: SearchTestSetup):
     assert json_ids == csv_ids
 
 
+def test_search_get_per_jurisdiction_pagination(search_test_setup: SearchTestSetup):
+    sts = search_test_setup
+    tdc = sts.tdc
+    tdcdb = tdc.tdcdb
+
+    agency_id = tdcdb.agency(location_id=sts.location_id).id
+    for _ in range(3):
+        tdcdb.link_data_source_to_agency(
+            data_source_id=tdcdb.data_source().id,
+            agency_id=agency_id,
+        )
+
+    def search(**kwargs) -> dict:
+        return tdc.request_validator.search(
+            headers=sts.tus.api_authorization_header,
+            location_id=sts.location_id,
+            **kwargs,
+        )
+
+    all_results = search()
+    first_page = search(per_jurisdiction_limit=1)
+    second_page = search(per_jurisdiction_limit=1, per_jurisdiction_offset=1)
+
+    # Counts include all results, regardless of pagination
+    assert first_page["count"] == second_page["count"] == all_results["count"] >= 3
+    for jurisdiction in get_enum_values(JurisdictionSimplified):
+        all_data = all_results["data"][jurisdiction]
+        first_data = first_page["data"][jurisdiction]
+        second_data = second_page["data"][jurisdiction]
+        assert first_data["count"] == second_data["count"] == all_data["count"]
+        assert first_data["results"] == all_data["results"][:1]
+        assert second_data["results"] == all_data["results"][1:2]
+
+
 def test_search_get_record_categories_all(
     search_test_setup: SearchTestSetup,
 ):
@@ -342,6 +376,7 @@ def test_search_follow(search_test_setup: SearchTestSetup):
         "data": [],
         "metadata": {"count": 0},
         "message": "Followed searches found.",
+        "next_after": None,
     }
 
     # User should check current follows and find none
@@ -365,7 +400,7 @@ def test_search_follow(search_test_setup: SearchTestSetup):
         tdc.request_validator.follow_search(
             headers=tus_1.jwt_authorization_header,
             expected_json_content={"message": message},
-            **location_to_follow
+            **location_to_follow,
         )
 
     follow_extant_location()
@@ -387,6 +422,7 @@ def test_search_follow(search_test_setup: SearchTestSetup):
                 }
             ],
             "message": "Followed searches found.",
+            "next_after": None,
         },
     )
 
@@ -1,5 +1,6 @@
 from middleware.primary_resource_logic.unique_url_checker import (
     UniqueURLCheckerResponseOuterSchema,
+    UniqueURLCheckerBatchResponseOuterSchema,
 )
 from tests.helper_scripts.complex_test_data_creation_functions import (
     create_data_source_entry_for_url_duplicate_checking,
@@ -55,3 +56,38 @@ def test_unique_url_checker(test_data_creator_flask: TestDataCreatorFlask):
             expected_schema=UniqueURLCheckerResponseOuterSchema,
             headers=header,
         )
+
+
+def test_unique_url_checker_batch(test_data_creator_flask: TestDataCreatorFlask):
+    tdc = test_data_creator_flask
+    create_data_source_entry_for_url_duplicate_checking(tdc.db_client)
+
+    duplicate = {
+        "original_url": "https://duplicate-checker.com/",
+        "approval_status": "rejected",
+        "rejection_note": "Test rejection note",
+    }
+    run_and_validate_request(
+        flask_client=tdc.flask_client,
+        http_method="post",
+        endpoint="check/unique-url/batch",
+        json={
+            "urls": [
+                "http://duplicate-checker.com/",
+                "https://not-a-duplicate.com",
+                "https://www.duplicate-checker.com",
+            ]
+        },
+        expected_json_content={
+            "results": [
+                {"url": "http://duplicate-checker.com/", "duplicates": [duplicate]},
+                {"url": "https://not-a-duplicate.com", "duplicates": []},
+                {
+                    "url": "https://www.duplicate-checker.com",
+                    "duplicates": [duplicate],
+                },
+            ]
+        },
+        expected_schema=UniqueURLCheckerBatchResponseOuterSchema,
+        headers=tdc.get_admin_tus().api_authorization_header,
+    )
@@ -7,6 +7,7 @@ from middleware.access_logic import (
     get_key_from_authorization_header,
     AccessInfoPrimary,
     check_permissions_with_access_info,
+    api_key_handler,
 )
 from middleware.enums import PermissionsEnum, AccessTypeEnum
 from tests.helper_scripts.DynamicMagicMock import DynamicMagicMock
@@ -90,3 +91,48 @@ def test_check_permissions_with_access_info(
         mock_permission_denied_abort.assert_called_once()
     else:
         mock_permission_denied_abort.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "user_permissions, restrict_to_permissions, permission_denied_abort_called",
+    (
+        (
+            [PermissionsEnum.SYSTEM_METRICS_READ],
+            [PermissionsEnum.SYSTEM_METRICS_READ],
+            False,
+        ),
+        ([], [PermissionsEnum.SYSTEM_METRICS_READ], True),
+        ([], None, False),
+    ),
+)
+def test_api_key_handler_restrict_to_permissions(
+    user_permissions,
+    restrict_to_permissions,
+    permission_denied_abort_called,
+    monkeypatch,
+):
+    mock_permission_denied_abort = MagicMock()
+    mock_get_user_permissions = MagicMock(return_value=user_permissions)
+    monkeypatch.setattr(
+        "middleware.access_logic.permission_denied_abort", mock_permission_denied_abort
+    )
+    monkeypatch.setattr(
+        "middleware.access_logic.get_user_email_from_api_key",
+        MagicMock(return_value="test_email"),
+    )
+    monkeypatch.setattr(
+        "middleware.access_logic.get_user_permissions", mock_get_user_permissions
+    )
+
+    access_info = api_key_handler(
+        token="api_key", restrict_to_permissions=restrict_to_permissions
+    )
+
+    assert access_info.user_email == "test_email"
+    assert access_info.access_type == AccessTypeEnum.API_KEY
+    if permission_denied_abort_called:
+        mock_permission_denied_abort.assert_called_once()
+    else:
+        mock_permission_denied_abort.assert_not_called()
+    if restrict_to_permissions is None:
+        mock_get_user_permissions.assert_not_called()
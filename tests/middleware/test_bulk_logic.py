@@ -0,0 +1,78 @@
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import HTTPException
+
+from middleware.primary_resource_logic.bulk_logic import (
+    BulkConfig,
+    BulkRowProcessor,
+    run_bulk,
+    run_bulk_agencies,
+)
+
+PATCH_ROOT = "middleware.primary_resource_logic.bulk_logic"
+
+AGENCY_CSV_HEADER = (
+    b"name,jurisdiction_type,agency_type,homepage_url,lat,lng,defunct_year,"
+    b"multi_agency,no_web_presence,submitter_contact,location_id\n"
+)
+AGENCY_CSV_ROW = b"Agency,federal,court,,1.0,2.0,,false,false,,\n"
+# Bytes which are not valid utf-8, so that the csv file cannot be read past them
+UNREADABLE_CSV_ROW = b"\xff\xfe\n"
+
+
+def create_bulk_config(csv: bytes) -> BulkConfig:
+    dto = MagicMock()
+    dto.file = FileStorage(stream=BytesIO(csv), filename="bulk.csv")
+    return BulkConfig(
+        dto=dto, handler=MagicMock(), brp_class=BulkRowProcessor, schema=MagicMock()
+    )
+
+
+@pytest.fixture
+def mock_row_loader():
+    with patch(f"{PATCH_ROOT}.get_flat_row_loader") as mock_get_flat_row_loader:
+        row_loader = mock_get_flat_row_loader.return_value
+        row_loader.load_dto.side_effect = lambda raw_row: raw_row
+        yield row_loader
+
+
+def test_run_bulk_reports_unreadable_rows_after_first_chunk(mock_row_loader):
+    csv = b"id,name\n1,a\n2,b\n3,c\n" + UNREADABLE_CSV_ROW + b"5,e\n"
+    bulk_config = create_bulk_config(csv)
+
+    brm = run_bulk(bulk_config, resource_name="data sources", chunk_size=2)
+
+    # Rows read before the error, including those of the unfinished chunk, are still written
+    assert bulk_config.handler.mass_execute.call_count == 2
+    assert brm.entry_ids == [1, 2, 3]
+    # The error is reported at the first row which was not read
+    assert list(brm.get_error_dict()) == [3]
+    assert "were not processed" in brm.get_error_dict()[3]
+
+
+def test_run_bulk_aborts_if_first_chunk_unreadable(mock_row_loader):
+    csv = b"id,name\n1,a\n" + UNREADABLE_CSV_ROW
+    bulk_config = create_bulk_config(csv)
+
+    with pytest.raises(HTTPException) as e:
+        run_bulk(bulk_config, resource_name="data sources", chunk_size=2)
+
+    assert e.value.code == 400
+    bulk_config.handler.mass_execute.assert_not_called()
+
+
+def test_run_bulk_agencies_reports_unreadable_rows_after_first_chunk():
+    csv = AGENCY_CSV_HEADER + AGENCY_CSV_ROW * 3 + UNREADABLE_CSV_ROW + AGENCY_CSV_ROW
+    bulk_config = create_bulk_config(csv)
+
+    with patch(f"{PATCH_ROOT}.DatabaseClient") as mock_db_client_class:
+        mock_db_client_class.return_value.create_agency.side_effect = [10, 11, 12]
+        responses = run_bulk_agencies(bulk_config, chunk_size=2)
+
+    assert [response.entry_id for response in responses[:3]] == [10, 11, 12]
+    assert responses[3].request_id == 3
+    assert "were not processed" in responses[3].error_message
+    assert len(responses) == 4
@@ -0,0 +1,39 @@
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+
+import pytest
+from werkzeug.exceptions import HTTPException
+
+from database_client.db_client_dataclasses import ChangeFeedCursor
+from middleware.primary_resource_logic.change_feed_logic import get_changes_wrapper
+from middleware.schema_and_dto_logic.primary_resource_schemas.change_feed_schemas import (
+    ChangesGetRequestDTO,
+)
+
+
+def test_get_changes_wrapper_expired_cursor():
+    mock_db_client = MagicMock()
+    mock_db_client.is_change_feed_cursor_retained.return_value = False
+
+    with pytest.raises(HTTPException) as e:
+        get_changes_wrapper(mock_db_client, ChangesGetRequestDTO(since="10-2"))
+
+    assert e.value.code == HTTPStatus.GONE
+    mock_db_client.is_change_feed_cursor_retained.assert_called_once_with(
+        ChangeFeedCursor(transaction_id=10, id=2)
+    )
+    mock_db_client.get_changes.assert_not_called()
+
+
+def test_get_changes_wrapper_without_cursor():
+    # Requests without a cursor start from the oldest retained change
+    mock_db_client = MagicMock()
+    mock_db_client.get_changes.return_value = []
+
+    with patch(
+        "middleware.primary_resource_logic.change_feed_logic.FlaskResponseManager.make_response"
+    ):
+        get_changes_wrapper(mock_db_client, ChangesGetRequestDTO())
+
+    mock_db_client.is_change_feed_cursor_retained.assert_not_called()
+    mock_db_client.get_changes.assert_called_once()
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock
+
+from database_client.database_client import DatabaseClient
+from middleware.miscellaneous_logic.table_count_logic import TableCountReferenceManager
+from middleware.scheduled_tasks.check_database_health import (
+    check_table_counts_and_alert_if_exceeded,
+    TABLES_TO_CHECK,
+)
+
+PATCH_ROOT = "middleware.scheduled_tasks.check_database_health"
+
+
+def build_mock_db_client(
+    prev_counts: dict[str, int], estimated_counts: dict[str, int]
+) -> MagicMock:
+    mock_db_client = MagicMock()
+    tcrm = TableCountReferenceManager()
+    for table, count in prev_counts.items():
+        tcrm.add_table_count(table, count)
+    mock_db_client.get_most_recent_logged_table_counts.return_value = tcrm
+    mock_db_client.get_table_count_estimates.return_value = {
+        table: DatabaseClient.TableCountEstimate(
+            table_name=table,
+            estimated_count=count,
+            rows_inserted=count,
+            rows_deleted=0,
+        )
+        for table, count in estimated_counts.items()
+    }
+    mock_db_client.get_table_count.return_value = 1000
+    return mock_db_client
+
+
+def test_check_table_counts_estimates_within_threshold(monkeypatch):
+    mock_send_alert = MagicMock()
+    monkeypatch.setattr(f"{PATCH_ROOT}.send_alert", mock_send_alert)
+    counts = {table: 100 for table in TABLES_TO_CHECK}
+    mock_db_client = build_mock_db_client(
+        prev_counts=counts, estimated_counts={table: 101 for table in TABLES_TO_CHECK}
+    )
+
+    tcrm = check_table_counts_and_alert_if_exceeded(mock_db_client, use_estimates=True)
+
+    mock_db_client.get_table_count_estimates.assert_called_once_with(TABLES_TO_CHECK)
+    mock_db_client.get_table_count.assert_not_called()
+    mock_send_alert.assert_not_called()
+    for table in TABLES_TO_CHECK:
+        assert tcrm.get_table_count(table) == 101
+
+
+def test_check_table_counts_estimates_exceed_threshold(monkeypatch):
+    mock_send_alert = MagicMock()
+    monkeypatch.setattr(f"{PATCH_ROOT}.send_alert", mock_send_alert)
+    counts = {table: 100 for table in TABLES_TO_CHECK}
+    estimated_counts = counts.copy()
+    estimated_counts["agencies"] = 900
+    mock_db_client = build_mock_db_client(
+        prev_counts=counts, estimated_counts=estimated_counts
+    )
+
+    tcrm = check_table_counts_and_alert_if_exceeded(mock_db_client, use_estimates=True)
+
+    # Only the table whose estimate exceeded the threshold is counted exactly
+    mock_db_client.get_table_count.assert_called_once_with("agencies")
+    mock_send_alert.assert_called_once_with(
+        "Sudden change in agencies table: 100 -> 1000"
+    )
+    assert tcrm.get_table_count("agencies") == 1000
+
+
+def test_check_table_counts_estimates_no_previous_count(monkeypatch):
+    mock_send_alert = MagicMock()
+    monkeypatch.setattr(f"{PATCH_ROOT}.send_alert", mock_send_alert)
+    mock_db_client = build_mock_db_client(
+        prev_counts={}, estimated_counts={table: 100 for table in TABLES_TO_CHECK}
+    )
+
+    tcrm = check_table_counts_and_alert_if_exceeded(mock_db_client, use_estimates=True)
+
+    # Without a previous count, an exact count establishes the baseline
+    assert mock_db_client.get_table_count.call_count == len(TABLES_TO_CHECK)
+    mock_send_alert.assert_not_called()
+    assert len(tcrm.get_modified_table_references()) == len(TABLES_TO_CHECK)
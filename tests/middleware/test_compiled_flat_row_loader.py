@@ -0,0 +1,89 @@
+import pytest
+from marshmallow import ValidationError
+
+from middleware.schema_and_dto_logic.dynamic_logic.compiled_flat_row_loader import (
+    get_flat_row_loader,
+)
+from middleware.schema_and_dto_logic.dynamic_logic.dynamic_csv_to_schema_conversion_logic import (
+    SchemaUnflattener,
+)
+from middleware.schema_and_dto_logic.dynamic_logic.dynamic_schema_request_content_population import (
+    setup_dto_class,
+)
+from middleware.schema_and_dto_logic.primary_resource_dtos.data_sources_dtos import (
+    DataSourcesPostDTO,
+)
+from middleware.schema_and_dto_logic.primary_resource_schemas.bulk_schemas import (
+    DataSourcesPostBatchRequestSchema,
+)
+
+VALID_ROW = {
+    "name": "Test Data Source",
+    "description": None,
+    "source_url": "https://example.com",
+    "agency_supplied": "true",
+    "agency_originated": "0",
+    "agency_aggregation": "county",
+    "coverage_start": "2020-01-01",
+    "coverage_end": None,
+    "detail_level": "Individual record",
+    "access_types": ["Webpage", "API"],
+    "record_formats": ["CSV", "PDF"],
+    "update_method": "Insert",
+    "record_type_name": "Arrest Records",
+    "linked_agency_ids": ["1", "2"],
+}
+
+
+def load_generically(schema, raw_row: dict):
+    unflattener = SchemaUnflattener(flat_schema_class=type(schema))
+    return setup_dto_class(
+        data=unflattener.unflatten(flat_data=schema.load(raw_row)),
+        dto_class=DataSourcesPostDTO,
+        nested_dto_info_list=unflattener.nested_dto_info_list,
+    )
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {},
+        {"name": None},
+        {"agency_supplied": "maybe", "coverage_start": "not a date"},
+        {"agency_aggregation": "planetary", "update_method": None},
+        {"access_types": ["Webpage", "Carrier pigeon"]},
+        {"linked_agency_ids": "1"},
+        {"linked_agency_ids": ["1", "two"]},
+        {"record_type_name": "Arrest Records", "file": "extra.csv"},
+    ],
+)
+def test_flat_row_loader_matches_schema_load(changes: dict):
+    schema = DataSourcesPostBatchRequestSchema(exclude=["file"])
+    loader = get_flat_row_loader(schema=schema, inner_dto_class=DataSourcesPostDTO)
+    assert loader.is_compiled
+    raw_row = {**VALID_ROW, **changes}
+
+    try:
+        expected = load_generically(schema, dict(raw_row))
+    except ValidationError as e:
+        with pytest.raises(ValidationError) as exc_info:
+            loader.load_dto(dict(raw_row))
+        assert str(exc_info.value) == str(e)
+        return
+
+    assert loader.load_dto(dict(raw_row)) == expected
+
+
+def test_get_flat_row_loader_is_cached_per_schema_options():
+    loader = get_flat_row_loader(
+        schema=DataSourcesPostBatchRequestSchema(exclude=["file"]),
+        inner_dto_class=DataSourcesPostDTO,
+    )
+    assert loader is get_flat_row_loader(
+        schema=DataSourcesPostBatchRequestSchema(exclude=["file"]),
+        inner_dto_class=DataSourcesPostDTO,
+    )
+    assert loader is not get_flat_row_loader(
+        schema=DataSourcesPostBatchRequestSchema(),
+        inner_dto_class=DataSourcesPostDTO,
+    )
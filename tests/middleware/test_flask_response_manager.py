@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from marshmallow import Schema, fields
+
+from middleware.enums import ResponseValidationMode
+from middleware.flask_response_manager import (
+    FlaskResponseManager,
+    ResponseValidationPolicy,
+)
+
+PATCH_ROOT = "middleware.flask_response_manager"
+
+
+class SampleSchema(Schema):
+    id = fields.Integer(required=True)
+
+
+@pytest.fixture
+def mock_make_response(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(f"{PATCH_ROOT}.make_response", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_abort(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(f"{PATCH_ROOT}.abort", mock)
+    return mock
+
+
+@pytest.mark.parametrize(
+    "mode, sample_rate, expected",
+    [
+        (ResponseValidationMode.ALWAYS, 0, True),
+        (ResponseValidationMode.SAMPLED, 100, True),
+        (ResponseValidationMode.SAMPLED, 0, False),
+        (ResponseValidationMode.DEV_ONLY, 100, False),
+    ],
+)
+def test_should_validate(mode, sample_rate, expected):
+    policy = ResponseValidationPolicy(mode=mode, sample_rate=sample_rate)
+    assert policy.should_validate() == expected
+
+
+def test_should_validate_in_testing():
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    policy = ResponseValidationPolicy(mode=ResponseValidationMode.DEV_ONLY)
+    with app.app_context():
+        assert policy.should_validate()
+
+
+def test_make_response_logs_violation_without_aborting(
+    monkeypatch, mock_make_response, mock_abort
+):
+    monkeypatch.setattr(
+        FlaskResponseManager,
+        "validation_policy",
+        ResponseValidationPolicy(mode=ResponseValidationMode.ALWAYS),
+    )
+    previous_violations = FlaskResponseManager.violation_counts["SampleSchema"]
+
+    FlaskResponseManager.make_response({"id": "not an id"}, 200, SampleSchema)
+    FlaskResponseManager.make_response({"id": 1}, 200, SampleSchema)
+
+    mock_abort.assert_not_called()
+    assert mock_make_response.call_count == 2
+    assert (
+        FlaskResponseManager.violation_counts["SampleSchema"] == previous_violations + 1
+    )
+    assert FlaskResponseManager.get_schema_instance(
+        SampleSchema
+    ) is FlaskResponseManager.get_schema_instance(SampleSchema)
+
+
+def test_make_response_skips_validation_when_not_sampled(
+    monkeypatch, mock_make_response
+):
+    monkeypatch.setattr(
+        FlaskResponseManager,
+        "validation_policy",
+        ResponseValidationPolicy(mode=ResponseValidationMode.DEV_ONLY),
+    )
+    mock_validate = MagicMock()
+    monkeypatch.setattr(
+        FlaskResponseManager, "validate_data_with_schema", mock_validate
+    )
+
+    FlaskResponseManager.make_response({"id": 1}, 200, SampleSchema)
+
+    mock_validate.assert_not_called()
+    mock_make_response.assert_called_once_with({"id": 1}, 200)
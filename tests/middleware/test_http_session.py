@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from middleware.third_party_interaction_logic.http_session import (
+    create_http_session,
+    get_default_retry,
+    JitteredRetry,
+    OutboundRequestMetrics,
+)
+from tests.helper_scripts.helper_classes.StubHTTPServer import (
+    StubHTTPServer,
+    StubResponse,
+)
+
+
+@pytest.fixture
+def stub_server():
+    with StubHTTPServer() as server:
+        yield server
+
+
+@pytest.fixture
+def metrics():
+    return OutboundRequestMetrics()
+
+
+def create_test_session(metrics: OutboundRequestMetrics, **kwargs):
+    retry = get_default_retry()
+    # Retry immediately
+    retry.backoff_factor = 0
+    return create_http_session(metrics=metrics, retry=retry, **kwargs)
+
+
+@pytest.mark.parametrize("tls", [False, True])
+def test_http_session_reuses_connection(metrics, tls: bool):
+    session = create_test_session(metrics)
+
+    with StubHTTPServer(tls=tls) as server:
+        for _ in range(5):
+            response = session.post(
+                server.url, json={"key": "value"}, verify=server.cert_path or True
+            )
+            assert response.status_code == 200
+
+    assert len(server.requests) == 5
+    assert server.connection_count == 1
+    assert len({request.client_port for request in server.requests}) == 1
+
+
+def test_http_session_retries_unavailable_get(stub_server, metrics):
+    session = create_test_session(metrics)
+    stub_server.queue_responses(StubResponse(status=503), StubResponse(status=502))
+
+    response = session.get(stub_server.url)
+
+    assert response.status_code == 200
+    assert len(stub_server.requests) == 3
+
+
+def test_http_session_does_not_retry_unavailable_post(stub_server, metrics):
+    session = create_test_session(metrics)
+    stub_server.queue_responses(StubResponse(status=503))
+
+    response = session.post(stub_server.url, data="data")
+
+    assert response.status_code == 503
+    assert len(stub_server.requests) == 1
+
+
+def test_http_session_returns_response_once_retries_exhausted(stub_server, metrics):
+    session = create_test_session(metrics)
+    stub_server.queue_responses(*[StubResponse(status=503)] * 3)
+
+    response = session.get(stub_server.url)
+
+    assert response.status_code == 503
+    assert len(stub_server.requests) == 3
+
+
+def test_http_session_default_timeout(stub_server, metrics):
+    session = create_test_session(metrics, timeout=0.1)
+    stub_server.queue_responses(StubResponse(delay_seconds=0.5))
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        session.get(stub_server.url)
+
+    # Timed out reads are not retried
+    assert len(stub_server.requests) == 1
+
+
+def test_http_session_records_latency_per_host(stub_server, metrics):
+    session = create_test_session(metrics, timeout=0.1)
+    stub_server.queue_responses(
+        StubResponse(status=500), StubResponse(), StubResponse(delay_seconds=0.5)
+    )
+
+    session.post(stub_server.url)
+    session.post(stub_server.url)
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        session.post(stub_server.url)
+
+    latency = metrics.get_host_latencies()[stub_server.host]
+    assert latency.request_count == 3
+    assert latency.error_count == 2
+    assert latency.max_seconds >= 0.1
+    assert 0 < latency.mean_seconds <= latency.max_seconds
+
+
+def test_jittered_retry_backoff():
+    retry = JitteredRetry(total=3, backoff_factor=1)
+    retry = retry.increment(method="GET", url="/").increment(method="GET", url="/")
+
+    with patch(
+        "middleware.third_party_interaction_logic.http_session.random.uniform",
+        return_value=0.5,
+    ) as mock_uniform:
+        assert retry.get_backoff_time() == 0.5
+
+    mock_uniform.assert_called_once_with(0, 2)
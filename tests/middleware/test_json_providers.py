@@ -0,0 +1,68 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from middleware.json_providers import (
+    JSON_PROVIDERS,
+    OrjsonProvider,
+    UpdatedJSONProvider,
+    get_json_provider,
+)
+
+
+class SampleEnum(Enum):
+    SAMPLE = "sample"
+
+
+class SampleModel(BaseModel):
+    name: str
+    created: date
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+@pytest.mark.parametrize("provider_name", JSON_PROVIDERS.keys())
+def test_json_provider_serializes_additional_types(app, provider_name):
+    provider = JSON_PROVIDERS[provider_name](app)
+    data = {
+        "date": date(2025, 1, 2),
+        "datetime": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "enum": SampleEnum.SAMPLE,
+        "decimal": Decimal("1.50"),
+        "model": SampleModel(name="test", created=date(2025, 1, 2)),
+    }
+
+    assert provider.loads(provider.dumps(data)) == {
+        "date": "2025-01-02",
+        "datetime": "2025-01-02T03:04:05+00:00",
+        "enum": "sample",
+        "decimal": "1.50",
+        "model": {"name": "test", "created": "2025-01-02"},
+    }
+
+
+def test_orjson_provider_response(app):
+    with app.app_context():
+        response = OrjsonProvider(app).response({"b": 1, "a": 2})
+
+    assert response.mimetype == "application/json"
+    assert response.get_data() == b'{"a":2,"b":1}\n'
+
+
+def test_get_json_provider(app, monkeypatch):
+    monkeypatch.setenv("JSON_PROVIDER", "default")
+    assert isinstance(get_json_provider(app), UpdatedJSONProvider)
+
+    monkeypatch.setenv("JSON_PROVIDER", "orjson")
+    assert isinstance(get_json_provider(app), OrjsonProvider)
+
+    monkeypatch.setenv("JSON_PROVIDER", "unknown")
+    with pytest.raises(ValueError):
+        get_json_provider(app)
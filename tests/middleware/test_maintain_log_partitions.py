@@ -0,0 +1,34 @@
+from unittest.mock import MagicMock, call
+
+from middleware.enums import Relations
+from middleware.scheduled_tasks.maintain_log_partitions import (
+    maintain_log_partitions_inner,
+)
+
+
+def test_maintain_log_partitions_inner():
+    mock_db_client = MagicMock()
+    mock_db_client.drop_expired_partitions.side_effect = [
+        ["change_log_p2024_01", "change_log_p2024_02"],
+        [],
+    ]
+
+    dropped_partitions = maintain_log_partitions_inner(
+        mock_db_client,
+        retention_months={Relations.CHANGE_LOG: 12, Relations.CHANGE_FEED: 3},
+        months_ahead=2,
+    )
+
+    assert dropped_partitions == ["change_log_p2024_01", "change_log_p2024_02"]
+    mock_db_client.create_monthly_partitions.assert_has_calls(
+        [
+            call(table=Relations.CHANGE_LOG, months_ahead=2),
+            call(table=Relations.CHANGE_FEED, months_ahead=2),
+        ]
+    )
+    mock_db_client.drop_expired_partitions.assert_has_calls(
+        [
+            call(table=Relations.CHANGE_LOG, retention_months=12),
+            call(table=Relations.CHANGE_FEED, retention_months=3),
+        ]
+    )
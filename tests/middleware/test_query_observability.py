@@ -0,0 +1,138 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from psycopg import sql
+
+from database_client.dynamic_query_constructor import DynamicQueryConstructor
+from middleware.prometheus_metrics import PrometheusTextWriter
+from middleware.query_observability import (
+    FINGERPRINT_EXECUTION_OPTION,
+    QueryObservabilityPolicy,
+    QueryObserver,
+    capture_slow_query,
+    fingerprint_query,
+    get_query_fingerprint,
+)
+
+PATCH_ROOT = "middleware.query_observability"
+
+
+@pytest.fixture
+def observer():
+    return QueryObserver(
+        policy=QueryObservabilityPolicy(
+            slow_query_threshold_ms=100, explain_interval_seconds=60
+        )
+    )
+
+
+def test_fingerprint_query_psycopg():
+    query = DynamicQueryConstructor.create_search_query(location_id=1)
+
+    assert get_query_fingerprint(query) == "DynamicQueryConstructor.create_search_query"
+
+
+def test_fingerprint_query_sqlalchemy():
+    query = DynamicQueryConstructor.create_linked_rows_query(
+        link_table="link_user_followed_location",
+        left_id=1,
+        left_link_column="user_id",
+        right_link_column="location_id",
+        linked_relation="locations_expanded",
+        linked_relation_linking_column="id",
+        columns=["id"],
+    )
+
+    assert (
+        query.get_execution_options()[FINGERPRINT_EXECUTION_OPTION]
+        == "DynamicQueryConstructor.create_linked_rows_query"
+    )
+
+
+def test_fingerprint_query_unsupported_type():
+    @fingerprint_query
+    def build_query():
+        return "SELECT 1"
+
+    with pytest.raises(TypeError):
+        build_query()
+
+
+def test_query_observer_rate_limits_plan_captures(observer):
+    with patch(f"{PATCH_ROOT}.time.monotonic", return_value=1000):
+        assert not observer.record("fast", duration_seconds=0.01, row_count=5)
+        assert observer.record("slow", duration_seconds=0.2, row_count=5)
+        # Plans are captured at most once per interval
+        assert not observer.record("slow", duration_seconds=0.2, row_count=5)
+    with patch(f"{PATCH_ROOT}.time.monotonic", return_value=1060):
+        assert observer.record("slow", duration_seconds=0.2, row_count=-1)
+
+    statistics = observer.statistics["slow"]
+    assert statistics.duration.count == 3
+    assert statistics.slow_count == 3
+    # Negative row counts, given when unknown, are not counted
+    assert statistics.row_count == 10
+    assert observer.statistics["fast"].slow_count == 0
+
+
+def test_query_observer_write_prometheus(observer):
+    observer.record("slow", duration_seconds=0.2, row_count=3)
+    writer = PrometheusTextWriter()
+
+    observer.write_prometheus(writer)
+
+    metrics = writer.render()
+    assert 'db_query_duration_seconds_count{fingerprint="slow"} 1' in metrics
+    assert 'db_query_rows_total{fingerprint="slow"} 3' in metrics
+    assert 'db_slow_queries_total{fingerprint="slow"} 1' in metrics
+
+
+def test_capture_slow_query():
+    connection = MagicMock()
+    query = sql.SQL("SELECT {value}").format(value=sql.Literal(1))
+    query.as_string = MagicMock(return_value="SELECT 1")
+    plan = [{"Plan": {}, "Execution Time": 1.0}]
+
+    with patch(f"{PATCH_ROOT}.psycopg.Cursor") as mock_cursor_class:
+        cursor = mock_cursor_class.return_value
+        cursor.fetchone.return_value = (plan,)
+        capture_slow_query(
+            connection=connection,
+            fingerprint="fingerprint",
+            query=query,
+            params=None,
+            duration_seconds=0.5,
+            row_count=1,
+        )
+
+    connection.transaction.assert_called_once()
+    explain_call, insert_call = cursor.execute.call_args_list
+    assert explain_call.args[0] == (
+        sql.SQL("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ") + query
+    )
+    fingerprint, duration_ms, row_count, query_text, logged_plan = insert_call.args[1]
+    assert (fingerprint, duration_ms, row_count, query_text) == (
+        "fingerprint",
+        500,
+        1,
+        "SELECT 1",
+    )
+    assert logged_plan.obj == plan
+
+
+def test_capture_slow_query_skips_writes():
+    # Queries which may have side effects are not run again
+    connection = MagicMock()
+
+    with patch(f"{PATCH_ROOT}.psycopg.Cursor") as mock_cursor_class:
+        capture_slow_query(
+            connection=connection,
+            fingerprint="fingerprint",
+            query="UPDATE data_sources SET name = 'name'",
+            params=None,
+            duration_seconds=0.5,
+            row_count=1,
+        )
+
+    mock_cursor_class.assert_not_called()
+    connection.transaction.assert_not_called()
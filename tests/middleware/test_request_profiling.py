@@ -0,0 +1,173 @@
+import json
+import os
+import time
+
+import pytest
+from flask import Flask, make_response
+
+from middleware.enums import RequestPhase
+from middleware.prometheus_metrics import (
+    Histogram,
+    PrometheusTextWriter,
+    ProcessMetricsDirectory,
+)
+from middleware.request_profiling import (
+    RequestMetrics,
+    RequestProfilingHooks,
+    RequestProfilingPolicy,
+    profile_db_query,
+    profile_phase,
+    get_request_profile,
+)
+
+
+@pytest.fixture
+def metrics():
+    return RequestMetrics()
+
+
+def create_profiled_app(
+    metrics: RequestMetrics, policy: RequestProfilingPolicy = RequestProfilingPolicy()
+) -> Flask:
+    app = Flask(__name__)
+
+    @app.route("/items/<int:item_id>")
+    def get_item(item_id: int):
+        with profile_phase(RequestPhase.AUTHENTICATION):
+            pass
+        for _ in range(3):
+            with profile_db_query():
+                pass
+        return make_response({"id": item_id})
+
+    @app.route("/slow")
+    def slow():
+        time.sleep(0.02)
+        return make_response({})
+
+    RequestProfilingHooks(policy=policy, metrics=metrics).init_app(app)
+    return app
+
+
+def test_histogram_buckets():
+    histogram = Histogram(buckets=(1, 5))
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.get_cumulative_counts() == [("1", 2), ("5", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+    assert histogram.sum == 14.5
+
+
+def test_prometheus_text_writer():
+    writer = PrometheusTextWriter()
+    histogram = Histogram(buckets=(1,))
+    histogram.observe(0.5)
+    writer.add_counter("requests_total", "Requests.", [({"path": 'a"b'}, 2)])
+    writer.add_histogram("duration_seconds", "Durations.", [({}, histogram)])
+
+    assert writer.render() == (
+        "# HELP requests_total Requests.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{path="a\\"b"} 2\n'
+        "# HELP duration_seconds Durations.\n"
+        "# TYPE duration_seconds histogram\n"
+        'duration_seconds_bucket{le="1"} 1\n'
+        'duration_seconds_bucket{le="+Inf"} 1\n'
+        "duration_seconds_sum 0.5\n"
+        "duration_seconds_count 1\n"
+    )
+
+
+def create_process_writer(request_count: int, path: str) -> PrometheusTextWriter:
+    writer = PrometheusTextWriter()
+    writer.add_counter("requests_total", "Requests.", [({"path": path}, request_count)])
+    return writer
+
+
+def test_prometheus_text_writer_merge():
+    writer = create_process_writer(request_count=2, path="a")
+    writer.merge(create_process_writer(request_count=3, path="a"))
+    writer.merge(create_process_writer(request_count=1, path="b"))
+
+    assert writer.render() == (
+        "# HELP requests_total Requests.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{path="a"} 5\n'
+        'requests_total{path="b"} 1\n'
+    )
+
+
+def test_process_metrics_directory(tmp_path):
+    directory = ProcessMetricsDirectory(str(tmp_path / "metrics"))
+    assert directory.read().render() == "\n"
+
+    directory.write(create_process_writer(request_count=1, path="a"))
+    # Writing again replaces the metrics of the same process
+    directory.write(create_process_writer(request_count=2, path="a"))
+    # Metrics of other processes, including exited ones, are summed
+    (tmp_path / "metrics" / "metrics_1.json").write_text(
+        json.dumps(create_process_writer(request_count=3, path="a").to_dict())
+    )
+    (tmp_path / "metrics" / "metrics_2.json").write_text("not json")
+
+    assert 'requests_total{path="a"} 5\n' in directory.read().render()
+
+    directory.clear()
+    assert directory.read().render() == "\n"
+
+
+def test_request_profiling_records_endpoint_metrics(metrics):
+    app = create_profiled_app(metrics)
+    with app.test_client() as client:
+        for item_id in (1, 2):
+            assert client.get(f"/items/{item_id}").status_code == 200
+        assert client.get("/missing").status_code == 404
+
+    # Requests are grouped by route, not path
+    assert metrics.latency[("GET", "/items/<int:item_id>", 200)].count == 2
+    assert metrics.latency[("GET", "<unmatched>", 404)].count == 1
+    db_query_counts = metrics.db_query_counts[("GET", "/items/<int:item_id>")]
+    assert db_query_counts.sum == 6
+    phases = {
+        key[2]
+        for key in metrics.phase_seconds
+        if key[:2] == ("GET", "/items/<int:item_id>")
+    }
+    assert phases == {
+        RequestPhase.AUTHENTICATION.value,
+        RequestPhase.SERIALIZATION.value,
+    }
+    assert metrics.slow_request_counts == {}
+    # The profile is cleared once the request is finished
+    assert get_request_profile() is None
+
+
+def test_request_profiling_writes_profile_of_slow_request(metrics, tmp_path):
+    policy = RequestProfilingPolicy(
+        slow_request_threshold_ms=10,
+        profiler_name="cprofile",
+        profile_sample_rate=100,
+        profile_directory=str(tmp_path),
+    )
+    app = create_profiled_app(metrics, policy=policy)
+    with app.test_client() as client:
+        client.get("/slow")
+        client.get("/items/1")
+
+    assert metrics.slow_request_counts == {("GET", "/slow"): 1}
+    profile_files = os.listdir(tmp_path)
+    assert len(profile_files) == 1
+    assert profile_files[0].endswith("_GET_slow.prof")
+
+
+def test_request_profiling_policy_unknown_profiler():
+    with pytest.raises(ValueError):
+        RequestProfilingPolicy(profiler_name="unknown")
+
+
+def test_profile_db_query_outside_request():
+    # Queries made outside of a request, such as by scheduled tasks, are not counted
+    with profile_db_query():
+        pass
+    assert get_request_profile() is None
@@ -16,24 +16,48 @@ class SearchWrapperMocks(DynamicMagicMock):
 def test_format_search_results():
     search_results = [
         {
-            "name": "test federal",
-            "jurisdiction_type": "federal",
+            "jurisdiction": "federal",
+            "count": 1,
+            "results": [
+                {
+                    "name": "test federal",
+                    "jurisdiction_type": "federal",
+                }
+            ],
         },
         {
-            "name": "test state",
-            "jurisdiction_type": "state",
+            "jurisdiction": "state",
+            "count": 1,
+            "results": [
+                {
+                    "name": "test state",
+                    "jurisdiction_type": "state",
+                }
+            ],
         },
         {
-            "name": "test county",
-            "jurisdiction_type": "county",
+            "jurisdiction": "county",
+            "count": 1,
+            "results": [
+                {
+                    "name": "test county",
+                    "jurisdiction_type": "county",
+                }
+            ],
         },
         {
-            "name": "test locality",
-            "jurisdiction_type": "locality",
-        },
-        {
-            "name": "another test locality",
-            "jurisdiction_type": "locality",
+            "jurisdiction": "locality",
+            "count": 2,
+            "results": [
+                {
+                    "name": "test locality",
+                    "jurisdiction_type": "locality",
+                },
+                {
+                    "name": "another test locality",
+                    "jurisdiction_type": "locality",
+                },
+            ],
         },
     ]
 
@@ -84,3 +108,27 @@ def test_format_search_results():
     }
 
     assert format_search_results(search_results) == expected_formatted_search_results
+
+
+def test_format_search_results_with_missing_jurisdictions():
+    search_results = [
+        {
+            "jurisdiction": "state",
+            "count": 3,
+            # Only a page of the results is returned, but the count includes all of them
+            "results": [{"name": "test state", "jurisdiction_type": "state"}],
+        },
+    ]
+
+    assert format_search_results(search_results) == {
+        "count": 3,
+        "data": {
+            "federal": {"count": 0, "results": []},
+            "state": {
+                "count": 3,
+                "results": [{"name": "test state", "jurisdiction_type": "state"}],
+            },
+            "county": {"count": 0, "results": []},
+            "locality": {"count": 0, "results": []},
+        },
+    }
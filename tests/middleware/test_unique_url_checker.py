@@ -15,3 +15,16 @@ def test_normalize_url(url):
     expected_url = "duplicate-checker.com"
 
     assert normalize_url(url) == expected_url
+
+
+@pytest.mark.parametrize(
+    "url, expected_url",
+    (
+        ("https://www.example.com/path/", "example.com/path"),
+        ("example.com//", "example.com"),
+        ("ftp://www.example.com", "ftp://www.example.com"),
+        ("https://wwwexample.com", "wwwexample.com"),
+    ),
+)
+def test_normalize_url_edge_cases(url, expected_url):
+    assert normalize_url(url) == expected_url
@@ -1,7 +1,12 @@
 import os
 import pytest
 from unittest.mock import patch, MagicMock
-from middleware.util import get_env_variable
+from middleware.util import (
+    get_env_variable,
+    chunked,
+    iter_csv_rows,
+    get_optional_env_int,
+)
 from tests.helper_scripts.DynamicMagicMock import DynamicMagicMock
 
 
@@ -46,3 +51,24 @@ def test_get_env_variable(
         assert get_env_variable(variable_name) == expected_result
 
     mock.stop_patches()
+
+
+def test_get_optional_env_int(monkeypatch):
+    monkeypatch.setenv("TEST_OPTIONAL_INT", "8")
+    assert get_optional_env_int("TEST_OPTIONAL_INT", default=2) == 8
+    monkeypatch.delenv("TEST_OPTIONAL_INT")
+    assert get_optional_env_int("TEST_OPTIONAL_INT", default=2) == 2
+    monkeypatch.setenv("TEST_OPTIONAL_INT", "eight")
+    with pytest.raises(ValueError):
+        get_optional_env_int("TEST_OPTIONAL_INT", default=2)
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+
+def test_iter_csv_rows_is_lazy():
+    rows = iter_csv_rows(b"name,url\na,https://a.com\nb,https://b.com\n")
+    assert next(rows) == {"name": "a", "url": "https://a.com"}
+    assert list(rows) == [{"name": "b", "url": "https://b.com"}]
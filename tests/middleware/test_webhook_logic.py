@@ -13,8 +13,8 @@ def mock_env_variable():
 
 @pytest.fixture
 def mock_requests_post():
-    with patch("middleware.webhook_logic.requests.post") as mock_post:
-        yield mock_post
+    with patch("middleware.webhook_logic.get_http_session") as mock_get_http_session:
+        yield mock_get_http_session.return_value.post
 
 
 def assert_mock_env_calls(mock_env_variable, secondary_call: str):
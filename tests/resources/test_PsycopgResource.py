@@ -0,0 +1,24 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from resources.PsycopgResource import PsycopgResource, handle_exceptions
+
+
+class FailingResource(PsycopgResource):
+    @handle_exceptions
+    def get(self):
+        raise ValueError("error")
+
+
+def test_handle_exceptions_rolls_back_thread_connection():
+    # The connection rolled back is the calling thread's, which the request's database client used
+    resource = FailingResource(api=MagicMock())
+
+    with patch(
+        "resources.PsycopgResource.initialize_psycopg_connection"
+    ) as mock_initialize_psycopg_connection:
+        with pytest.raises(ValueError):
+            resource.get()
+
+    mock_initialize_psycopg_connection.return_value.rollback.assert_called_once()
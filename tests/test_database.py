@@ -767,11 +767,13 @@ def test_recent_searches_row_limit_maintained(
     location_id = tdc.locality()
 
     # Add a search for each user
-    def create_search_record(user_id: int):
+    def create_search_record(
+        user_id: int, record_category: RecordCategories = RecordCategories.ALL
+    ):
         tdc.db_client.create_search_record(
             user_id=user_id,
             location_id=location_id,
-            record_categories=[RecordCategories.ALL],
+            record_categories=[record_category],
         )
 
     create_search_record(user_1.id)
@@ -801,8 +803,8 @@ def test_recent_searches_row_limit_maintained(
     add_49_rows(user_1.id)
     add_49_rows(user_2.id)
 
-    # Add one more search to user 1
-    create_search_record(user_1.id)
+    # Add one more distinct search to user 1
+    create_search_record(user_1.id, record_category=RecordCategories.POLICE)
 
     # Get recent searches for both users
     def get_recent_searches(user_id: int) -> list[int]:
@@ -827,6 +829,49 @@ def test_recent_searches_row_limit_maintained(
     assert user_2_search_record_id in user_2_recent_searches
 
 
+def test_recent_searches_repeated_search_updated(
+    test_data_creator_db_client: TestDataCreatorDBClient,
+):
+    tdc = test_data_creator_db_client
+
+    user_id = tdc.user().id
+    location_id = tdc.locality()
+
+    def create_search_record(record_categories: list[RecordCategories]):
+        tdc.db_client.create_search_record(
+            user_id=user_id,
+            location_id=location_id,
+            record_categories=record_categories,
+        )
+
+    def get_recent_searches() -> list[dict]:
+        return tdc.db_client._select_from_relation(
+            relation_name=Relations.RECENT_SEARCHES.value,
+            columns=["id", "last_searched_at"],
+            where_mappings={"user_id": user_id},
+        )
+
+    create_search_record([RecordCategories.AGENCIES, RecordCategories.JAIL])
+    create_search_record([RecordCategories.POLICE])
+    [first_search, _] = sorted(get_recent_searches(), key=lambda rs: rs["id"])
+
+    # Repeating a search, with record categories in any order, updates the existing search
+    create_search_record([RecordCategories.JAIL, RecordCategories.AGENCIES])
+    recent_searches = get_recent_searches()
+    assert len(recent_searches) == 2
+    repeated_search = next(
+        rs for rs in recent_searches if rs["id"] == first_search["id"]
+    )
+    assert repeated_search["last_searched_at"] > first_search["last_searched_at"]
+
+    # The repeated search is returned first, with its record categories unchanged
+    user_recent_searches = tdc.db_client.get_user_recent_searches(user_id=user_id)
+    assert len(user_recent_searches["data"]) == 2
+    assert sorted(user_recent_searches["data"][0]["record_categories"]) == sorted(
+        [RecordCategories.AGENCIES.value, RecordCategories.JAIL.value]
+    )
+
+
 def test_update_broken_source_url_as_of(
     test_data_creator_db_client: TestDataCreatorDBClient,
 ):
@@ -1117,3 +1162,84 @@ def test_agencies_table_logic(test_data_creator_db_client: TestDataCreatorDBClie
     assert log["affected_id"] == agency_info.id
     assert len(log["old_data"].keys()) == 17
     assert log["new_data"] is None
+
+
+def test_change_log_skips_unchanged_updates(
+    test_data_creator_db_client: TestDataCreatorDBClient,
+):
+    """
+    Test that updates which change no columns, other than those maintained by triggers,
+    are not logged
+    """
+    tdc = test_data_creator_db_client
+    db_client = tdc.db_client
+    agency_id = tdc.agency().id
+    data_source_id = tdc.data_source().id
+    delete_change_log(db_client)
+
+    db_client.execute_raw_sql(
+        "UPDATE agencies SET name = name WHERE id = %s", (agency_id,)
+    )
+    db_client.execute_raw_sql(
+        "UPDATE data_sources SET name = name WHERE id = %s", (data_source_id,)
+    )
+
+    assert db_client.get_change_logs_for_table(Relations.AGENCIES) == []
+    assert db_client.get_change_logs_for_table(Relations.DATA_SOURCES) == []
+
+    # Trigger-maintained timestamps are left out of the diffs of changed rows
+    new_description = get_test_name()
+    db_client._update_entry_in_table(
+        table_name=Relations.DATA_SOURCES.value,
+        entry_id=data_source_id,
+        column_edit_mappings={"description": new_description},
+    )
+    logs = db_client.get_change_logs_for_table(Relations.DATA_SOURCES)
+    assert len(logs) == 1
+    assert logs[0]["old_data"] == {"description": None}
+    assert logs[0]["new_data"] == {"description": new_description}
+
+
+def test_change_log_multi_row_statements(
+    test_data_creator_db_client: TestDataCreatorDBClient,
+):
+    """
+    Test that a statement updating or deleting several rows
+    logs one change for each row it changed
+    """
+    tdc = test_data_creator_db_client
+    db_client = tdc.db_client
+    homepage_url = f"https://{uuid.uuid4().hex}.com"
+    agency_ids = [tdc.agency().id for _ in range(3)]
+    # The last agency already has the homepage url, and so is not changed
+    unchanged_agency_id = tdc.agency(homepage_url=homepage_url).id
+    delete_change_log(db_client)
+
+    db_client.execute_raw_sql(
+        "UPDATE agencies SET homepage_url = %s WHERE id = ANY(%s)",
+        (homepage_url, agency_ids + [unchanged_agency_id]),
+    )
+
+    logs = db_client.get_change_logs_for_table(Relations.AGENCIES)
+    assert sorted(log["affected_id"] for log in logs) == sorted(agency_ids)
+    for log in logs:
+        assert log["operation_type"] == OperationType.UPDATE.value
+        assert log["old_data"] == {"homepage_url": None}
+        assert log["new_data"] == {"homepage_url": homepage_url}
+
+    delete_change_log(db_client)
+    db_client.execute_raw_sql(
+        "DELETE FROM agencies WHERE id = ANY(%s)",
+        (agency_ids + [unchanged_agency_id],),
+    )
+
+    logs = db_client.get_change_logs_for_table(Relations.AGENCIES)
+    assert sorted(log["affected_id"] for log in logs) == sorted(
+        agency_ids + [unchanged_agency_id]
+    )
+    for log in logs:
+        assert log["operation_type"] == OperationType.DELETE.value
+        # The entire deleted row is logged
+        assert log["old_data"]["id"] == log["affected_id"]
+        assert log["old_data"]["homepage_url"] == homepage_url
+        assert log["new_data"] is None
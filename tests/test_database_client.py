@@ -37,6 +37,7 @@ from database_client.models import (
     SQL_ALCHEMY_TABLE_REFERENCE,
 )
 from middleware.enums import PermissionsEnum, Relations, RecordTypes
+from middleware.query_observability import QueryObservabilityPolicy
 from tests.conftest import live_database_client, test_table_data, clear_data_requests
 from tests.helper_scripts.common_test_data import (
     get_random_number_for_testing,
@@ -428,6 +429,62 @@ def test_get_data_sources_for_map(
     assert results[0].location_id == location_id
 
 
+def test_slow_query_log(live_database_client: DatabaseClient, monkeypatch):
+    """
+    Test that fingerprinted queries exceeding the slow query threshold,
+    whether executed through psycopg or SQLAlchemy, have their plans logged
+    """
+    monkeypatch.setattr(
+        "middleware.query_observability.query_observer.policy",
+        QueryObservabilityPolicy(slow_query_threshold_ms=0, explain_interval_seconds=0),
+    )
+    map_fingerprint = "DynamicQueryConstructor.build_data_sources_for_map_query"
+    agencies_fingerprint = "DynamicQueryConstructor.create_agencies_projection_query"
+
+    live_database_client.get_data_sources_for_map()
+    live_database_client.get_agencies(projection=True)
+
+    results = live_database_client.execute_raw_sql(
+        """
+        SELECT DISTINCT ON (fingerprint) fingerprint, row_count, query, plan
+        FROM slow_query_log
+        WHERE fingerprint = ANY(%s)
+        ORDER BY fingerprint, created_at DESC
+        """,
+        ([map_fingerprint, agencies_fingerprint],),
+    )
+    assert [result["fingerprint"] for result in results] == [
+        map_fingerprint,
+        agencies_fingerprint,
+    ]
+    for result in results:
+        assert result["query"].lstrip().startswith("SELECT")
+        # Plans are captured with ANALYZE and BUFFERS
+        assert "Execution Time" in result["plan"][0]
+        assert "Shared Hit Blocks" in result["plan"][0]["Plan"]
+
+
+def test_location_index_reloads_after_changes_elsewhere(
+    test_data_creator_db_client: TestDataCreatorDBClient,
+):
+    """
+    Test that the location index is reloaded when locations are changed
+    without this process invalidating it, as when changed by another worker process
+    """
+    tdc = test_data_creator_db_client
+    locality_name = get_test_name()
+    location_id = tdc.locality(locality_name=locality_name)
+    where_mappings = {"locality_name": locality_name, "county_name": "Allegheny"}
+    assert tdc.db_client.get_location_id(where_mappings) == location_id
+
+    tdc.db_client.execute_raw_sql(
+        "UPDATE localities SET name = %s WHERE name = %s",
+        (get_test_name(), locality_name),
+    )
+
+    assert tdc.db_client.get_location_id(where_mappings) is None
+
+
 def test_get_offset():
     # Send a page number to the DatabaseClient method
     # Confirm that the correct offset is returned
@@ -452,6 +509,39 @@ def test_get_data_sources_to_archive(
     results = live_database_client.get_data_sources_to_archive()
     assert len(results) > 0
 
+    # Claimed data sources are leased, so subsequent claims receive disjoint work
+    first_claim = live_database_client.get_data_sources_to_archive(limit=5)
+    second_claim = live_database_client.get_data_sources_to_archive(limit=5)
+    first_ids = {result.id for result in first_claim}
+    second_ids = {result.id for result in second_claim}
+    assert first_ids.isdisjoint(second_ids)
+
+
+def test_archive_next_due_at(
+    test_data_creator_db_client: TestDataCreatorDBClient,
+    live_database_client: DatabaseClient,
+):
+    data_source_id = test_data_creator_db_client.data_source(
+        approval_status=ApprovalStatus.APPROVED, source_url="http://example.com"
+    ).id
+    live_database_client._update_entry_in_table(
+        table_name=Relations.DATA_SOURCES_ARCHIVE_INFO.value,
+        entry_id=data_source_id,
+        id_column_name="data_source_id",
+        column_edit_mappings={
+            "update_frequency": "Monthly",
+            "last_cached": datetime(year=2020, month=1, day=15),
+        },
+    )
+
+    result = live_database_client._select_from_relation(
+        relation_name=Relations.DATA_SOURCES_ARCHIVE_INFO.value,
+        columns=["next_due_at", "lease_expires_at"],
+        where_mappings=[WhereMapping(column="data_source_id", value=data_source_id)],
+    )[0]
+    assert result["next_due_at"] == datetime(year=2020, month=2, day=15)
+    assert result["lease_expires_at"] is None
+
 
 def test_update_last_cached(
     test_data_creator_db_client: TestDataCreatorDBClient,
@@ -1023,6 +1113,73 @@ def test_get_linked_rows(
     assert results["data"][0]["id"] == ds_info.id
 
 
+def test_get_linked_rows_keyset_continuation(
+    test_data_creator_db_client: TestDataCreatorDBClient,
+):
+    tdc = test_data_creator_db_client
+
+    dr_id = tdc.data_request().id
+    ds_ids = []
+    for _ in range(3):
+        ds_id = tdc.data_source().id
+        tdc.link_data_request_to_data_source(
+            data_request_id=dr_id,
+            data_source_id=ds_id,
+        )
+        ds_ids.append(ds_id)
+
+    def get_linked_data_sources(after=None):
+        return tdc.db_client.get_linked_rows(
+            link_table=Relations.LINK_DATA_SOURCES_DATA_REQUESTS,
+            left_id=dr_id,
+            left_link_column="request_id",
+            right_link_column="data_source_id",
+            linked_relation=Relations.DATA_SOURCES,
+            linked_relation_linking_column="id",
+            columns_to_retrieve=["id"],
+            limit=2,
+            after=after,
+        )
+
+    first_page = get_linked_data_sources()
+    assert [result["id"] for result in first_page] == sorted(ds_ids)[:2]
+
+    second_page = get_linked_data_sources(after=first_page[-1]["id"])
+    assert [result["id"] for result in second_page] == sorted(ds_ids)[2:]
+
+
+def test_get_similar_agencies(
+    test_data_creator_db_client: TestDataCreatorDBClient,
+):
+    tdc = test_data_creator_db_client
+    location_id = tdc.locality()
+    agency = tdc.agency(location_id=location_id)
+    similar_agency = tdc.agency(location_id=location_id)
+
+    # Exact matches ignore case and are returned alone
+    results = tdc.db_client.get_similar_agencies(
+        name=agency.submitted_name.lower(), location_id=location_id
+    )
+    assert len(results) == 1
+    assert results[0].id == agency.id
+    assert results[0].similarity == 1
+
+    # Otherwise, the nearest names are returned, most similar first
+    results = tdc.db_client.get_similar_agencies(
+        name=agency.submitted_name + "1", location_id=location_id
+    )
+    assert results[0].id == agency.id
+    assert {result.id for result in results} == {agency.id, similar_agency.id}
+
+    # Agencies below the similarity threshold are excluded
+    results = tdc.db_client.get_similar_agencies(
+        name=agency.submitted_name + "1",
+        location_id=location_id,
+        similarity_threshold=0.8,
+    )
+    assert [result.id for result in results] == [agency.id]
+
+
 def test_get_unarchived_data_requests_with_issues(
     test_data_creator_db_client: TestDataCreatorDBClient, clear_data_requests
 ):
@@ -1091,6 +1248,16 @@ def test_user_followed_searches_logic(
     results = tdc.db_client.get_user_followed_searches(left_id=user_info.id)
     assert len(results["data"]) == 2
 
+    # Followed searches can be retrieved a page at a time, continuing from `next_after`
+    first_page = tdc.db_client.get_user_followed_searches(left_id=user_info.id, limit=1)
+    assert first_page["metadata"]["count"] == 1
+    assert first_page["next_after"] == first_page["data"][0]["location_id"] == 1
+    second_page = tdc.db_client.get_user_followed_searches(
+        left_id=user_info.id, limit=1, after=first_page["next_after"]
+    )
+    assert second_page["data"][0]["location_id"] == 2
+    assert second_page["next_after"] is None
+
     # Unfollow one of the searches
     tdc.db_client.delete_followed_search(id_column_value=link_id)
 
@@ -1325,6 +1492,28 @@ def test_insert_search_record(test_data_creator_db_client: TestDataCreatorDBClie
     )
 
 
+def test_refresh_metrics_snapshot(
+    test_data_creator_db_client: TestDataCreatorDBClient,
+):
+    tdc = test_data_creator_db_client
+    initial_metrics = tdc.db_client.refresh_metrics_snapshot()
+
+    location_id = tdc.locality()
+    agency_id = tdc.agency(location_id=location_id).id
+    tdc.link_data_source_to_agency(tdc.data_source().id, agency_id)
+
+    # Snapshot is not updated until refreshed
+    assert tdc.db_client.get_metrics() == initial_metrics
+
+    metrics = tdc.db_client.refresh_metrics_snapshot()
+    assert metrics["source_count"] == initial_metrics["source_count"] + 1
+    assert metrics["agency_count"] == initial_metrics["agency_count"] + 1
+    assert metrics["state_count"] > 0
+    assert metrics["county_count"] > 0
+    assert metrics["computed_at"] > initial_metrics["computed_at"]
+    assert tdc.db_client.get_metrics() == metrics
+
+
 # TODO: This code currently doesn't work properly because it will repeatedly insert the same test data, throwing off counts
 # def test_search_with_location_and_record_types_test_data(live_database_client, xylonslyvania_test_data):
 #     results = live_database_client.search_with_location_and_record_type(
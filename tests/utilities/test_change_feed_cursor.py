@@ -0,0 +1,19 @@
+import pytest
+
+from database_client.db_client_dataclasses import ChangeFeedCursor
+
+
+def test_change_feed_cursor_round_trip():
+    cursor = ChangeFeedCursor(transaction_id=7431, id=12)
+    assert str(cursor) == "7431-12"
+    assert ChangeFeedCursor.from_string(str(cursor)) == cursor
+    # Ordered by transaction id, then id
+    assert ChangeFeedCursor(transaction_id=7431, id=12) < ChangeFeedCursor(
+        transaction_id=7432, id=3
+    )
+
+
+@pytest.mark.parametrize("s", ["", "12", "a-1", "1-", "-1", "1-2-3"])
+def test_change_feed_cursor_invalid(s: str):
+    with pytest.raises(ValueError):
+        ChangeFeedCursor.from_string(s)
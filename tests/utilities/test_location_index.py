@@ -0,0 +1,100 @@
+import pytest
+
+from database_client.db_client_dataclasses import WhereMapping
+from database_client.location_index import (
+    LocationIndex,
+    LocationIndexUnsupportedQuery,
+)
+from database_client.enums import LocationType
+
+
+def location(id: int, type: str, state: str, county=None, locality=None) -> dict:
+    return {
+        "id": id,
+        "type": type,
+        "state_name": state,
+        "state_iso": state[:2].upper(),
+        "county_name": county,
+        "county_fips": None,
+        "locality_name": locality,
+        "state_id": 1,
+        "county_id": None,
+        "locality_id": None,
+    }
+
+
+@pytest.fixture
+def location_index() -> LocationIndex:
+    index = LocationIndex()
+    index.load(
+        locations=[
+            location(1, "State", "Pennsylvania"),
+            location(2, "County", "Pennsylvania", "Allegheny"),
+            location(3, "Locality", "Pennsylvania", "Allegheny", "Pittsburgh"),
+            location(4, "Locality", "Pennsylvania", "Allegheny", "Bethel Park"),
+        ],
+        dependent_locations=[(1, 2), (1, 3), (2, 3), (1, 4), (2, 4)],
+        version=1,
+    )
+    return index
+
+
+def get_location_id(index: LocationIndex, d: dict):
+    return index.get_location_id(WhereMapping.from_dict(d))
+
+
+def test_get_location_id(location_index):
+    assert not location_index.is_stale
+    assert (
+        get_location_id(
+            location_index,
+            {
+                "state_name": "Pennsylvania",
+                "county_name": "Allegheny",
+                "locality_name": "Pittsburgh",
+            },
+        )
+        == 3
+    )
+    assert (
+        get_location_id(
+            location_index,
+            {"state_name": "Pennsylvania", "county_name": None, "type": "State"},
+        )
+        == 1
+    )
+    assert (
+        get_location_id(
+            location_index,
+            {"type": LocationType.COUNTY, "county_name": "Allegheny"},
+        )
+        == 2
+    )
+    assert get_location_id(location_index, {"locality_name": "Erie"}) is None
+
+    with pytest.raises(RuntimeError):
+        get_location_id(location_index, {"county_name": "Allegheny"})
+    with pytest.raises(LocationIndexUnsupportedQuery):
+        get_location_id(location_index, {"display_name": "Pittsburgh"})
+    with pytest.raises(LocationIndexUnsupportedQuery):
+        get_location_id(location_index, {"id": [3, 4]})
+
+
+def test_dependent_and_parent_location_ids(location_index):
+    assert location_index.get_dependent_location_ids(1) == {2, 3, 4}
+    assert location_index.get_dependent_location_ids(3) == set()
+    assert location_index.get_parent_location_ids(3) == {1, 2}
+    assert location_index.get_location(4)["locality_name"] == "Bethel Park"
+
+
+def test_invalidate(location_index):
+    location_index.invalidate()
+    assert location_index.is_stale
+
+
+def test_is_outdated(location_index):
+    assert not location_index.is_outdated(version=1)
+    # Locations were changed since the index was loaded
+    assert location_index.is_outdated(version=2)
+    location_index.invalidate()
+    assert location_index.is_outdated(version=1)
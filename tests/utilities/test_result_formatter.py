@@ -22,3 +22,34 @@ def test_data_source_to_get_data_sources_output_no_agencies():
     )
 
     assert result["name"] == data_source.name
+
+
+def test_data_source_projection_to_get_data_sources_output():
+    location = {
+        "type": "Locality",
+        "location_id": 1,
+        "state_iso": "PA",
+        "state_name": "Pennsylvania",
+        "county_name": "Allegheny",
+        "county_fips": "42003",
+        "locality_name": "Pittsburgh",
+        "display_name": "Pittsburgh, Allegheny, PA",
+    }
+    row = {
+        "id": 1,
+        "name": "Test Data Source",
+        "data_requests": [],
+        "agencies": [
+            {"id": 1, "name": "Located Agency", "locations": [location]},
+            {"id": 2, "name": "Unlocated Agency", "locations": []},
+        ],
+    }
+
+    result = ResultFormatter.data_source_projection_to_get_data_sources_output(row)
+
+    located_agency, unlocated_agency = result["agencies"]
+    assert located_agency["state_iso"] == "PA"
+    assert located_agency["locality_name"] == "Pittsburgh"
+    assert located_agency["locations"] == [location]
+    assert unlocated_agency["state_iso"] is None
+    assert unlocated_agency["county_fips"] is None
@@ -0,0 +1,75 @@
+from sqlalchemy.dialects import postgresql
+
+from database_client.db_client_dataclasses import WhereMapping
+from database_client.dynamic_query_constructor import DynamicQueryConstructor
+from database_client.subquery_logic import SubqueryParameterManager
+from middleware.enums import Relations
+
+
+def test_create_selection_query_reuses_statement_for_same_shape():
+    first = DynamicQueryConstructor.create_selection_query(
+        relation=Relations.USERS.value,
+        columns=["id", "email"],
+        where_mappings=[WhereMapping(column="email", value="first@example.com")],
+        limit=1,
+    )
+    second = DynamicQueryConstructor.create_selection_query(
+        relation=Relations.USERS.value,
+        columns=["id", "email"],
+        where_mappings=[WhereMapping(column="email", value="second@example.com")],
+        limit=5,
+    )
+
+    assert first.statement is second.statement
+    assert first.parameters == {"where_0": "first@example.com", "limit": 1}
+    assert second.parameters == {"where_0": "second@example.com", "limit": 5}
+
+
+def test_create_selection_query_distinguishes_shapes():
+    base_kwargs = dict(
+        relation=Relations.DATA_REQUESTS_EXPANDED.value,
+        columns=["id", "title"],
+        limit=10,
+    )
+    plain = DynamicQueryConstructor.create_selection_query(**base_kwargs)
+    with_offset = DynamicQueryConstructor.create_selection_query(
+        **base_kwargs, offset=10
+    )
+    with_in_list = DynamicQueryConstructor.create_selection_query(
+        **base_kwargs, where_mappings=[WhereMapping(column="id", value=[1, 2])]
+    )
+    with_subquery = DynamicQueryConstructor.create_selection_query(
+        **base_kwargs,
+        subquery_parameters=[SubqueryParameterManager.data_sources()],
+    )
+
+    statements = [
+        plain.statement,
+        with_offset.statement,
+        with_in_list.statement,
+        with_subquery.statement,
+    ]
+    assert len({id(statement) for statement in statements}) == len(statements)
+
+
+def test_create_selection_query_binds_values():
+    query = DynamicQueryConstructor.create_selection_query(
+        relation=Relations.USERS.value,
+        columns=["id"],
+        where_mappings=[
+            WhereMapping(column="email", value="user@example.com"),
+            WhereMapping(column="id", value=[1, 2, 3]),
+            WhereMapping(column="api_key", value=None, eq=False),
+        ],
+        limit=1,
+    )
+    sql = str(query.statement.compile(dialect=postgresql.dialect()))
+
+    assert "user@example.com" not in sql
+    assert "api_key IS NOT NULL" in sql
+    assert "LIMIT %(limit)s" in sql
+    assert query.parameters == {
+        "where_0": "user@example.com",
+        "where_1": [1, 2, 3],
+        "limit": 1,
+    }
@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy.orm.strategy_options import Load
+
+from database_client.enums import SubqueryLoadStrategy
+from database_client.subquery_logic import SubqueryParameterManager
+from middleware.enums import Relations
+
+
+@pytest.mark.parametrize(
+    "expected_fan_out, expected_strategy",
+    [
+        (0, SubqueryLoadStrategy.JOINED),
+        (1, SubqueryLoadStrategy.JOINED),
+        (2, SubqueryLoadStrategy.SELECTIN),
+        (100, SubqueryLoadStrategy.SELECTIN),
+    ],
+)
+def test_load_strategy_from_expected_fan_out(expected_fan_out, expected_strategy):
+    assert (
+        SubqueryLoadStrategy.from_expected_fan_out(expected_fan_out)
+        == expected_strategy
+    )
+
+
+@pytest.mark.parametrize(
+    "subquery_parameters, expected_strategy",
+    [
+        (SubqueryParameterManager.agencies(), SubqueryLoadStrategy.JOINED),
+        (SubqueryParameterManager.data_requests(), SubqueryLoadStrategy.JOINED),
+        (SubqueryParameterManager.data_sources(), SubqueryLoadStrategy.SELECTIN),
+        (SubqueryParameterManager.locations(), SubqueryLoadStrategy.JOINED),
+    ],
+)
+def test_subquery_parameter_manager_load_strategy(
+    subquery_parameters, expected_strategy
+):
+    # Only relations which opt in by expected fan-out are loaded in a separate query
+    assert subquery_parameters.load_strategy == expected_strategy
+
+
+@pytest.mark.parametrize("load_strategy", list(SubqueryLoadStrategy))
+def test_build_subquery_load_option(load_strategy):
+    subquery_parameters = SubqueryParameterManager.data_sources()
+    subquery_parameters.load_strategy = load_strategy
+
+    load_option = subquery_parameters.build_subquery_load_option(
+        Relations.DATA_REQUESTS_EXPANDED.value
+    )
+
+    assert isinstance(load_option, Load)
+    assert load_option.context[0].strategy == (("lazy", load_strategy.value),)
+    assert subquery_parameters.requires_uniqueness() == (
+        load_strategy == SubqueryLoadStrategy.JOINED
+    )